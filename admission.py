@@ -0,0 +1,114 @@
+"""
+Admission control for the planning API.
+
+Under a traffic spike it is better to turn the excess away quickly than
+to let every request wait in the server's backlog until clients time
+out.  ``AdmissionController`` bounds the number of requests doing plan
+work at once and the number allowed to wait for a slot; anything beyond
+that is rejected immediately so the caller can answer with
+``503 Service Unavailable``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted.
+
+    Attributes:
+        reason: ``"queue_full"`` if the wait queue was full, or
+            ``"timeout"`` if the request waited too long for a slot.
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Request rejected by admission control ({reason})")
+        self.reason = reason
+
+
+class AdmissionController:
+    """Thread-safe concurrency limit with a bounded wait queue.
+
+    Attributes:
+        max_concurrency: Maximum number of admitted requests at once.  A
+            value of 0 disables admission control.
+        max_queue: Maximum number of requests waiting for a slot.
+        queue_timeout: Seconds a queued request waits before giving up.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int = 0, queue_timeout: float = 5.0) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a concurrency limit is enforced."""
+        return self.max_concurrency > 0
+
+    def acquire(self) -> None:
+        """Take a slot, waiting in the queue if necessary.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait timed out.
+        """
+        with self._cond:
+            if not self.enabled or (self.in_flight < self.max_concurrency and self.queue_depth == 0):
+                self.in_flight += 1
+                self.admitted += 1
+                return
+            if self.queue_depth >= self.max_queue:
+                self.rejected += 1
+                raise AdmissionRejected("queue_full")
+            self.queue_depth += 1
+            deadline = time.monotonic() + self.queue_timeout
+            try:
+                while self.in_flight >= self.max_concurrency:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timed_out += 1
+                        raise AdmissionRejected("timeout")
+                    self._cond.wait(remaining)
+            finally:
+                self.queue_depth -= 1
+            self.in_flight += 1
+            self.admitted += 1
+
+    def release(self) -> None:
+        """Return a slot taken by ``acquire``."""
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def admit(self) -> Iterator[None]:
+        """Context manager holding a slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the gauges and counters."""
+        with self._cond:
+            return {
+                "in_flight": self.in_flight,
+                "queue_depth": self.queue_depth,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "queue_timeout": self.queue_timeout,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
@@ -13,43 +13,340 @@ Usage:
 
 The service will listen on the default Flask port (5000) and can be
 interacted with using standard HTTP tools (curl, requests, fetch, etc.).
+
+Payload parsing and plan generation live in ``plan_service.py``, which
+does not depend on Flask; in-process callers can use its
+``plan_from_payload`` directly and get the same results.
 """
 
 from __future__ import annotations
 
+import atexit
+import datetime
 import json
+import threading
+import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
-# Import the planning agent. Ensure that planning_agent.py is in the
-# same directory or installed in your PYTHONPATH.
+# orjson is an optional accelerator for request parsing and response
+# encoding.  Without it the API uses Flask's stdlib-based provider.
 try:
-    from planning_agent import StrategicPlanningAgent
-except ImportError as e:
-    raise ImportError("Unable to import StrategicPlanningAgent from planning_agent.py. "
-                      "Make sure planning_agent.py is available in the same directory.") from e
+    import orjson
+except ImportError:
+    orjson = None
+
+from admission import AdmissionController, AdmissionRejected
+from plan_cache import PlanCache, payload_digest
+from plan_jobs import QUEUED, JobManager, JobQueueFull
+from plan_service import (
+    CATALOGS,
+    PayloadError,
+    build_agent,
+    catalog_content,
+    catalog_reference,
+    catalog_version,
+    evaluate_scenario,
+    parse_sections,
+    parse_simulation,
+    plan_from_payload,
+    resolve_selection,
+    simulate_moves,
+)
+from plan_store import PlanStore
+from scenario_sweep import SweepRunner, parse_ranges
+
+
+# Content types accepted as newline-delimited JSON by ``/generate_plans``.
+NDJSON_MIMETYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+
+def _iter_ndjson(lines: Iterable[bytes], loads: Callable[[bytes], Any] = json.loads) -> Iterator[Any]:
+    """Decode an NDJSON byte stream one line at a time.
+
+    Blank lines are skipped.  A line that is not valid JSON yields the
+    ``ValueError`` instead of raising it, so that the caller can report
+    it against that item and carry on with the rest of the batch.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield loads(line)
+        except ValueError as exc:
+            yield exc
+
+
+# A run of this many digits may be an integer outside orjson's 64-bit
+# range.  Runs are found by mapping every digit to "0" and everything else
+# to a space, which is much cheaper than a regular expression.
+_WIDE_NUMBER = b"0" * 19
+_DIGIT_RUNS = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson when it is installed.
+
+    Used for ``request.get_json()``, ``jsonify`` and every other encoding
+    done through ``app.json``.  Output is semantically identical to the
+    default provider: keys are sorted and compact output stays compact,
+    but non-ASCII text is emitted as UTF-8 rather than ``\\u`` escapes.
+    Calls orjson cannot honour (custom encoder classes, indents other
+    than 2, integers wider than 64 bits, ...) fall back to the stdlib
+    implementation, as does everything when orjson is not installed.
+
+    Parsing falls back the same way for documents orjson would read
+    differently: ``NaN`` and ``Infinity``, which orjson rejects, and
+    numbers of 19 or more digits, which orjson turns into floats once they
+    no longer fit in 64 bits.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        options = dict(kwargs)
+        # Dates go through ``default`` so they keep Flask's HTTP-date format.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if options.pop("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        indent = options.pop("indent", None)
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        options.pop("separators", None)
+        options.pop("ensure_ascii", None)
+        default = options.pop("default", self.default)
+        if indent not in (None, 2) or options:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError; let the stdlib
+            # encoder handle whatever orjson could not.
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        data = s.encode("utf-8") if isinstance(s, str) else s
+        if _WIDE_NUMBER in data.translate(_DIGIT_RUNS):
+            return super().loads(s)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Either invalid JSON, which the stdlib reports with the usual
+            # error, or NaN/Infinity, which only the stdlib accepts.
+            return super().loads(s)
+
+
+class CatalogSplicer:
+    """Encode plan responses, splicing in pre-encoded catalog sections.
+
+    ``recommend_services()`` and ``suggest_kpis()`` return large constant
+    structures that make up most of every response body.  This class
+    encodes them once per process with the application's JSON provider.
+    Each response is then encoded with short placeholder strings in place
+    of the catalogs, and the placeholders are replaced with the
+    pre-encoded text.  The result is byte-for-byte what ``jsonify`` would
+    produce.
+
+    Placeholders embed a random per-process token, so they cannot collide
+    with text supplied by clients.  A section is only spliced when it is
+    equal to the catalog that was encoded, so a catalog that changes at
+    runtime is still encoded correctly (just without the saving).
+    """
+
+    def __init__(self, app: Flask) -> None:
+        self._app = app
+        self._token = uuid.uuid4().hex
+        self._fragments: Optional[Dict[str, Tuple[Any, str, str]]] = None
+        self._lock = threading.Lock()
+
+    def compact_dumps(self, obj: Any) -> str:
+        """Encode ``obj`` with the app's JSON provider and compact separators."""
+        return self._app.json.dumps(obj, separators=(",", ":"))
+
+    def fragments(self) -> Dict[str, Tuple[Any, str, str]]:
+        """Return ``{section: (value, placeholder, encoded JSON)}``, encoding on first use."""
+        if self._fragments is None:
+            with self._lock:
+                if self._fragments is None:
+                    fragments = {}
+                    for section in CATALOGS:
+                        value = catalog_content(section)
+                        placeholder = f"{self._token}:{section}"
+                        fragments[section] = (value, placeholder, self.compact_dumps(value))
+                    self._fragments = fragments
+        return self._fragments
+
+    def encoded(self, section: str) -> str:
+        """Return the pre-encoded JSON text of a catalog section."""
+        return self.fragments()[section][2]
+
+    def encode_section(self, section: str, value: Any) -> str:
+        """Encode a single plan section, using the pre-encoded text for catalogs."""
+        fragment = self.fragments().get(section)
+        if fragment is not None and fragment[0] == value:
+            return fragment[2]
+        return self.compact_dumps(value)
+
+    def dumps(self, result: Dict[str, Any]) -> str:
+        """Encode a response dict compactly, splicing catalog sections of its ``plan``."""
+        plan = result.get("plan")
+        if not isinstance(plan, dict):
+            return self.compact_dumps(result)
+        spliced = []
+        stripped_plan = dict(plan)
+        for section, (value, placeholder, text) in self.fragments().items():
+            if section in plan and plan[section] == value:
+                stripped_plan[section] = placeholder
+                spliced.append((self.compact_dumps(placeholder), text))
+        if not spliced:
+            return self.compact_dumps(result)
+        encoded = self.compact_dumps({**result, "plan": stripped_plan})
+        for placeholder, text in spliced:
+            encoded = encoded.replace(placeholder, text, 1)
+        return encoded
+
+    def response(self, result: Dict[str, Any]) -> Response:
+        """Return the same response ``jsonify(result)`` would."""
+        provider = self._app.json
+        compact = getattr(provider, "compact", None)
+        if (compact is None and self._app.debug) or compact is False:
+            # Pretty-printed output nests the catalogs at a depth-dependent
+            # indentation, so fall back to encoding everything.
+            return jsonify(result)
+        return self._app.response_class(f"{self.dumps(result)}\n", mimetype=provider.mimetype)
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format one Server-Sent Events message.  ``data`` must be a single line."""
+    return f"event: {event}\ndata: {data}\n\n"
+
 
+def _cache_directives(value: Optional[str]) -> set:
+    """Parse a ``Cache-Control`` header into a set of lower-case directives."""
+    if not value:
+        return set()
+    return {part.split("=", 1)[0].strip().lower() for part in value.split(",")}
 
-def create_app() -> Flask:
-    """Factory function to create and configure the Flask application."""
+
+def create_app(config: Optional[Mapping[str, Any]] = None) -> Flask:
+    """Factory function to create and configure the Flask application.
+
+    Settings are read, in increasing order of precedence, from the defaults
+    below, ``FLASK_``-prefixed environment variables (for example
+    ``FLASK_PLAN_CACHE_SIZE=0``) and the optional ``config`` mapping.
+
+    Args:
+        config: Optional configuration overrides.
+    """
     app = Flask(__name__)
+    app.config.update(
+        # Maximum number of cached /generate_plan responses; 0 disables the cache.
+        PLAN_CACHE_SIZE=1024,
+        # Seconds a cached response stays valid.
+        PLAN_CACHE_TTL=300.0,
+        # Cache lifetime (seconds) for /catalog responses requested without
+        # a version.  Versioned requests (``?v=<version>``) are immutable.
+        CATALOG_MAX_AGE=3600,
+        # JSON implementation: "auto" uses orjson when installed, "stdlib"
+        # always uses Flask's default provider.
+        JSON_PROVIDER="auto",
+        # Admission control for plan generation: at most this many requests
+        # generate plans at once (0 disables the limit), up to
+        # PLAN_QUEUE_SIZE more wait at most PLAN_QUEUE_TIMEOUT seconds for a
+        # slot, and the rest are rejected with 503 and Retry-After.
+        PLAN_MAX_CONCURRENCY=8,
+        PLAN_QUEUE_SIZE=16,
+        PLAN_QUEUE_TIMEOUT=5.0,
+        PLAN_RETRY_AFTER=1,
+        # Background jobs (POST /plans/jobs): worker threads, maximum number
+        # of queued plus running jobs, and seconds a finished job's result
+        # is kept.
+        PLAN_JOB_WORKERS=4,
+        PLAN_JOB_QUEUE_SIZE=100,
+        PLAN_JOB_TTL=600.0,
+        # Scenario sweeps (POST /scenario_sweep): worker processes per sweep
+        # (0 evaluates sweeps in the request thread), the largest grid
+        # accepted, and grids small enough to evaluate without a pool.
+        SWEEP_WORKERS=4,
+        SWEEP_MAX_CELLS=1000,
+        SWEEP_INLINE_CELLS=64,
+        # SQLite database keeping every plan generated by /generate_plan for
+        # GET /plans and /plans/<id>; empty disables the store.
+        PLAN_STORE_PATH="",
+    )
+    app.config.from_prefixed_env()
+    if config:
+        app.config.update(config)
+    if app.config["JSON_PROVIDER"] == "auto" and orjson is not None:
+        app.json = FastJSONProvider(app)
     # Enable CORS so that browser-based clients on different domains can
     # access the API without running into cross‑origin restrictions.
     CORS(app)
 
-    # Instantiate the planning agent with placeholder values. The actual
-    # company-specific data (name, mission, vision, core values and baseline
-    # metrics) will be supplied from the JSON payload in each request.
-    agent = StrategicPlanningAgent(
-        company_name="",
-        mission="",
-        vision="",
-        core_values=[],
-        baseline_metrics={},
+    # Responses are cached per worker process, keyed by a content hash of
+    # the request payload.  Clients can bypass the cache by sending
+    # ``Cache-Control: no-cache`` (recompute and refresh the entry) or
+    # ``Cache-Control: no-store`` (recompute and do not store).
+    cache = PlanCache(
+        max_entries=int(app.config["PLAN_CACHE_SIZE"]),
+        ttl=float(app.config["PLAN_CACHE_TTL"]),
+    )
+    app.extensions["plan_cache"] = cache
+    splicer = CatalogSplicer(app)
+    admission = AdmissionController(
+        max_concurrency=int(app.config["PLAN_MAX_CONCURRENCY"]),
+        max_queue=int(app.config["PLAN_QUEUE_SIZE"]),
+        queue_timeout=float(app.config["PLAN_QUEUE_TIMEOUT"]),
+    )
+    app.extensions["plan_admission"] = admission
+
+    jobs = JobManager(
+        plan_from_payload,
+        max_workers=int(app.config["PLAN_JOB_WORKERS"]),
+        max_pending=int(app.config["PLAN_JOB_QUEUE_SIZE"]),
+        result_ttl=float(app.config["PLAN_JOB_TTL"]),
+    )
+    app.extensions["plan_jobs"] = jobs
+    # Let queued and running jobs finish when the worker process exits.
+    atexit.register(jobs.shutdown)
+
+    sweeps = SweepRunner(
+        max_workers=int(app.config["SWEEP_WORKERS"]),
+        max_cells=int(app.config["SWEEP_MAX_CELLS"]),
+        inline_cells=int(app.config["SWEEP_INLINE_CELLS"]),
     )
+    app.extensions["scenario_sweeps"] = sweeps
+
+    store = PlanStore(app.config["PLAN_STORE_PATH"]) if app.config["PLAN_STORE_PATH"] else None
+    app.extensions["plan_store"] = store
+    if store is not None:
+        atexit.register(store.close)
+
+    def overloaded() -> Any:
+        """Build the fast-fail response for a request turned away by admission control."""
+        response = jsonify({"error": "Server is at capacity, please retry later"})
+        response.status_code = 503
+        response.headers["Retry-After"] = str(app.config["PLAN_RETRY_AFTER"])
+        return response
+
+    def stored_plan_id(method: Callable[..., Optional[str]], *args: Any) -> Optional[str]:
+        """Call a ``PlanStore`` method returning a plan id, or ``None`` if it fails.
+
+        A plan that has been generated is still served when the store
+        cannot record it; the response then has no ``X-Plan-Id``.
+        """
+        try:
+            return method(*args)
+        except Exception:
+            app.logger.exception("Plan store %s failed", method.__name__)
+            return None
 
     @app.route("/generate_plan", methods=["POST"])
     def generate_plan() -> Any:
@@ -62,6 +359,9 @@ def create_app() -> Flask:
             "mission": "Our mission is ...",
             "vision": "Our vision is ...",
             "core_values": ["innovation", "integrity", ...],
+            "horizon_years": 3,
+            "periods_per_year": 1,
+            "fiscal_year_start_month": 1,
             "targets": {
                 "year1": {"revenue": 1000000, "customers": 1000, "margin": 0.2},
                 "year2": {...},
@@ -85,94 +385,451 @@ def create_app() -> Flask:
             }
         }
 
-        Returns a JSON response with the plan components.
+        ``horizon_years`` (1 to 10, default 3) sets the planning horizon;
+        ``targets`` may then hold ``year1`` up to ``year<horizon_years>``.
+        Years left out are interpolated from the years that are given.
+        ``periods_per_year`` (1, 2, 4 or 12, default 1) sets the
+        granularity of the ``projections`` plan section, e.g. 12 for
+        monthly projections; at 1 the section is only included when
+        selected with ``sections``.  ``fiscal_year_start_month`` (1 to 12, default
+        1) is the month each plan year starts in; milestones are scheduled
+        from it.
+
+        A ``simulation`` object (``{"draws": 100000, "seed": 7}``, both
+        optional) adds a ``simulation`` key to the response with a Monte
+        Carlo simulation of the winning moves' ``projected_revenue``: the
+        P10/P50/P90 revenue for each year against its revenue target.  A
+        move's ``projected_revenue`` may be a number or an object with
+        ``low``/``base``/``high`` cases or a ``base`` and ``confidence``.
+        ``draws`` times the number of such moves is capped at
+        ``MAX_SIMULATION_SAMPLES``.  Requires NumPy on the server.
+
+        The optional ``sections`` query parameter (or payload key) selects
+        which response sections to compute, e.g.
+        ``?sections=strategic_targets,narrative``.  Valid names are the
+        plan sections plus ``narrative``.  With ``catalogs=reference`` the
+        static ``recommended_kpis`` and ``service_recommendations``
+        sections are replaced by ``{"href": ..., "version": ...}`` links to
+        the cacheable ``/catalog/<name>`` endpoints.
+
+        Returns a JSON response with the plan components.  The
+        ``X-Plan-Cache`` response header reports whether the result came
+        from the cache (``hit``), was generated (``miss``) or the cache was
+        skipped at the client's request (``bypass``).  When the plan store
+        is enabled, the ``X-Plan-Id`` header names the stored plan, which
+        ``/plans/<id>`` serves without regenerating it; ``Cache-Control:
+        no-store`` responses are not stored.  If the store fails, the plan
+        is still returned, without the header.  Cache hits are
+        always served; requests that need plan generation are subject to
+        admission control and fail fast with 503 when the server is full.
         """
         if not request.is_json:
             return jsonify({"error": "Request must be JSON"}), 400
 
         data = request.get_json(force=True)
         try:
-            # Extract required fields with basic validation.
-            company_name: str = data.get("company_name", "Your Company")
-            mission: str = data.get("mission", "")
-            vision: str = data.get("vision", "")
-            core_values: List[str] = data.get("core_values", [])
-
-            # Targets: convert nested dict into separate mappings for revenue,
-            # customers and margins keyed by a relative year index (1, 2, 3).
-            targets_input: Dict[str, Dict[str, Any]] = data.get("targets", {})
-            revenue_targets: Dict[int, Optional[float]] = {}
-            customer_targets: Dict[int, Optional[int]] = {}
-            margin_targets: Dict[int, Optional[float]] = {}
-            for idx, year_key in enumerate(["year1", "year2", "year3"], start=1):
-                year_data = targets_input.get(year_key, {})
-                # Populate each mapping; values may be None if missing.
-                revenue_targets[idx] = year_data.get("revenue")
-                customer_targets[idx] = year_data.get("customers")
-                margin_targets[idx] = year_data.get("margin")
-
-            # Winning moves
-            winning_moves: List[Dict[str, Any]] = data.get("winning_moves", [])
-
-            # SWOT analysis
-            swot = data.get("swot", {})
-            strengths = swot.get("strengths", [])
-            weaknesses = swot.get("weaknesses", [])
-            opportunities = swot.get("opportunities", [])
-            threats = swot.get("threats", [])
-
-            # Update agent attributes with current company data
-            agent.company_name = company_name
-            agent.mission = mission
-            agent.vision = vision
-            agent.core_values = core_values
-            # Use baseline metrics from input if provided, else empty dict
-            baseline_metrics = data.get("baseline_metrics", {})
-            agent.baseline_metrics = baseline_metrics
-
-            # Build the plan using the agent. Supply separate revenue, customer
-            # and margin targets as required by StrategicPlanningAgent.set_targets().
-            agent.set_targets(revenue_targets, customer_targets, margin_targets)
-            if winning_moves:
-                # Extract descriptions and assign them as revenue moves. Leave profit
-                # moves empty; the agent will still capture the high‑level initiatives.
-                move_descriptions = [move.get("description", "") for move in winning_moves]
-                try:
-                    agent.identify_winning_moves(move_descriptions, [])
-                except AttributeError:
-                    # If identify_winning_moves is unavailable, ignore winning moves gracefully.
-                    pass
-            if any([strengths, weaknesses, opportunities, threats]):
-                # Use the correct method name from StrategicPlanningAgent. The
-                # planning_agent module defines ``create_swot`` (not ``add_swot``),
-                # which sets the SWOT analysis on the agent and returns it.
-                try:
-                    agent.create_swot(strengths, weaknesses, opportunities, threats)
-                except AttributeError:
-                    # Fallback for older versions where the method might be named differently;
-                    # ignore if the method is unavailable.
-                    pass
-
-            # Build the strategic plan using the agent's method.  The
-            # StrategicPlanningAgent class defines ``build_plan()`` to
-            # assemble all plan components into a dictionary.  The older
-            # name ``assemble_plan`` does not exist, so call ``build_plan``.
-            plan = agent.build_plan()
-
-            # Generate narrative without passing the plan.  The agent's
-            # ``generate_narrative`` method uses the current state of the
-            # agent to construct the narrative and does not accept a plan
-            # argument.
-            narrative = agent.generate_narrative()
-
-            return jsonify({
-                "plan": plan,
-                "narrative": narrative
-            })
+            sections = parse_sections(request.args.get("sections"))
+            catalogs = request.args.get("catalogs")
+            directives = _cache_directives(request.headers.get("Cache-Control"))
+            bypass = bool(directives & {"no-cache", "no-store"})
+            key = ""
+            if cache.enabled or store is not None:
+                key = payload_digest({"payload": data, "sections": sections, "catalogs": catalogs})
+            result = None if bypass or not cache.enabled else cache.get(key)
+            status = "hit" if result is not None else ("bypass" if bypass else "miss")
+            plan_id = None
+            if result is None:
+                with admission.admit():
+                    result = plan_from_payload(data, sections, catalogs)
+                if "no-store" not in directives:
+                    cache.put(key, result)
+                    if store is not None:
+                        plan_id = stored_plan_id(store.save, data, result, key)
+            elif store is not None:
+                plan_id = stored_plan_id(store.find, key)
+            response = splicer.response(result)
+            response.headers["X-Plan-Cache"] = status
+            if plan_id is not None:
+                response.headers["X-Plan-Id"] = plan_id
+            return response
+        except AdmissionRejected:
+            return overloaded()
+        except PayloadError as exc:
+            return jsonify({"error": str(exc)}), 400
         except Exception as exc:
             # Catch unexpected exceptions and return an error response
             return jsonify({"error": f"Failed to generate plan: {exc}"}), 500
 
+    @app.route("/generate_plans", methods=["POST"])
+    def generate_plans() -> Any:
+        """Endpoint to generate strategic plans for a batch of companies.
+
+        Accepts either a JSON array of ``/generate_plan`` payloads or an
+        NDJSON body (``Content-Type: application/x-ndjson``) with one
+        payload per line.  NDJSON input is read incrementally from the
+        request stream.
+
+        The response is an NDJSON stream with one line per input item, in
+        input order, written as soon as that item has been processed:
+
+            {"index": 0, "plan": {...}, "narrative": "..."}
+            {"index": 1, "error": "Failed to generate plan: ..."}
+
+        A failing item is reported on its own line and does not abort
+        the rest of the batch.  The ``sections`` and ``catalogs`` query
+        parameters apply to every item; see ``/generate_plan``.  A batch
+        holds one admission control slot while it streams.
+        """
+        try:
+            sections = parse_sections(request.args.get("sections"))
+        except PayloadError as exc:
+            return jsonify({"error": str(exc)}), 400
+        catalogs = request.args.get("catalogs")
+        if request.mimetype in NDJSON_MIMETYPES:
+            items: Iterable[Any] = _iter_ndjson(request.stream, app.json.loads)
+        elif request.is_json:
+            items = request.get_json(force=True)
+            if not isinstance(items, list):
+                return jsonify({"error": "Request body must be a JSON array of payloads"}), 400
+        else:
+            return jsonify({"error": "Request must be a JSON array or NDJSON"}), 400
+
+        def generate() -> Iterator[str]:
+            for index, data in enumerate(items):
+                try:
+                    if isinstance(data, ValueError):
+                        raise ValueError(f"Invalid JSON: {data}")
+                    if not isinstance(data, dict):
+                        raise ValueError("Payload must be a JSON object")
+                    line = {"index": index, **plan_from_payload(data, sections, catalogs)}
+                except PayloadError as exc:
+                    line = {"index": index, "error": str(exc)}
+                except Exception as exc:
+                    line = {"index": index, "error": f"Failed to generate plan: {exc}"}
+                yield splicer.dumps(line) + "\n"
+
+        try:
+            admission.acquire()
+        except AdmissionRejected:
+            return overloaded()
+        response = Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+        # The slot is released once the server has finished sending (or the
+        # client has dropped) the streamed body.
+        response.call_on_close(admission.release)
+        return response
+
+    @app.route("/generate_plan/stream", methods=["POST"])
+    def stream_plan() -> Any:
+        """Endpoint streaming a strategic plan as Server-Sent Events.
+
+        Accepts the same payload and query parameters as ``/generate_plan``
+        and responds with ``text/event-stream``.  Each plan section and each
+        narrative paragraph is sent as soon as it has been produced:
+
+            event: section
+            data: {"name": "executive_summary", "value": "..."}
+
+            event: paragraph
+            data: {"name": "intro", "text": "..."}
+
+            event: simulation
+            data: {"draws": 100000, "years": [...], ...}
+
+            event: done
+            data: {}
+
+        Sections come first, in plan order, followed by the narrative
+        paragraphs (intro, targets, moves, swot, execution, closing) and,
+        when the payload asks for a ``simulation``, one ``simulation``
+        event with the same object ``/generate_plan`` returns under that
+        key.  Invalid simulation settings are rejected with 400 before the
+        stream starts.  If generation fails part way, an ``error`` event carrying
+        ``{"error": ...}`` ends the stream.  The stream holds one admission
+        control slot while it is open.
+        """
+        if not request.is_json:
+            return jsonify({"error": "Request must be JSON"}), 400
+        data = request.get_json(force=True)
+        try:
+            if not isinstance(data, dict):
+                raise PayloadError("Payload must be a JSON object")
+            sections = parse_sections(request.args.get("sections"))
+            plan_sections, with_narrative, referenced = resolve_selection(
+                data, sections, request.args.get("catalogs"))
+            agent = build_agent(data)
+            simulate = data.get("simulation") is not None
+            if simulate:
+                parse_simulation(data)
+        except PayloadError as exc:
+            return jsonify({"error": str(exc)}), 400
+        except Exception as exc:
+            return jsonify({"error": f"Failed to generate plan: {exc}"}), 500
+
+        def events() -> Iterator[str]:
+            try:
+                for name, value in agent.iter_plan_sections(plan_sections):
+                    encoded = splicer.encode_section(name, value)
+                    yield _sse_event("section", f'{{"name":{splicer.compact_dumps(name)},"value":{encoded}}}')
+                for name in referenced:
+                    yield _sse_event("section", splicer.dumps({"name": name, "value": catalog_reference(name)}))
+                if with_narrative:
+                    # Reuses the targets section the agent cached above.
+                    for name, text in agent.iter_narrative_paragraphs():
+                        yield _sse_event("paragraph", splicer.dumps({"name": name, "text": text}))
+                if simulate:
+                    yield _sse_event("simulation", splicer.dumps(simulate_moves(data, agent)))
+                yield _sse_event("done", "{}")
+            except Exception as exc:
+                yield _sse_event("error", splicer.dumps({"error": f"Failed to generate plan: {exc}"}))
+
+        try:
+            admission.acquire()
+        except AdmissionRejected:
+            return overloaded()
+        response = Response(stream_with_context(events()), mimetype="text/event-stream")
+        response.headers["Cache-Control"] = "no-cache"
+        # Ask reverse proxies such as nginx not to buffer the stream.
+        response.headers["X-Accel-Buffering"] = "no"
+        response.call_on_close(admission.release)
+        return response
+
+    @app.route("/scenario_sweep", methods=["POST"])
+    def scenario_sweep() -> Any:
+        """Endpoint to evaluate a grid of target scenarios.
+
+        Expects a JSON payload with a base ``/generate_plan`` payload and
+        the range of each assumption to vary:
+
+            {
+                "base": {...},
+                "ranges": {
+                    "revenue_growth": {"start": 0.1, "stop": 0.8, "step": 0.1},
+                    "margin": [0.2, 0.3, 0.4, 0.5]
+                }
+            }
+
+        Growth axes (``revenue_growth``, ``customer_growth``) set each
+        year's target by compounding the matching baseline metric
+        (``annual_revenue``, ``customers``); ``margin`` sets every year's
+        margin.  Every combination is evaluated, on worker processes for
+        large grids.  A growth axis whose baseline metric is missing from
+        the base payload is rejected with 400.
+
+        Returns a table with one row per scenario:
+
+            {"axes": [...], "columns": [...], "rows": [[0.1, 0.2, ...], ...]}
+
+        The columns are the axes followed by the figures of
+        ``evaluate_scenario``.  Sweeps are subject to admission control.
+        """
+        if not request.is_json:
+            return jsonify({"error": "Request must be JSON"}), 400
+        data = request.get_json(force=True)
+        if not isinstance(data, dict) or not isinstance(data.get("base"), dict):
+            return jsonify({"error": "Payload must be an object with a base payload"}), 400
+        try:
+            ranges = parse_ranges(data.get("ranges"))
+            # Reject an invalid base payload once rather than per scenario.
+            build_agent(data["base"])
+            with admission.admit():
+                result = sweeps.run(data["base"], ranges, evaluate_scenario)
+            return jsonify(result)
+        except AdmissionRejected:
+            return overloaded()
+        except ValueError as exc:
+            # Includes ``PayloadError``.
+            return jsonify({"error": str(exc)}), 400
+        except Exception as exc:
+            return jsonify({"error": f"Failed to run sweep: {exc}"}), 500
+
+    @app.route("/plans/jobs", methods=["POST"])
+    def submit_plan_job() -> Any:
+        """Endpoint to generate a plan in the background.
+
+        Accepts the same payload and query parameters as ``/generate_plan``
+        and responds immediately with ``202 Accepted``:
+
+            {"job_id": "...", "status": "queued"}
+
+        The ``Location`` header points at ``/plans/jobs/<job_id>``, which
+        reports the job's status and, once it has succeeded, the same
+        ``{plan, narrative}`` result ``/generate_plan`` would return.
+        Invalid payloads are rejected with 400 before a job is created.
+        Returns 503 if the job backlog is full.
+        """
+        if not request.is_json:
+            return jsonify({"error": "Request must be JSON"}), 400
+        data = request.get_json(force=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Payload must be a JSON object"}), 400
+        catalogs = request.args.get("catalogs")
+        try:
+            # Reject invalid payloads now rather than as failed jobs.
+            sections = parse_sections(request.args.get("sections"))
+            resolve_selection(data, sections, catalogs)
+            build_agent(data)
+            if data.get("simulation") is not None:
+                parse_simulation(data)
+        except PayloadError as exc:
+            return jsonify({"error": str(exc)}), 400
+        try:
+            job = jobs.submit(data, sections, catalogs)
+        except (JobQueueFull, RuntimeError):
+            return overloaded()
+        # The job may already be running; report only what cannot change.
+        response = jsonify({"job_id": job.job_id, "status": QUEUED})
+        response.status_code = 202
+        response.headers["Location"] = f"/plans/jobs/{job.job_id}"
+        return response
+
+    @app.route("/plans/jobs/<job_id>", methods=["GET"])
+    def get_plan_job(job_id: str) -> Any:
+        """Endpoint reporting the status (and result) of a background plan job."""
+        snapshot = jobs.snapshot(job_id)
+        if snapshot is None:
+            return jsonify({"error": "Unknown or expired job"}), 404
+        return jsonify(snapshot)
+
+    def stored_plan_json(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a ``PlanStore`` record to its JSON form, with ISO 8601 times."""
+        created_at = datetime.datetime.fromtimestamp(record["created_at"], datetime.timezone.utc)
+        return {**record, "created_at": created_at.isoformat(), "href": f"/plans/{record['id']}"}
+
+    @app.route("/plans", methods=["GET"])
+    def list_plans() -> Any:
+        """Endpoint listing stored plans, newest first.
+
+        Optional query parameters filter the listing: ``company_name``,
+        ``payload_hash`` (as reported for stored plans), and ``since`` and
+        ``until`` as ISO 8601 times.  ``limit`` (default 50, at most 500)
+        sets the page size; pass the returned ``next`` cursor as
+        ``before`` to fetch the following page:
+
+            {"plans": [{"id": "...", "company_name": "...", "created_at": "...",
+                        "payload_hash": "...", "href": "/plans/..."}, ...],
+             "next": "..."}
+
+        Requires ``PLAN_STORE_PATH`` to be set.
+        """
+        if store is None:
+            return jsonify({"error": "Plan store is disabled"}), 404
+        args = request.args
+        try:
+            times = {}
+            for name in ("since", "until"):
+                if name in args:
+                    moment = datetime.datetime.fromisoformat(args[name])
+                    if moment.tzinfo is None:
+                        moment = moment.replace(tzinfo=datetime.timezone.utc)
+                    times[name] = moment.timestamp()
+            plans, cursor = store.list(
+                company_name=args.get("company_name"),
+                payload_hash=args.get("payload_hash"),
+                before=args.get("before"),
+                limit=args.get("limit", 50, type=int),
+                **times,
+            )
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        return jsonify({"plans": [stored_plan_json(plan) for plan in plans], "next": cursor})
+
+    @app.route("/plans/search", methods=["GET"])
+    def search_plans() -> Any:
+        """Endpoint searching the text of stored plans, best matches first.
+
+        ``q`` is a full-text query over each plan's company name,
+        narrative, SWOT items and winning move descriptions, e.g.
+        ``"supply chain" OR europe``: quote phrases, end a word with ``*``
+        to match it as a prefix (``europ*``), and combine terms with ``AND``,
+        ``OR`` and ``NOT``.  ``fields`` (comma-separated, from
+        ``company_name``, ``narrative``, ``swot`` and ``moves``) restricts
+        the fields matched, and ``company_name`` the company.  ``limit``
+        (default 20, at most 100) sets the page size; pass the returned
+        ``next`` as ``offset`` to fetch the following page:
+
+            {"plans": [{"id": "...", "company_name": "...", "created_at": "...",
+                        "payload_hash": "...", "score": 4.2, "href": "/plans/..."}, ...],
+             "next": 20}
+
+        Requires ``PLAN_STORE_PATH`` to be set, and SQLite with FTS5.
+        """
+        if store is None:
+            return jsonify({"error": "Plan store is disabled"}), 404
+        if not store.searchable:
+            return jsonify({"error": "Plan search is unavailable"}), 501
+        args = request.args
+        fields = args.get("fields")
+        try:
+            plans, next_offset = store.search(
+                args.get("q", ""),
+                fields=[field.strip() for field in fields.split(",") if field.strip()] if fields else None,
+                company_name=args.get("company_name"),
+                offset=args.get("offset", 0, type=int),
+                limit=args.get("limit", 20, type=int),
+            )
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        return jsonify({"plans": [stored_plan_json(plan) for plan in plans], "next": next_offset})
+
+    @app.route("/plans/<plan_id>", methods=["GET"])
+    def get_plan(plan_id: str) -> Any:
+        """Endpoint returning a stored plan without regenerating it.
+
+        The ``X-Plan-Id`` header of a ``/generate_plan`` response names
+        the stored plan.  The response holds the plan's summary fields (see
+        ``/plans``), the ``payload`` it was generated from and its
+        ``result``: the ``{plan, narrative}`` object ``/generate_plan``
+        returned.  Stored plans never change, so responses carry a strong
+        ``ETag``.
+        """
+        if store is None:
+            return jsonify({"error": "Plan store is disabled"}), 404
+        record = store.get(plan_id)
+        if record is None:
+            return jsonify({"error": "Unknown plan"}), 404
+        response = jsonify(stored_plan_json(record))
+        response.set_etag(plan_id)
+        return response.make_conditional(request)
+
+    @app.route("/catalog", methods=["GET"])
+    def catalog_index() -> Any:
+        """Endpoint listing the static catalogs with their current versions."""
+        return jsonify({CATALOGS[section][0]: catalog_reference(section) for section in CATALOGS})
+
+    @app.route("/catalog/<name>", methods=["GET"])
+    def catalog(name: str) -> Any:
+        """Endpoint serving a static catalog (``kpis`` or ``services``).
+
+        Responses carry a strong ``ETag`` derived from the catalog content
+        and honour ``If-None-Match`` with ``304 Not Modified``.  Requests
+        that name the current version (``?v=<version>``, as in the links
+        returned by ``/generate_plan?catalogs=reference``) are cacheable
+        forever; unversioned requests for ``CATALOG_MAX_AGE`` seconds.
+        """
+        section = next((key for key, (route, _) in CATALOGS.items() if route == name), None)
+        if section is None:
+            return jsonify({"error": f"Unknown catalog: {name}"}), 404
+        version = catalog_version(section)
+        response = app.response_class(f"{splicer.encoded(section)}\n", mimetype=app.json.mimetype)
+        response.set_etag(version)
+        response.cache_control.public = True
+        if request.args.get("v") == version:
+            response.cache_control.max_age = 365 * 24 * 3600
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.max_age = int(app.config["CATALOG_MAX_AGE"])
+        return response.make_conditional(request)
+
+    @app.route("/stats", methods=["GET"])
+    def stats() -> Any:
+        """Endpoint reporting in-process counters for this worker."""
+        return jsonify({
+            "plan_cache": cache.stats(),
+            "admission": admission.stats(),
+            "plan_jobs": jobs.stats(),
+            "plan_store": store.stats() if store is not None else None,
+        })
+
     return app
 
 # Create the Flask application at module level. This allows
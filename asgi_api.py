@@ -0,0 +1,191 @@
+"""
+ASGI (asyncio) variant of the strategic planning API.
+
+This module exposes the same ``/generate_plan`` contract as the Flask
+application in ``agent_api.py``, but as a plain ASGI application with no
+web framework dependency.  Socket I/O (reading the request body and
+writing the response) happens on the event loop, so a slow client only
+costs a coroutine rather than a whole worker thread.  The CPU-bound
+``StrategicPlanningAgent`` work runs on a thread pool executor.
+
+Usage:
+
+    uvicorn asgi_api:app --host 0.0.0.0 --port 5000
+
+Any ASGI server (uvicorn, hypercorn, gunicorn with a uvicorn worker) can
+serve the module-level ``app``.  Because the application is a plain ASGI
+callable it can also be exercised in-process, for example with
+``httpx.AsyncClient(transport=httpx.ASGITransport(app=app))``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+# orjson is optional, as in ``agent_api``; see ``_encode``.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from plan_service import PayloadError, parse_sections, plan_from_payload
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Headers sent with every response.  These mirror the permissive defaults
+# of ``flask_cors.CORS(app)`` used by the Flask application.
+_CORS_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"access-control-allow-origin", b"*"),
+]
+
+
+def _is_json(content_type: str) -> bool:
+    """Return whether a content type is JSON, following Flask's ``is_json``."""
+    mimetype = content_type.split(";", 1)[0].strip().lower()
+    return mimetype == "application/json" or (
+        mimetype.startswith("application/") and mimetype.endswith("+json")
+    )
+
+
+def _encode(payload: Any) -> bytes:
+    """Encode a response body the way the Flask app's ``jsonify`` does in production.
+
+    Like ``agent_api.FastJSONProvider``, this uses orjson when it is
+    installed, which writes non-ASCII text as UTF-8, and otherwise falls
+    back to the stdlib encoder with Flask's defaults, which writes
+    ``\\u`` escapes.  Either way both apps send the same bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        except TypeError:
+            pass
+    return (json.dumps(payload, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """Read the full HTTP request body from the ASGI ``receive`` channel."""
+    chunks: List[bytes] = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _send_json(send: Send, status: int, payload: Any) -> None:
+    """Send a complete JSON response."""
+    body = _encode(payload)
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+            *_CORS_HEADERS,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def create_asgi_app(executor: Optional[Executor] = None, max_workers: Optional[int] = None) -> ASGIApp:
+    """Factory function to create the ASGI application.
+
+    Args:
+        executor: Executor used to run plan generation.  If omitted, a
+            ``ThreadPoolExecutor`` is created and shut down on the ASGI
+            lifespan shutdown event.
+        max_workers: Worker count for the default executor.  Ignored if
+            ``executor`` is given.
+
+    Returns:
+        An ASGI application callable.
+    """
+    owns_executor = executor is None
+    pool: Executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plan")
+
+    async def generate_plan(scope: Scope, receive: Receive, send: Send, headers: Dict[bytes, bytes]) -> None:
+        """Handle ``POST /generate_plan``; see ``agent_api.create_app``."""
+        if not _is_json(headers.get(b"content-type", b"").decode("latin-1")):
+            await _send_json(send, 400, {"error": "Request must be JSON"})
+            return
+        body = await _read_body(receive)
+        try:
+            data = json.loads(body)
+        except ValueError as exc:
+            await _send_json(send, 400, {"error": f"Invalid JSON: {exc}"})
+            return
+        try:
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            sections = parse_sections(query["sections"][-1] if "sections" in query else None)
+            catalogs = query["catalogs"][-1] if "catalogs" in query else None
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(pool, plan_from_payload, data, sections, catalogs)
+        except PayloadError as exc:
+            await _send_json(send, 400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            # Catch unexpected exceptions and return an error response
+            await _send_json(send, 500, {"error": f"Failed to generate plan: {exc}"})
+            return
+        await _send_json(send, 200, result)
+
+    async def lifespan(receive: Receive, send: Send) -> None:
+        """Handle the ASGI lifespan protocol."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if owns_executor:
+                    pool.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        headers = {name.lower(): value for name, value in scope.get("headers", [])}
+        if scope["path"] != "/generate_plan":
+            await _send_json(send, 404, {"error": "Not found"})
+        elif scope["method"] == "OPTIONS":
+            # CORS preflight, answered the same way flask_cors does by default.
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    *_CORS_HEADERS,
+                    (b"access-control-allow-methods", b"OPTIONS, POST"),
+                    (b"access-control-allow-headers",
+                     headers.get(b"access-control-request-headers", b"*")),
+                    (b"content-length", b"0"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+        elif scope["method"] != "POST":
+            await _send_json(send, 405, {"error": "Method not allowed"})
+        else:
+            await generate_plan(scope, receive, send, headers)
+
+    return app
+
+
+# Create the ASGI application at module level so that servers can import
+# it directly (e.g. ``uvicorn asgi_api:app``).
+app = create_asgi_app()
@@ -0,0 +1,78 @@
+"""
+Memory-per-agent benchmark for ``StrategicPlanningAgent``.
+
+Builds a portfolio of agents, each with three years of revenue, customer
+and margin targets plus one extra metric, and reports the memory each
+agent holds, measured with ``tracemalloc``:
+
+- after construction with its targets set, and
+- after ``build_plan_and_narrative()``, which fills the agent's section
+  and paragraph caches.
+
+Usage:
+
+    python benchmarks/agent_memory.py
+    python benchmarks/agent_memory.py --agents 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from planning_agent import StrategicPlanningAgent  # noqa: E402
+
+START_YEAR = 2025
+
+
+def make_agent(index: int) -> StrategicPlanningAgent:
+    """Return agent ``index`` of the portfolio, with its targets set."""
+    years = range(START_YEAR, START_YEAR + 3)
+    return StrategicPlanningAgent(
+        company_name=f"Company {index}",
+        mission="make building widgets easy",
+        vision="world-class widgets",
+        core_values=["Integrity", "Innovation", "Customer focus"],
+        baseline_metrics={"annual_revenue": 1_000_000 + index, "customers": 100, "gross_margin": 0.3},
+        revenue_targets={year: 2_000_000 * (i + 1) + index for i, year in enumerate(years)},
+        customer_targets={year: 200 * (i + 1) for i, year in enumerate(years)},
+        margin_targets={year: 0.3 + 0.02 * i for i, year in enumerate(years)},
+        other_targets={"net_profit": {year: 100_000.0 * (i + 1) for i, year in enumerate(years)}},
+        start_year=START_YEAR,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the memory held per StrategicPlanningAgent.")
+    parser.add_argument("--agents", type=int, default=20_000, help="number of agents (default: 20000)")
+    args = parser.parse_args(argv)
+
+    # Warm up shared state (compiled templates, memoized schedules) so
+    # that it is not charged to the agents.
+    make_agent(-1).build_plan_and_narrative()
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    agents = [make_agent(index) for index in range(args.agents)]
+    gc.collect()
+    with_targets = tracemalloc.get_traced_memory()[0] - baseline
+    for agent in agents:
+        agent.build_plan_and_narrative()
+    gc.collect()
+    built = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    print(f"agents: {len(agents)}")
+    print(f"with targets set:                  {with_targets / len(agents):8.0f} B/agent")
+    print(f"after build_plan_and_narrative():  {built / len(agents):8.0f} B/agent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
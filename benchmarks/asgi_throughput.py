@@ -0,0 +1,132 @@
+"""
+Throughput benchmark: the Flask app under gunicorn vs the ASGI app under uvicorn.
+
+Starts each server as a single process on a local port and sends it
+``--requests`` distinct ``/generate_plan`` payloads from ``--clients``
+concurrent connections, then reports requests per second.  With
+``--stall`` every client sends the first half of its request body,
+waits that many seconds and then sends the rest, the way a slow mobile
+client would; this is where the event loop of the ASGI app pays off.
+
+Needs gunicorn and uvicorn installed; the client uses only asyncio.
+
+Usage:
+
+    python benchmarks/asgi_throughput.py
+    python benchmarks/asgi_throughput.py --stall 0.5 --clients 256
+    python benchmarks/asgi_throughput.py --server asgi --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = ("flask", "asgi")
+
+
+def server_command(server: str, port: int, threads: int) -> List[str]:
+    """Return the command serving ``server`` on ``port`` in one process."""
+    if server == "flask":
+        return [sys.executable, "-m", "gunicorn", "agent_api:app", "--worker-class", "gthread",
+                "--workers", "1", "--threads", str(threads), "--bind", f"127.0.0.1:{port}",
+                "--log-level", "warning"]
+    return [sys.executable, "-m", "uvicorn", "asgi_api:app", "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning", "--no-access-log"]
+
+
+def wait_for_port(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def request_bytes(index: int, port: int) -> bytes:
+    payload = {
+        "company_name": f"Company {index}",
+        "mission": "make building widgets easy",
+        "vision": "world-class widgets",
+        "core_values": ["Integrity", "Innovation"],
+        "targets": {f"year{year}": {"revenue": 1_000_000 * year + index, "customers": 100 * year, "margin": 0.3}
+                    for year in (1, 2, 3)},
+    }
+    body = json.dumps(payload).encode("utf-8")
+    head = (f"POST /generate_plan HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n").encode("ascii")
+    return head + body
+
+
+async def send_one(index: int, port: int, stall: float) -> bool:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = request_bytes(index, port)
+    if stall:
+        half = len(data) // 2
+        writer.write(data[:half])
+        await writer.drain()
+        await asyncio.sleep(stall)
+        data = data[half:]
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response.startswith(b"HTTP/1.1 200")
+
+
+async def run_clients(port: int, requests: int, clients: int, stall: float) -> int:
+    """Send every request, ``clients`` at a time; return the number that failed."""
+    semaphore = asyncio.Semaphore(clients)
+
+    async def limited(index: int) -> bool:
+        async with semaphore:
+            try:
+                return await send_one(index, port, stall)
+            except OSError:
+                return False
+
+    results = await asyncio.gather(*(limited(index) for index in range(requests)))
+    return results.count(False)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare Flask and ASGI /generate_plan throughput.")
+    parser.add_argument("--server", choices=(*SERVERS, "both"), default="both")
+    parser.add_argument("--requests", type=int, default=2560, help="requests per server (default: 2560)")
+    parser.add_argument("--clients", type=int, default=256, help="concurrent connections (default: 256)")
+    parser.add_argument("--stall", type=float, default=0.0,
+                        help="seconds each client waits halfway through its body (default: 0)")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn worker threads (default: 8)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    for server in SERVERS if args.server == "both" else (args.server,):
+        env = {**os.environ, "FLASK_PLAN_CACHE_SIZE": "0", "FLASK_PLAN_MAX_CONCURRENCY": "0"}
+        process = subprocess.Popen(server_command(server, args.port, args.threads), cwd=ROOT, env=env)
+        try:
+            wait_for_port(args.port)
+            started = time.perf_counter()
+            failed = asyncio.run(run_clients(args.port, args.requests, args.clients, args.stall))
+            elapsed = time.perf_counter() - started
+        finally:
+            process.terminate()
+            process.wait()
+        print(f"{server:5}  {args.requests / elapsed:7.0f} req/s  ({args.requests} requests, "
+              f"{args.clients} clients, stall {args.stall}s, {failed} failed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+JSON provider benchmark for the planning API.
+
+Generates a ``/generate_plan`` response for a demo company and reports,
+for Flask's default stdlib-based provider and for ``FastJSONProvider``:
+
+- encoding the response, as ``jsonify`` does, and
+- decoding the request payload, as ``request.get_json()`` does,
+
+as the time per call (best of ``--repeat`` runs).  ``FastJSONProvider``
+is only faster when orjson is installed; without it both rows measure
+the stdlib.
+
+Usage:
+
+    python benchmarks/json_provider.py
+    python benchmarks/json_provider.py --calls 20000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+from agent_api import FastJSONProvider, create_app, orjson  # noqa: E402
+from plan_service import plan_from_payload  # noqa: E402
+
+PAYLOAD = {
+    "company_name": "DemoCo",
+    "mission": "simplify home automation for everyday consumers",
+    "vision": "make smart homes accessible worldwide",
+    "core_values": ["Innovation", "Reliability", "Customer focus"],
+    "baseline_metrics": {"annual_revenue": 1_000_000, "customers": 100, "gross_margin": 0.25},
+    "targets": {f"year{year}": {"revenue": 1_000_000 * (year + 1), "customers": 100 * (year + 1),
+                                "margin": 0.25 + 0.05 * year, "net_profit": 200_000 * year}
+                for year in (1, 2, 3)},
+    "winning_moves": [{"description": "Launch subscription services", "type": "revenue"},
+                      {"description": "Automate support with AI", "type": "profit"}],
+    "swot": {
+        "strengths": ["Proprietary technology", "Strong customer service"],
+        "weaknesses": ["Limited brand recognition", "Small marketing budget"],
+        "opportunities": ["Growing smart home market", "Partnerships with telecom providers"],
+        "threats": ["Entrenched competitors", "Supply chain disruptions"],
+    },
+}
+
+
+def best_time(call: Callable[[], Any], calls: int, repeat: int) -> float:
+    """Return the best time per call, in seconds, of ``call``."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            call()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the stdlib and orjson JSON providers.")
+    parser.add_argument("--calls", type=int, default=5000, help="calls per run (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs; the best is reported (default: 5)")
+    args = parser.parse_args(argv)
+
+    app = create_app({"JSON_PROVIDER": "stdlib"})
+    response = plan_from_payload(PAYLOAD)
+    request_body = json.dumps(PAYLOAD).encode("utf-8")
+    print(f"response {len(json.dumps(response))} bytes, request {len(request_body)} bytes, "
+          f"orjson {'installed' if orjson is not None else 'not installed'}")
+    for label, provider in (("stdlib", DefaultJSONProvider(app)), ("FastJSONProvider", FastJSONProvider(app))):
+        encode = best_time(lambda: provider.dumps(response), args.calls, args.repeat)
+        decode = best_time(lambda: provider.loads(request_body), args.calls, args.repeat)
+        print(f"{label:16}  encode {encode * 1e6:7.1f} us/call  decode {decode * 1e6:7.1f} us/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
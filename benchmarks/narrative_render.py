@@ -0,0 +1,167 @@
+"""
+Narrative rendering benchmark for ``StrategicPlanningAgent``.
+
+Builds a portfolio of agents, each with three years of revenue, customer
+and margin targets plus one extra metric, a SWOT analysis and winning
+moves, builds each agent's targets section once and then reports the
+time per agent (best of ``--repeat`` runs) of:
+
+- ``generate_narrative()`` with the agent's paragraph cache emptied
+  before every call, so each paragraph is rendered again, and
+- ``render_narratives()``, which renders whole narratives without the
+  paragraph cache.
+
+Both are timed with the compiled ``DEFAULT_TEMPLATES`` and with the same
+templates rendered by ``format_template``, a plain ``str.format``
+implementation of ``compile_template``.  The script also runs on trees
+from before ``narrative_templates``, where only the hand-written
+paragraphs are timed, so the numbers can be compared across the change.
+
+Usage:
+
+    python benchmarks/narrative_render.py
+    python benchmarks/narrative_render.py --agents 50000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from string import Formatter
+from typing import Any, Callable, List, Mapping, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import planning_agent  # noqa: E402
+from planning_agent import StrategicPlanningAgent  # noqa: E402
+
+try:
+    import narrative_templates
+except ImportError:
+    narrative_templates = None
+
+START_YEAR = 2025
+
+
+def format_template(text: str, filters: Mapping[str, Callable[[Any], str]], missing: str,
+                    arguments: Sequence[str] = ()) -> Callable[..., str]:
+    """Drop-in ``compile_template`` that renders with a plain ``str.format``."""
+    pieces: List[str] = []
+    fields = []
+    for literal, field_name, _, _ in Formatter().parse(text):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        name, _, filter_name = field_name.partition("|")
+        index = arguments.index(name) if name in arguments else -1
+        fields.append((name, index, filters[filter_name] if filter_name else None))
+        pieces.append(f"{{{len(fields) - 1}}}")
+    template = "".join(pieces)
+
+    def render(context: Mapping[str, Any], *args: Any) -> str:
+        values = []
+        for name, index, function in fields:
+            value = context.get(name) if index < 0 else args[index]
+            if value is None:
+                value = missing
+            elif function is not None:
+                value = function(value)
+            values.append(value)
+        return template.format(*values)
+
+    return render
+
+
+def format_templates() -> Any:
+    """Return ``DEFAULT_TEMPLATES`` built with ``format_template``."""
+    default = narrative_templates.DEFAULT_TEMPLATES
+    compile_template = narrative_templates.compile_template
+    narrative_templates.compile_template = format_template
+    try:
+        templates = default.replace()
+        # Compile the whole-narrative renderer while the patch is in place.
+        templates.narrative_renderer(planning_agent.NARRATIVE_PARAGRAPHS)
+    finally:
+        narrative_templates.compile_template = compile_template
+    return templates
+
+
+def make_agent(index: int) -> StrategicPlanningAgent:
+    """Return agent ``index`` of the portfolio, with its plan inputs set."""
+    years = range(START_YEAR, START_YEAR + 3)
+    agent = StrategicPlanningAgent(
+        company_name=f"Company {index}",
+        mission="make building widgets easy",
+        vision="world-class widgets",
+        core_values=["Integrity", "Innovation"],
+        baseline_metrics={"annual_revenue": 1_000_000, "customers": 100, "gross_margin": 0.25},
+    )
+    agent.set_targets(
+        revenue_targets={year: 1_000_000 * (year - START_YEAR + 2) + index for year in years},
+        customer_targets={year: 100 * (year - START_YEAR + 2) for year in years},
+        margin_targets={year: 0.3 + 0.02 * (year - START_YEAR) for year in years},
+        other_targets={"net_profit": {year: 100_000 * (year - START_YEAR + 1) for year in years}},
+    )
+    agent.identify_winning_moves(["Launch a subscription", "Expand to Europe"], ["Automate support"])
+    agent.create_swot(["Strong brand"], ["Small team"], ["Growing demand"], ["New competitors"])
+    return agent
+
+
+def generate(agents: List[StrategicPlanningAgent]) -> None:
+    for agent in agents:
+        agent._paragraphs = None
+        agent.generate_narrative()
+
+
+def render_batch(agents: List[StrategicPlanningAgent]) -> None:
+    for _ in planning_agent.render_narratives(agents):
+        pass
+
+
+def best_time(path: Callable[[List[StrategicPlanningAgent]], None],
+              agents: List[StrategicPlanningAgent], repeat: int) -> float:
+    """Return the best time per agent, in seconds, of ``path`` over ``agents``."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path(agents)
+        best = min(best, (time.perf_counter() - started) / len(agents))
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time narrative rendering across a portfolio of agents.")
+    parser.add_argument("--agents", type=int, default=20000, help="agents in the portfolio (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs; the best is reported (default: 5)")
+    args = parser.parse_args(argv)
+
+    agents = [make_agent(index) for index in range(args.agents)]
+    for agent in agents:
+        agent.generate_narrative()
+    if narrative_templates is None:
+        print(f"{'generate_narrative(), paragraphs uncached':42} "
+              f"{best_time(generate, agents, args.repeat) * 1e6:6.2f} us/agent  (hand-written paragraphs)")
+        return 0
+
+    template_sets = (("compiled", narrative_templates.DEFAULT_TEMPLATES), ("str.format", format_templates()))
+    sample = agents[:100]
+    expected = list(planning_agent.render_narratives(sample))
+    for agent in sample:
+        agent.narrative_templates = template_sets[1][1]
+    if list(planning_agent.render_narratives(sample)) != expected:
+        raise SystemExit("str.format templates render a different narrative")
+    for label, path in (("generate_narrative(), paragraphs uncached", generate),
+                        ("render_narratives()", render_batch)):
+        for name, templates in template_sets:
+            for agent in agents:
+                agent.narrative_templates = templates
+            print(f"{label:42} {best_time(path, agents, args.repeat) * 1e6:6.2f} us/agent  ({name})")
+    for agent in agents:
+        agent.narrative_templates = narrative_templates.DEFAULT_TEMPLATES
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Plan-and-narrative build benchmark for ``StrategicPlanningAgent``.
+
+Each ``/generate_plan`` request builds a fresh agent and then both the
+plan and the narrative.  This compares, on fresh agents:
+
+- ``build_plan()`` followed by ``generate_narrative()``, and
+- ``build_plan_and_narrative()``, which the API uses,
+
+reporting the time per call (best of ``--repeat`` runs, with the cost of
+constructing the agent subtracted) and how many times each path builds
+every plan section.
+
+Usage:
+
+    python benchmarks/plan_build.py
+    python benchmarks/plan_build.py --calls 20000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import planning_agent  # noqa: E402
+from planning_agent import StrategicPlanningAgent  # noqa: E402
+
+# Older trees have no per-section builders; section builds are then not
+# counted, so the timings can still be compared.
+PLAN_SECTIONS = tuple(
+    name for name in getattr(planning_agent, "PLAN_SECTIONS", ())
+    if hasattr(StrategicPlanningAgent, f"_section_{name}")
+)
+
+START_YEAR = 2025
+
+
+def make_agent() -> StrategicPlanningAgent:
+    """Return the demo agent of ``planning_agent``, with targets, moves and SWOT.
+
+    The agent's plan starts in ``START_YEAR``, the first year of its targets.
+    """
+    agent = StrategicPlanningAgent(
+        company_name="DemoCo",
+        mission="simplify home automation for everyday consumers",
+        vision="make smart homes accessible worldwide",
+        core_values=["Innovation", "Reliability", "Customer focus"],
+        baseline_metrics={"annual_revenue": 1_000_000, "customers": 100, "gross_margin": 0.25},
+    )
+    years = range(START_YEAR, START_YEAR + 3)
+    agent.set_targets(
+        revenue_targets=dict(zip(years, (2_000_000, 3_500_000, 5_000_000))),
+        customer_targets=dict(zip(years, (250, 400, 600))),
+        margin_targets=dict(zip(years, (0.30, 0.35, 0.40))),
+        other_targets={"net_profit": dict(zip(years, (200_000, 500_000, 1_000_000)))},
+    )
+    agent.identify_winning_moves(
+        revenue_moves=["Launch subscription services", "Expand to Europe"],
+        profit_moves=["Automate support with AI", "Negotiate supplier contracts"],
+    )
+    agent.create_swot(
+        strengths=["Proprietary technology", "Strong customer service"],
+        weaknesses=["Limited brand recognition", "Small marketing budget"],
+        opportunities=["Growing smart home market", "Partnerships with telecom providers"],
+        threats=["Entrenched competitors", "Supply chain disruptions"],
+    )
+    return agent
+
+
+def separate(agent: StrategicPlanningAgent) -> None:
+    agent.build_plan()
+    agent.generate_narrative()
+
+
+def combined(agent: StrategicPlanningAgent) -> None:
+    agent.build_plan_and_narrative()
+
+
+def construct_only(agent: StrategicPlanningAgent) -> None:
+    pass
+
+
+def best_time(path: Callable[[StrategicPlanningAgent], None], calls: int, repeat: int) -> float:
+    """Return the best time per call, in seconds, of ``path`` on fresh agents."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(calls):
+            path(make_agent())
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+def count_builds(path: Callable[[StrategicPlanningAgent], None]) -> Dict[str, int]:
+    """Return how many times ``path`` builds each plan section on a fresh agent."""
+    counts = dict.fromkeys(PLAN_SECTIONS, 0)
+    originals = {name: getattr(StrategicPlanningAgent, f"_section_{name}") for name in PLAN_SECTIONS}
+
+    def counting(name: str) -> Callable[..., object]:
+        def build(self: StrategicPlanningAgent) -> object:
+            counts[name] += 1
+            return originals[name](self)
+        return build
+
+    try:
+        for name in PLAN_SECTIONS:
+            setattr(StrategicPlanningAgent, f"_section_{name}", counting(name))
+        path(make_agent())
+    finally:
+        for name, original in originals.items():
+            setattr(StrategicPlanningAgent, f"_section_{name}", original)
+    return {name: count for name, count in counts.items() if count}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare building a plan and narrative separately and together.")
+    parser.add_argument("--calls", type=int, default=5000, help="calls per run (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs; the best is reported (default: 5)")
+    args = parser.parse_args(argv)
+
+    construct = best_time(construct_only, args.calls, args.repeat)
+    for label, path in (("build_plan() + generate_narrative()", separate),
+                        ("build_plan_and_narrative()", combined)):
+        if path is combined and not hasattr(StrategicPlanningAgent, "build_plan_and_narrative"):
+            print(f"{label:38} not available in this tree")
+            continue
+        per_call = best_time(path, args.calls, args.repeat) - construct
+        builds = ", ".join(f"{name}={count}" for name, count in count_builds(path).items())
+        print(f"{label:38} {per_call * 1e6:7.1f} us/call" + (f"  builds: {builds}" if builds else ""))
+    print(f"{'(agent construction, subtracted)':38} {construct * 1e6:7.1f} us/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Precompiled templates for the strategic narrative.
+
+Each paragraph of ``StrategicPlanningAgent.generate_narrative()`` is
+rendered from a template such as::
+
+    "{company_name} exists to {mission}."
+
+Templates are compiled once, when a ``NarrativeTemplates`` set is
+created, into plain Python functions that look up each field and join the
+literal text and the values in a single call.  Rendering a paragraph
+therefore allocates one tuple and one string however long its template is,
+and never parses the template again.
+
+A field may name a filter after a ``|``, e.g. ``{revenue|money}``; see
+``FILTERS``.  A field whose value is ``None`` or absent from the context
+renders as the set's ``missing`` text instead of being passed to its
+filter, so plans with gaps in their targets still produce a narrative.
+
+Template sets are pluggable: create a ``NarrativeTemplates`` with your own
+paragraphs, or derive one from ``DEFAULT_TEMPLATES`` with ``replace``, and
+assign it to an agent's ``narrative_templates``.
+
+Example usage::
+
+    from narrative_templates import DEFAULT_TEMPLATES
+    terse = DEFAULT_TEMPLATES.replace(swot=None, missing="n/a")
+    agent.narrative_templates = terse
+"""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+#: A compiled template: renders a context mapping to text.
+Renderer = Callable[..., str]
+
+
+def _money(value: Any) -> str:
+    return f"${value:,.0f}"
+
+
+def _percent(value: Any) -> str:
+    return f"{value * 100:.0f}%"
+
+
+def _words(value: Any) -> str:
+    return str(value).replace("_", " ")
+
+
+#: Filters available to every template set, by name.
+FILTERS: Dict[str, Callable[[Any], str]] = {
+    "money": _money,
+    "percent": _percent,
+    "join": ", ".join,
+    "list": "; ".join,
+    "words": _words,
+}
+
+# Source of the filters that ``compile_template`` inlines; ``@`` stands for
+# the value.
+_INLINE_FILTERS: Dict[str, str] = {
+    "money": "f'${@:,.0f}'",
+    "percent": "f'{@ * 100:.0f}%'",
+    "words": "str(@).replace('_', ' ')",
+}
+
+#: Target metrics the ``target_year`` template names itself; any other
+#: metric in a year of the targets summary is rendered with
+#: ``target_metric``.
+CORE_TARGET_FIELDS = frozenset({"year", "revenue", "customers", "gross_margin"})
+
+
+def compile_template(
+    text: str, filters: Mapping[str, Callable[[Any], str]], missing: str, arguments: Sequence[str] = ()
+) -> Renderer:
+    """Compile a template into a render function.
+
+    The template is translated into the source of a Python function that
+    looks each field up once and returns a single f-string of the literal
+    text and the filtered values, and that source is compiled.  The
+    standard ``money`` and ``percent`` filters are inlined into the
+    f-string as format specs.
+
+    Args:
+        text: Template text with ``{field}`` or ``{field|filter}``
+            placeholders.  Format specs and conversions are not supported;
+            use a filter instead.
+        filters: Filters the template may name.
+        missing: Text rendered for a field that is ``None`` or absent.
+        arguments: Fields passed to the render function as positional
+            arguments after the context, in this order, instead of looked
+            up in it.
+
+    Returns:
+        A function rendering a context mapping (and ``arguments``) to text.
+
+    Raises:
+        ValueError: If the template is malformed or names an unknown filter.
+    """
+    # Field names and literal text only ever reach the generated source
+    # through ``repr``; filters are bound as globals of the function.
+    namespace: Dict[str, Any] = {"missing": missing}
+    parameters = [f"a{i}" for i in range(len(arguments))]
+    variables: Dict[str, str] = {}
+    statements: List[str] = []
+    body: List[str] = []
+    for literal, field_name, spec, conversion in Formatter().parse(text):
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"Template field {{{field_name}}} must use a filter, not a format spec")
+        name, _, filter_name = field_name.partition("|")
+        variable = variables.get(name)
+        if variable is None:
+            if name in arguments:
+                variable = parameters[arguments.index(name)]
+            else:
+                variable = f"v{len(variables)}"
+                statements.append(f"    {variable} = get({name!r})\n")
+            variables[name] = variable
+        if not filter_name:
+            body.append(f"{{missing if {variable} is None else {variable}}}")
+            continue
+        if filter_name not in filters:
+            raise ValueError(f"Unknown template filter: {filter_name}")
+        if filter_name in _INLINE_FILTERS and filters[filter_name] is FILTERS[filter_name]:
+            expression = _INLINE_FILTERS[filter_name].replace("@", variable)
+        else:
+            function = f"f{len(namespace)}"
+            namespace[function] = filters[filter_name]
+            expression = f"{function}({variable})"
+        result = f"s{len(statements)}"
+        statements.append(f"    {result} = missing if {variable} is None else {expression}\n")
+        body.append(f"{{{result}}}")
+
+    if not variables:
+        constant = text.format()
+        return lambda context, *args: constant
+    source = (
+        f"def render({', '.join(['context', *parameters])}):\n"
+        "    get = context.get\n"
+        + "".join(statements)
+        + f"    return f{''.join(body)!r}\n"
+    )
+    exec(compile(source, "<narrative template>", "exec"), namespace)
+    return namespace["render"]
+
+
+class NarrativeTemplates:
+    """A set of compiled narrative paragraph templates.
+
+    Attributes:
+        paragraphs: Template text of each paragraph, by paragraph name.
+        target_year: Template for one year of the targets summary, rendered
+            by the ``years`` filter.  Its ``other_targets`` field holds the
+            rendered ``target_metric`` entries of that year.
+        target_metric: Template for one additional target of a year, with
+            ``metric`` and ``value`` fields.  Both templates may also name
+            any field of the year, e.g. ``{year}``.
+        missing: Text rendered for missing values.
+        filters: Filters added to, or replacing, ``FILTERS``.
+        renderers: Compiled render function of each paragraph.
+    """
+
+    __slots__ = ("paragraphs", "target_year", "target_metric", "missing", "filters", "renderers",
+                 "_available", "_render_year", "_render_metric", "_narratives")
+
+    def __init__(
+        self,
+        paragraphs: Mapping[str, str],
+        target_year: str = "",
+        target_metric: str = "",
+        missing: str = "TBD",
+        filters: Optional[Mapping[str, Callable[[Any], str]]] = None,
+    ) -> None:
+        self.paragraphs = dict(paragraphs)
+        self.target_year = target_year
+        self.target_metric = target_metric
+        self.missing = missing
+        self.filters = dict(filters or {})
+        self._available = available = {**FILTERS, **self.filters, "years": self._render_years}
+        self._render_year = compile_template(target_year, available, missing, ("other_targets",))
+        self._render_metric = compile_template(target_metric, available, missing, ("metric", "value"))
+        self.renderers: Dict[str, Renderer] = {
+            name: compile_template(text, available, missing) for name, text in self.paragraphs.items()
+        }
+        self._narratives: Dict[Tuple[Tuple[str, ...], str], Renderer] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.renderers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.renderers)
+
+    def __reduce__(self) -> Any:
+        # Compiled renderers cannot be pickled, so a set is pickled as its
+        # templates and compiled again when it is loaded.  The default set
+        # is pickled by name and not compiled again.
+        if self is DEFAULT_TEMPLATES:
+            return "DEFAULT_TEMPLATES"
+        return NarrativeTemplates, (self.paragraphs, self.target_year, self.target_metric, self.missing, self.filters)
+
+    def __repr__(self) -> str:
+        return f"NarrativeTemplates(paragraphs={list(self.paragraphs)!r}, missing={self.missing!r})"
+
+    def render(self, name: str, context: Mapping[str, Any]) -> str:
+        """Render one paragraph.
+
+        Raises:
+            KeyError: If the set has no paragraph ``name``.
+        """
+        return self.renderers[name](context)
+
+    def narrative_renderer(self, names: Sequence[str], separator: str = "\n\n") -> Renderer:
+        """Return one render function for several paragraphs.
+
+        The selected paragraphs are compiled into a single function, so a
+        whole narrative is rendered with one lookup per field and one
+        string.  Each selection is compiled once and then reused.
+
+        Args:
+            names: Paragraphs to render, in order.  Names the set has no
+                template for are skipped.
+            separator: Text placed between paragraphs.
+
+        Returns:
+            A function rendering a context mapping to the joined text.
+        """
+        key = (tuple(names), separator)
+        render = self._narratives.get(key)
+        if render is None:
+            escaped = separator.replace("{", "{{").replace("}", "}}")
+            text = escaped.join(self.paragraphs[name] for name in key[0] if name in self.paragraphs)
+            render = self._narratives[key] = compile_template(text, self._available, self.missing)
+        return render
+
+    def replace(self, **changes: Any) -> "NarrativeTemplates":
+        """Return a copy of the set with some templates or settings changed.
+
+        Keyword arguments named after a paragraph replace its template, or
+        drop the paragraph when ``None``; ``target_year``,
+        ``target_metric``, ``missing`` and ``filters`` replace those
+        settings.
+        """
+        settings = {
+            "target_year": self.target_year,
+            "target_metric": self.target_metric,
+            "missing": self.missing,
+            "filters": self.filters,
+        }
+        paragraphs = dict(self.paragraphs)
+        for name, value in changes.items():
+            if name in settings:
+                settings[name] = value
+            elif value is None:
+                paragraphs.pop(name, None)
+            else:
+                paragraphs[name] = value
+        return NarrativeTemplates(paragraphs, **settings)
+
+    def _render_years(self, rows: Sequence[Mapping[str, Any]]) -> str:
+        """Render the ``years`` filter: one ``target_year`` sentence per row."""
+        render_year, render_metric = self._render_year, self._render_metric
+        sentences = []
+        for row in rows:
+            other_targets = ""
+            for metric, value in row.items():
+                if metric not in CORE_TARGET_FIELDS:
+                    other_targets += " " + render_metric(row, metric, value)
+            sentences.append(render_year(row, other_targets))
+        return " ".join(sentences)
+
+
+#: The standard narrative, one template per entry in
+#: ``planning_agent.NARRATIVE_PARAGRAPHS``.
+DEFAULT_TEMPLATES = NarrativeTemplates(
+    paragraphs={
+        "intro": (
+            "{company_name} exists to {mission}.  Our vision is to {vision}. "
+            "To achieve this ambition, we have created a {horizon_label} strategic plan grounded in our core values: "
+            "{core_values|join}."
+        ),
+        "targets": "{targets|years}",
+        "moves": (
+            "To realise these goals, we will pursue a focused set of Winning Moves. "
+            "On the revenue side we will: {revenue_moves|list}. "
+            "On the profitability side we will: {profit_moves|list}."
+        ),
+        "swot": (
+            "Our SWOT analysis reveals that our strengths—{strengths|join}"
+            "—position us well to capitalise on opportunities such as {opportunities|join}"
+            ".  However, we must mitigate weaknesses like {weaknesses|join}"
+            " and guard against threats such as {threats|join}."
+        ),
+        "execution": (
+            "We will execute against clear milestones every six months and monitor key performance indicators across finance, customers, marketing, operations and HR. "
+            "Our plan leverages best‑in‑class service providers for legal, accounting, payroll, marketing and AI‑enabled HR to build a strong operational foundation."
+        ),
+        "closing": (
+            "By aligning our team around this roadmap and measuring our progress relentlessly, "
+            "{company_name} will be well positioned to achieve its {horizon_label} objectives and move closer to its long‑term vision."
+        ),
+    },
+    target_year=(
+        "In {year}, we aim to generate {revenue|money} in revenue and serve {customers} customers, "
+        "achieving a gross margin of {gross_margin|percent}{other_targets}."
+    ),
+    target_metric="with {metric|words} of {value|money}",
+)
@@ -0,0 +1,272 @@
+"""
+Command-line batch planner.
+
+Reads company payloads in the ``/generate_plan`` format from a file or
+standard input, generates each plan and narrative with
+``plan_service.plan_from_payload`` on a pool of worker processes, and
+writes one NDJSON line per payload, in input order:
+
+    {"index":0,"narrative":"...","plan":{...}}
+    {"error":"horizon_years must be an integer from 1 to 10","index":1}
+
+These are the same lines the ``/generate_plans`` endpoint streams, with
+sorted keys.  A
+failing payload is reported on its own line and does not stop the batch.
+
+Input may be a JSON array of payloads, NDJSON with one payload per line,
+or CSV with one payload per row.  CSV columns name payload fields, with
+dots for nested fields, e.g. ``company_name``, ``targets.year1.revenue``
+or ``baseline_metrics.customers``.  Cells of list fields (``core_values``,
+``swot.strengths`` and so on, ``winning_moves``) hold ``;``-separated
+items, and empty cells are left out.
+
+Usage:
+
+    python plan_batch.py portfolio.ndjson -o plans.ndjson
+    python plan_batch.py portfolio.csv --workers 8 --chunksize 32
+    cat portfolio.json | python plan_batch.py --format json > plans.ndjson
+
+The pool uses every CPU by default.  Payloads are sent to the workers
+``--chunksize`` at a time, and each worker encodes its own output lines,
+so the parent process only reads input and writes output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from plan_service import PayloadError, parse_sections, plan_from_payload
+
+#: Input formats, by file extension.
+FORMATS: Dict[str, str] = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+}
+
+#: CSV columns whose cells hold ``;``-separated lists.
+CSV_LIST_FIELDS = frozenset({
+    "core_values", "swot.strengths", "swot.weaknesses", "swot.opportunities", "swot.threats",
+    "winning_moves",
+})
+
+#: Top-level payload fields whose CSV cells are numbers.
+CSV_NUMBER_FIELDS = frozenset({"horizon_years", "periods_per_year", "fiscal_year_start_month"})
+
+#: Payloads sent to a worker at a time unless ``--chunksize`` is given.
+DEFAULT_CHUNKSIZE = 16
+
+# Per-worker plan settings, set by ``_init_worker``.
+_worker_sections: Optional[List[str]] = None
+_worker_catalogs: Optional[str] = None
+
+
+def _number(text: str) -> Any:
+    """Parse a CSV cell as an int or float, leaving other text as it is."""
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def csv_payload(row: Dict[str, str]) -> Dict[str, Any]:
+    """Build a payload from one CSV row keyed by dotted field names."""
+    payload: Dict[str, Any] = {}
+    for column, cell in row.items():
+        if column is None or cell is None or not cell.strip():
+            continue
+        cell = cell.strip()
+        if column in CSV_LIST_FIELDS:
+            items = [item.strip() for item in cell.split(";") if item.strip()]
+            value: Any = [{"description": item} for item in items] if column == "winning_moves" else items
+        elif column in CSV_NUMBER_FIELDS or column.startswith(("targets.", "baseline_metrics.")):
+            value = _number(cell)
+        else:
+            value = cell
+        *parents, name = column.split(".")
+        target = payload
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = value
+    return payload
+
+
+def read_payloads(stream: TextIO, fmt: str) -> Iterator[Any]:
+    """Read payloads from ``stream``.
+
+    NDJSON and CSV input is read one line at a time.  An NDJSON line that
+    is not valid JSON yields the ``ValueError`` instead of raising it, so
+    that it is reported against that item.
+
+    Args:
+        stream: Text stream to read.
+        fmt: ``"json"``, ``"ndjson"`` or ``"csv"``.
+
+    Raises:
+        ValueError: If a JSON document is invalid or not an array.
+    """
+    if fmt == "json":
+        items = json.load(stream)
+        if not isinstance(items, list):
+            raise ValueError("JSON input must be an array of payloads")
+        yield from items
+    elif fmt == "ndjson":
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield exc
+    elif fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield csv_payload(row)
+    else:
+        raise ValueError(f"Unknown input format: {fmt}")
+
+
+def plan_line(item: Tuple[int, Any], sections: Optional[List[str]] = None,
+              catalogs: Optional[str] = None) -> Tuple[bool, str]:
+    """Generate the output line for one ``(index, payload)`` item.
+
+    Returns:
+        An ``(ok, line)`` tuple: whether the payload was planned, and its
+        JSON-encoded line without the newline.
+    """
+    index, data = item
+    try:
+        # Reported as unexpected failures, as ``/generate_plans`` does.
+        if isinstance(data, ValueError):
+            raise ValueError(f"Invalid JSON: {data}")
+        if not isinstance(data, dict):
+            raise ValueError("Payload must be a JSON object")
+        line = {"index": index, **plan_from_payload(data, sections, catalogs)}
+    except PayloadError as exc:
+        line = {"index": index, "error": str(exc)}
+    except Exception as exc:
+        line = {"index": index, "error": f"Failed to generate plan: {exc}"}
+    return "error" not in line, json.dumps(line, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _init_worker(sections: Optional[List[str]], catalogs: Optional[str]) -> None:
+    global _worker_sections, _worker_catalogs
+    _worker_sections, _worker_catalogs = sections, catalogs
+
+
+def _worker_plan_line(item: Tuple[int, Any]) -> Tuple[bool, str]:
+    return plan_line(item, _worker_sections, _worker_catalogs)
+
+
+def plan_lines(payloads: Iterable[Any], workers: Optional[int] = None, chunksize: int = DEFAULT_CHUNKSIZE,
+               sections: Optional[List[str]] = None, catalogs: Optional[str] = None) -> Iterator[Tuple[bool, str]]:
+    """Generate the output line of every payload, in input order.
+
+    Args:
+        payloads: Payloads in the ``/generate_plan`` format.
+        workers: Number of worker processes; every CPU by default.  With
+            ``1`` or fewer the payloads are planned in this process.
+        chunksize: Payloads sent to a worker at a time.
+        sections: Response sections to produce; see ``plan_from_payload``.
+        catalogs: ``"inline"`` or ``"reference"``; see ``plan_from_payload``.
+
+    Yields:
+        One ``(ok, line)`` tuple per payload; see ``plan_line``.
+    """
+    items = enumerate(payloads)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for item in items:
+            yield plan_line(item, sections, catalogs)
+        return
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(sections, catalogs)) as pool:
+        yield from pool.imap(_worker_plan_line, items, chunksize)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the batch planner; returns the process exit status.
+
+    The status is 0 when every payload was planned, 1 when any payload
+    failed and 2 when the input could not be read or the output could not
+    be written.
+    """
+    parser = argparse.ArgumentParser(description="Generate strategic plans for a batch of companies.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSON, NDJSON or CSV file of payloads; '-' (the default) reads stdin")
+    parser.add_argument("-o", "--output", default="-", help="NDJSON output file; '-' (the default) writes stdout")
+    parser.add_argument("-f", "--format", choices=sorted(set(FORMATS.values())),
+                        help="input format; by default taken from the file extension, or ndjson for stdin")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: every CPU; 1 plans in this process)")
+    parser.add_argument("-c", "--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"payloads sent to a worker at a time (default: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument("--sections", help="comma-separated response sections to produce (default: all)")
+    parser.add_argument("--catalogs", choices=("inline", "reference"), help="how to include the static catalogs")
+    args = parser.parse_args(argv)
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+    try:
+        sections = parse_sections(args.sections)
+    except PayloadError as exc:
+        parser.error(str(exc))
+    fmt = args.format or FORMATS.get(os.path.splitext(args.input)[1].lower(), "ndjson")
+
+    started = time.perf_counter()
+    count = failed = 0
+    try:
+        source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    except OSError as exc:
+        print(f"plan_batch: cannot read {args.input}: {exc}", file=sys.stderr)
+        return 2
+    try:
+        target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    except OSError as exc:
+        print(f"plan_batch: cannot write {args.output}: {exc}", file=sys.stderr)
+        if source is not sys.stdin:
+            source.close()
+        return 2
+    try:
+        for ok, line in plan_lines(read_payloads(source, fmt), args.workers, args.chunksize, sections, args.catalogs):
+            count += 1
+            failed += not ok
+            try:
+                target.write(line)
+                target.write("\n")
+            except OSError as exc:
+                print(f"plan_batch: cannot write {args.output}: {exc}", file=sys.stderr)
+                return 2
+        try:
+            target.flush()
+        except OSError as exc:
+            print(f"plan_batch: cannot write {args.output}: {exc}", file=sys.stderr)
+            return 2
+    except (OSError, ValueError) as exc:
+        print(f"plan_batch: cannot read {args.input}: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            try:
+                target.close()
+            except OSError:
+                # Only after a write error, which has been reported.
+                pass
+    elapsed = time.perf_counter() - started
+    print(f"plan_batch: planned {count} payload(s), {failed} failed, in {elapsed:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
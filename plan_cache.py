@@ -0,0 +1,111 @@
+"""
+In-process result cache for generated plans.
+
+Dashboards frequently request the same company plan over and over.  The
+``PlanCache`` class stores generated responses keyed by a content hash of
+the request payload so that repeated requests can be answered without
+running the ``StrategicPlanningAgent`` again.
+
+The cache is a bounded LRU with a per-entry time-to-live.  It is safe to
+share between the threads of a single worker process; each process keeps
+its own cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def payload_digest(data: Any) -> str:
+    """Return a canonical content hash for a decoded JSON payload.
+
+    The payload is re-encoded with sorted keys and compact separators, so
+    two payloads that differ only in key order or whitespace share a
+    digest.
+
+    Args:
+        data: A decoded JSON value.
+
+    Returns:
+        A hex-encoded SHA-256 digest.
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    """Thread-safe LRU cache with a time-to-live for generated plans.
+
+    Attributes:
+        max_entries: Maximum number of entries held.  Once full, the least
+            recently used entry is evicted.  A value of 0 disables caching.
+        ttl: Number of seconds an entry remains valid after it was stored.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entries if full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry.  Counters are left untouched."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
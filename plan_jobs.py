@@ -0,0 +1,184 @@
+"""
+Background plan jobs.
+
+Large payloads, and the heavier modelling built on top of the planning
+agent, do not fit a synchronous request/response cycle.  ``JobManager``
+runs plan generation on a bounded pool of worker threads.  Callers submit
+work and get a job id back immediately, then poll the job for its status
+and result.
+
+Finished jobs are kept for a limited time and then discarded.  On
+shutdown, queued and running jobs are allowed to finish before the pool
+exits.
+"""
+
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while the pool's backlog is full."""
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isoformat()
+
+
+@dataclass
+class PlanJob:
+    """State of a single background job.
+
+    Attributes:
+        job_id: Unique identifier handed back to the client.
+        status: One of ``queued``, ``running``, ``succeeded`` or ``failed``.
+        created_at: Submission time (seconds since the epoch).
+        started_at: Time the job started running, if it has.
+        finished_at: Time the job finished, if it has.
+        result: Return value of the job function once it succeeded.
+        error: Error message once the job failed.
+    """
+
+    job_id: str
+    status: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON representation reported to clients."""
+        data: Dict[str, Any] = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": _isoformat(self.created_at),
+            "started_at": _isoformat(self.started_at),
+            "finished_at": _isoformat(self.finished_at),
+        }
+        if self.status == SUCCEEDED:
+            data["result"] = self.result
+        elif self.status == FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """Runs jobs on a bounded thread pool and tracks their state.
+
+    Attributes:
+        max_pending: Maximum number of queued plus running jobs.  Further
+            submissions raise ``JobQueueFull``.
+        result_ttl: Seconds a finished job remains available.
+    """
+
+    def __init__(self, func: Callable[..., Any], max_workers: int = 4, max_pending: int = 100,
+                 result_ttl: float = 600.0, clock: Callable[[], float] = time.time) -> None:
+        self._func = func
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="plan-job")
+        self._jobs: Dict[str, PlanJob] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+    def _purge_expired(self) -> None:
+        """Drop finished jobs whose results have expired.  Caller holds the lock."""
+        cutoff = self._clock() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at is not None and job.finished_at <= cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def submit(self, *args: Any) -> PlanJob:
+        """Queue a call to the job function with ``args``.
+
+        Returns:
+            The new job, in the ``queued`` state.
+
+        Raises:
+            JobQueueFull: If ``max_pending`` jobs are already queued or running.
+            RuntimeError: If the manager has been shut down.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Job manager is shutting down")
+            self._purge_expired()
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} jobs already pending")
+            job = PlanJob(job_id=uuid.uuid4().hex, status=QUEUED, created_at=self._clock())
+            self._jobs[job.job_id] = job
+            self._pending += 1
+        self._executor.submit(self._run, job, args)
+        return job
+
+    def _run(self, job: PlanJob, args: tuple) -> None:
+        with self._lock:
+            job.status = RUNNING
+            job.started_at = self._clock()
+        try:
+            result = self._func(*args)
+        except Exception as exc:
+            status, result, error = FAILED, None, str(exc)
+        else:
+            status, error = SUCCEEDED, None
+        with self._lock:
+            job.result = result
+            job.error = error
+            job.finished_at = self._clock()
+            job.status = status
+            self._pending -= 1
+
+    def get(self, job_id: str) -> Optional[PlanJob]:
+        """Return the job with ``job_id``, or ``None`` if unknown or expired."""
+        with self._lock:
+            self._purge_expired()
+            return self._jobs.get(job_id)
+
+    def snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the JSON representation of a job, or ``None`` if unknown or expired.
+
+        The job is read under the lock, so the status, timestamps and
+        result always come from the same point in the job's life.
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job is not None else None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and, by default, wait for pending ones to finish."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the job counters."""
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "tracked": len(self._jobs),
+                "result_ttl": self.result_ttl,
+            }
@@ -0,0 +1,440 @@
+"""
+Web-framework-free core of the strategic planning API.
+
+``plan_from_payload`` turns a ``/generate_plan`` payload into the same
+``{plan, narrative}`` result the HTTP endpoints return, without going
+through HTTP.  The Flask application in ``agent_api.py``, the ASGI
+application in ``asgi_api.py``, background plan jobs and scenario sweeps
+all use it, and in-process callers such as ETL workers can import it
+directly without pulling in Flask.
+
+Every function here is thread-safe: each call builds its own
+``StrategicPlanningAgent``, and the only shared state is the read-only
+static catalogs, which are built once per process.
+
+Example usage::
+
+    from plan_service import PayloadError, plan_from_payload
+    try:
+        result = plan_from_payload({"company_name": "Acme", "targets": {...}})
+    except PayloadError as exc:
+        ...  # the payload is invalid
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import the planning agent. Ensure that planning_agent.py is in the
+# same directory or installed in your PYTHONPATH.
+try:
+    from planning_agent import DEFAULT_HORIZON_YEARS, PLAN_SECTIONS, StrategicPlanningAgent, default_sections
+except ImportError as e:
+    raise ImportError("Unable to import StrategicPlanningAgent from planning_agent.py. "
+                      "Make sure planning_agent.py is available in the same directory.") from e
+
+from plan_cache import payload_digest
+
+# The winning-move revenue simulation needs NumPy.  Without it the rest
+# of the API works as usual and simulation requests are rejected.
+try:
+    import revenue_simulation
+except ImportError:
+    revenue_simulation = None
+
+
+class PayloadError(ValueError):
+    """Raised when a request payload is invalid; reported as HTTP 400."""
+
+
+#: Response sections a client may request: every plan section plus the narrative.
+RESPONSE_SECTIONS = PLAN_SECTIONS + ("narrative",)
+
+
+#: Longest planning horizon, in years, a payload may ask for.
+MAX_HORIZON_YEARS = 10
+
+#: Granularities accepted for the ``projections`` section: yearly,
+#: half-yearly, quarterly and monthly.
+PERIODS_PER_YEAR = (1, 2, 4, 12)
+
+
+#: Largest number of Monte Carlo draws a payload may ask for.
+MAX_SIMULATION_DRAWS = 1_000_000
+
+#: Largest number of draws times simulated winning moves a payload may ask
+#: for, which bounds the time a simulation takes.
+MAX_SIMULATION_SAMPLES = 10_000_000
+
+
+#: Static catalog plan sections, mapped to the name they are served under
+#: at ``/catalog/<name>`` and the agent method producing them.
+CATALOGS: Dict[str, Tuple[str, str]] = {
+    "recommended_kpis": ("kpis", "suggest_kpis"),
+    "service_recommendations": ("services", "recommend_services"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_content(section: str) -> Any:
+    """Return the static catalog held in plan section ``section``.
+
+    The catalogs do not depend on company data, so they are produced once
+    per process from a placeholder agent.  Callers must not mutate the
+    returned value.
+    """
+    prototype = StrategicPlanningAgent(
+        company_name="", mission="", vision="", core_values=[], baseline_metrics={},
+    )
+    return getattr(prototype, CATALOGS[section][1])()
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_version(section: str) -> str:
+    """Return the content hash identifying the current version of a catalog."""
+    return payload_digest(catalog_content(section))
+
+
+def catalog_reference(section: str) -> Dict[str, str]:
+    """Return the object that stands in for a catalog section by reference."""
+    version = catalog_version(section)
+    return {"href": f"/catalog/{CATALOGS[section][0]}?v={version}", "version": version}
+
+
+def parse_sections(value: Any) -> Optional[List[str]]:
+    """Parse a ``sections`` selection from a query string or payload.
+
+    Args:
+        value: ``None``, a comma-separated string or a list of section names.
+
+    Returns:
+        The requested section names, or ``None`` if no selection was made.
+
+    Raises:
+        PayloadError: If the value is malformed or names an unknown section.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [part.strip() for part in value.split(",") if part.strip()]
+    if not isinstance(value, list) or not all(isinstance(name, str) for name in value):
+        raise PayloadError("sections must be a list or a comma-separated string of section names")
+    unknown = set(value).difference(RESPONSE_SECTIONS)
+    if unknown:
+        raise PayloadError(f"Unknown section(s): {', '.join(sorted(unknown))}")
+    return value
+
+
+def build_agent(data: Dict[str, Any]) -> StrategicPlanningAgent:
+    """Build a ``StrategicPlanningAgent`` from a ``/generate_plan`` payload.
+
+    A fresh agent is built for each call, so agents are never shared
+    between requests.
+
+    Args:
+        data: A decoded JSON payload in the ``/generate_plan`` format.
+
+    Returns:
+        An agent holding the payload's company data, targets, winning
+        moves and SWOT analysis.
+
+    Raises:
+        PayloadError: If ``horizon_years``, ``periods_per_year`` or
+            ``fiscal_year_start_month`` is invalid.
+    """
+    # Extract required fields with basic validation.
+    company_name: str = data.get("company_name", "Your Company")
+    mission: str = data.get("mission", "")
+    vision: str = data.get("vision", "")
+    core_values: List[str] = data.get("core_values", [])
+
+    horizon_years = data.get("horizon_years", DEFAULT_HORIZON_YEARS)
+    if type(horizon_years) is not int or not 1 <= horizon_years <= MAX_HORIZON_YEARS:
+        raise PayloadError(f"horizon_years must be an integer from 1 to {MAX_HORIZON_YEARS}")
+    periods_per_year = data.get("periods_per_year", 1)
+    if type(periods_per_year) is not int or periods_per_year not in PERIODS_PER_YEAR:
+        raise PayloadError(f"periods_per_year must be one of {', '.join(map(str, PERIODS_PER_YEAR))}")
+    fiscal_year_start_month = data.get("fiscal_year_start_month", 1)
+    if type(fiscal_year_start_month) is not int or not 1 <= fiscal_year_start_month <= 12:
+        raise PayloadError("fiscal_year_start_month must be an integer from 1 to 12")
+
+    # Targets: convert nested dict into separate mappings for revenue,
+    # customers and margins keyed by a relative year index (1, 2, ...,
+    # horizon_years).  The agent interpolates years left out.
+    targets_input: Dict[str, Dict[str, Any]] = data.get("targets", {})
+    revenue_targets: Dict[int, Optional[float]] = {}
+    customer_targets: Dict[int, Optional[int]] = {}
+    margin_targets: Dict[int, Optional[float]] = {}
+    for idx in range(1, horizon_years + 1):
+        year_data = targets_input.get(f"year{idx}", {})
+        # Populate each mapping; values may be None if missing.
+        revenue_targets[idx] = year_data.get("revenue")
+        customer_targets[idx] = year_data.get("customers")
+        margin_targets[idx] = year_data.get("margin")
+
+    # Winning moves
+    winning_moves: List[Dict[str, Any]] = data.get("winning_moves", [])
+
+    # SWOT analysis
+    swot = data.get("swot", {})
+    strengths = swot.get("strengths", [])
+    weaknesses = swot.get("weaknesses", [])
+    opportunities = swot.get("opportunities", [])
+    threats = swot.get("threats", [])
+
+    # Build a fresh agent for this request.  Agents are cheap to
+    # construct and are never shared between requests, so threaded
+    # workers (gunicorn ``gthread``) cannot observe each other's
+    # company data, targets, SWOT or winning moves.
+    # Use baseline metrics from input if provided, else empty dict
+    baseline_metrics = data.get("baseline_metrics", {})
+    agent = StrategicPlanningAgent(
+        company_name=company_name,
+        mission=mission,
+        vision=vision,
+        core_values=core_values,
+        baseline_metrics=baseline_metrics,
+        horizon_years=horizon_years,
+        periods_per_year=periods_per_year,
+        fiscal_year_start_month=fiscal_year_start_month,
+    )
+
+    # Build the plan using the agent. Supply separate revenue, customer
+    # and margin targets as required by StrategicPlanningAgent.set_targets().
+    agent.set_targets(revenue_targets, customer_targets, margin_targets)
+    if winning_moves:
+        # Extract descriptions and assign them as revenue moves. Leave profit
+        # moves empty; the agent will still capture the high‑level initiatives.
+        move_descriptions = [move.get("description", "") for move in winning_moves]
+        try:
+            agent.identify_winning_moves(move_descriptions, [])
+        except AttributeError:
+            # If identify_winning_moves is unavailable, ignore winning moves gracefully.
+            pass
+    if any([strengths, weaknesses, opportunities, threats]):
+        # Use the correct method name from StrategicPlanningAgent. The
+        # planning_agent module defines ``create_swot`` (not ``add_swot``),
+        # which sets the SWOT analysis on the agent and returns it.
+        try:
+            agent.create_swot(strengths, weaknesses, opportunities, threats)
+        except AttributeError:
+            # Fallback for older versions where the method might be named differently;
+            # ignore if the method is unavailable.
+            pass
+
+    return agent
+
+
+def resolve_selection(data: Dict[str, Any], sections: Optional[List[str]] = None,
+                      catalogs: Optional[str] = None) -> Tuple[Optional[List[str]], bool, List[str]]:
+    """Work out what a request asked for.
+
+    Args:
+        data: A decoded JSON payload in the ``/generate_plan`` format.
+        sections: Section selection overriding the payload's ``sections``.
+        catalogs: Catalog mode overriding the payload's ``catalogs``.
+
+    Returns:
+        A ``(plan_sections, narrative, referenced)`` tuple: the plan
+        sections to build (``None`` for all of them), whether to render the
+        narrative, and the catalog sections to include by reference.
+
+    Raises:
+        PayloadError: If the section or catalog selection is invalid.
+    """
+    if sections is None:
+        sections = parse_sections(data.get("sections"))
+    if catalogs is None:
+        catalogs = data.get("catalogs", "inline")
+    if catalogs not in ("inline", "reference"):
+        raise PayloadError('catalogs must be "inline" or "reference"')
+    referenced: List[str] = []
+    if catalogs == "reference":
+        # Referenced catalogs are not built at all; their links are added
+        # to the plan once the remaining sections are assembled.
+        if sections is None:
+            periods_per_year = data.get("periods_per_year", 1)
+            # An invalid value is reported by ``build_agent``.
+            selected = [*default_sections(periods_per_year if type(periods_per_year) is int else 1), "narrative"]
+        else:
+            selected = sections
+        referenced = [name for name in selected if name in CATALOGS]
+        sections = [name for name in selected if name not in CATALOGS]
+    if sections is None:
+        return None, True, referenced
+    return [name for name in sections if name != "narrative"], "narrative" in sections, referenced
+
+
+def plan_from_payload(payload: Dict[str, Any], sections: Optional[Any] = None,
+                      catalogs: Optional[str] = None) -> Dict[str, Any]:
+    """Generate the plan and narrative for a single payload.
+
+    This is the work behind ``/generate_plan``, shared with the batch,
+    job and ASGI endpoints so that every payload is parsed the same way,
+    and callable in-process with identical results.  A fresh
+    ``StrategicPlanningAgent`` is built for each call, so concurrent
+    calls from several threads are safe.
+
+    Args:
+        payload: A decoded JSON payload in the ``/generate_plan`` format.
+        sections: Optional response sections to produce (see
+            ``RESPONSE_SECTIONS``), as a list or a comma-separated string.
+            Overrides a ``sections`` key in the payload.  Unrequested
+            sections are not computed.
+        catalogs: ``"inline"`` (the default) to embed the static catalog
+            sections, or ``"reference"`` to replace each with a versioned
+            link to its ``/catalog/<name>`` endpoint.  Overrides a
+            ``catalogs`` key in the payload.
+
+    Returns:
+        A dictionary with ``plan`` and ``narrative`` keys.  When a
+        selection is made, ``plan`` only holds the selected plan sections
+        and ``narrative`` is present only if it was selected.  A
+        ``simulation`` key is added when the payload asks for one.
+
+    Raises:
+        PayloadError: If the payload is not an object, or its section,
+            catalog, horizon or simulation settings are invalid.
+    """
+    if not isinstance(payload, dict):
+        raise PayloadError("Payload must be a JSON object")
+    if sections is not None:
+        sections = parse_sections(sections)
+    plan_sections, with_narrative, referenced = resolve_selection(payload, sections, catalogs)
+    agent = build_agent(payload)
+
+    if not with_narrative:
+        result = {"plan": agent.build_plan(plan_sections)}
+    else:
+        # Build the plan and the narrative together.  ``build_plan_and_narrative``
+        # assembles every plan section once and renders the narrative from
+        # that plan, rather than rebuilding it inside ``generate_narrative``.
+        plan, narrative = agent.build_plan_and_narrative(plan_sections)
+        result = {
+            "plan": plan,
+            "narrative": narrative
+        }
+
+    for section in referenced:
+        result["plan"][section] = catalog_reference(section)
+    if payload.get("simulation") is not None:
+        result["simulation"] = simulate_moves(payload, agent)
+    return result
+
+
+def parse_simulation(data: Dict[str, Any]) -> Tuple[int, Optional[int], List[Any]]:
+    """Validate the winning-move simulation requested by a payload.
+
+    Args:
+        data: A decoded JSON payload whose ``simulation`` key holds
+            ``{"draws": ..., "seed": ...}`` (both optional).
+
+    Returns:
+        A ``(draws, seed, moves)`` tuple, with the payload's winning moves
+        as ``revenue_simulation.MoveProjection`` objects.
+
+    Raises:
+        PayloadError: If the settings or a move's ``projected_revenue`` are
+            invalid, the simulation would exceed ``MAX_SIMULATION_SAMPLES``,
+            or NumPy is not installed.
+    """
+    settings = data["simulation"]
+    if not isinstance(settings, dict):
+        raise PayloadError("simulation must be an object")
+    if revenue_simulation is None:
+        raise PayloadError("Revenue simulation is unavailable: NumPy is not installed")
+    draws = settings.get("draws", revenue_simulation.DEFAULT_DRAWS)
+    if type(draws) is not int or not 1 <= draws <= MAX_SIMULATION_DRAWS:
+        raise PayloadError(f"simulation.draws must be an integer from 1 to {MAX_SIMULATION_DRAWS}")
+    seed = settings.get("seed")
+    if seed is not None and (type(seed) is not int or seed < 0):
+        raise PayloadError("simulation.seed must be a non-negative integer")
+
+    try:
+        moves = [
+            projection for projection in (
+                revenue_simulation.MoveProjection.from_payload(move)
+                for move in data.get("winning_moves", []) if isinstance(move, dict)
+            )
+            if projection is not None
+        ]
+    except ValueError as exc:
+        raise PayloadError(f"Invalid winning move: {exc}") from exc
+    if draws * len(moves) > MAX_SIMULATION_SAMPLES:
+        raise PayloadError(
+            f"simulation.draws times the number of winning moves with a projected_revenue "
+            f"must not exceed {MAX_SIMULATION_SAMPLES}"
+        )
+
+    return draws, seed, moves
+
+
+def simulate_moves(data: Dict[str, Any], agent: StrategicPlanningAgent) -> Dict[str, Any]:
+    """Run the winning-move revenue simulation requested by a payload.
+
+    Args:
+        data: A decoded JSON payload whose ``simulation`` key holds
+            ``{"draws": ..., "seed": ...}`` (both optional).
+        agent: The agent built from ``data``, supplying the per-year
+            revenue targets and baseline revenue.
+
+    Returns:
+        The ``revenue_simulation.simulate_revenue`` result.
+
+    Raises:
+        PayloadError: If the settings or a move's ``projected_revenue`` are
+            invalid, or NumPy is not installed.
+    """
+    draws, seed, moves = parse_simulation(data)
+    targets = agent.build_plan(["strategic_targets"])["strategic_targets"]
+    baseline_revenue = agent.baseline_metrics.get("annual_revenue")
+    if not isinstance(baseline_revenue, (int, float)) or isinstance(baseline_revenue, bool):
+        baseline_revenue = 0.0
+    return revenue_simulation.simulate_revenue(
+        moves,
+        years=[row["year"] for row in targets],
+        targets=[row["revenue"] for row in targets],
+        baseline_revenue=baseline_revenue,
+        draws=draws,
+        seed=seed,
+    )
+
+
+def evaluate_scenario(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarise one scenario of a sweep as a flat row of figures.
+
+    Runs in the sweep's worker processes, so it only returns plain
+    numbers.
+
+    Args:
+        data: A scenario payload in the ``/generate_plan`` format.
+
+    Returns:
+        The final year's revenue, customers and gross margin, the gross
+        margin in currency for that year and totals over the horizon.
+        When the payload asks for a ``simulation``, also the simulated
+        median final-year revenue and the probability of reaching the
+        final-year revenue target.
+    """
+    agent = build_agent(data)
+    targets = agent.build_plan(["strategic_targets"])["strategic_targets"]
+
+    def number(value: Any) -> float:
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0.0
+
+    margin_dollars = [number(row["revenue"]) * number(row["gross_margin"]) for row in targets]
+    final = targets[-1] if targets else {}
+    row: Dict[str, Any] = {
+        "final_revenue": final.get("revenue"),
+        "final_customers": final.get("customers"),
+        "final_gross_margin": final.get("gross_margin"),
+        "final_gross_margin_dollars": margin_dollars[-1] if margin_dollars else None,
+        "total_revenue": sum(number(row["revenue"]) for row in targets),
+        "total_gross_margin_dollars": sum(margin_dollars),
+    }
+    if data.get("simulation") is not None:
+        simulated = simulate_moves(data, agent)["years"]
+        row["simulated_p50_final_revenue"] = simulated[-1]["p50"] if simulated else None
+        row["probability_of_final_target"] = simulated[-1]["probability_of_target"] if simulated else None
+    return row
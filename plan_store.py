@@ -0,0 +1,442 @@
+"""
+SQLite-backed store for generated plans.
+
+``PlanStore`` keeps every generated plan together with its narrative and
+the payload it was generated from, so that a plan can be fetched again
+later without running the ``StrategicPlanningAgent``.
+
+Plan sections, narrative paragraphs and the lists and objects of the
+payload (its targets, SWOT analysis, winning moves, ...) are stored once
+per distinct content.  Each is kept in a content-addressed table under
+the hash of its canonical JSON, and a plan record only holds a small
+manifest of those hashes and the payload's remaining scalar fields.  The
+static catalog sections, and anything that did not change between two
+plans (a SWOT analysis, the milestones, the closing paragraph, ...), are
+written to disk once however many plans share them.
+
+The database runs in WAL mode, so reads never wait for a write and a
+write never waits for readers.  Each thread gets its own connection,
+opened on first use and reused afterwards.  Plans are indexed by company
+name, creation time and payload hash, the three ways the list queries
+filter them.
+
+The narrative, the SWOT lists and the winning move descriptions of each
+plan are also indexed in an FTS5 full-text index, which ``search`` ranks
+matches from with BM25.  The index is contentless: it holds only the
+tokens, and the text itself stays in the plan and section tables.  When
+the SQLite library was built without FTS5 the store works as before, but
+``searchable`` is false and ``search`` raises ``RuntimeError``.
+
+Example usage::
+
+    from plan_store import PlanStore
+    store = PlanStore("plans.sqlite3")
+    plan_id = store.save(payload, result, payload_hash)
+    record = store.get(plan_id)
+    hits, next_offset = store.search('"supply chain" OR europe')
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    company_name TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    payload_hash TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    manifest TEXT NOT NULL,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    hash TEXT PRIMARY KEY,
+    body TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS plans_company_name ON plans (company_name, created_at);
+CREATE INDEX IF NOT EXISTS plans_created_at ON plans (created_at, id);
+CREATE INDEX IF NOT EXISTS plans_payload_hash ON plans (payload_hash, created_at);
+"""
+
+# Full-text index of the searchable text of each plan, keyed by the
+# ``seq`` of its ``plans`` row.  ``seq`` is an alias of the rowid, which
+# ``VACUUM`` never renumbers.
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS plans_search USING fts5 (
+    company_name, narrative, swot, moves,
+    content='', tokenize='porter unicode61 remove_diacritics 2'
+);
+"""
+
+#: Columns of the full-text index a search may be restricted to.
+SEARCH_FIELDS = ("company_name", "narrative", "swot", "moves")
+
+# Columns returned by ``list``; the payload and sections are only read by ``get``.
+_SUMMARY_COLUMNS = "id, company_name, created_at, payload_hash"
+
+#: Largest number of plans a single ``list`` call returns.
+MAX_LIST_LIMIT = 500
+
+#: Largest number of matches a single ``search`` call returns.
+MAX_SEARCH_LIMIT = 100
+
+#: Number of section hashes each store remembers as already written.
+KNOWN_SECTIONS = 4096
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def section_hash(body: str) -> str:
+    """Return the content address of a section's canonical JSON."""
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _lines(items: Any) -> str:
+    return "\n".join(str(item) for item in items) if isinstance(items, list) else ""
+
+
+def search_text(payload: Dict[str, Any], result: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Return the text of a plan indexed for ``search``, one entry per field.
+
+    SWOT items and winning moves are taken from the payload, so they are
+    indexed whichever response sections the plan was generated with.
+    """
+    swot = payload.get("swot")
+    moves = payload.get("winning_moves")
+    return (
+        str(payload.get("company_name", "")),
+        str(result.get("narrative", "")),
+        "\n".join(_lines(items) for items in swot.values()) if isinstance(swot, dict) else "",
+        _lines([move.get("description", "") if isinstance(move, dict) else move for move in moves])
+        if isinstance(moves, list) else "",
+    )
+
+
+class PlanStore:
+    """Thread-safe store of generated plans in a SQLite database.
+
+    Attributes:
+        path: Path of the database file.
+        timeout: Seconds a write waits for another connection's write
+            to finish before failing.
+        searchable: Whether plans are indexed for ``search``; false when
+            SQLite lacks FTS5.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0) -> None:
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        # Hashes of sections known to be in the database, most recent last.
+        self._known: "OrderedDict[str, None]" = OrderedDict()
+        self.saved = 0
+        self.reads = 0
+        self.sections_written = 0
+        self.sections_reused = 0
+        self.searches = 0
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+        self.searchable = self._create_search_index()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Each connection is only used by the thread that opened it;
+            # ``check_same_thread`` is off so that ``close`` can close them all.
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode NORMAL only syncs at checkpoints, and a commit
+            # is still durable against application crashes.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _create_search_index(self) -> bool:
+        """Create the full-text index; return whether SQLite supports it."""
+        try:
+            with self._connection() as connection:
+                connection.executescript(_SEARCH_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    def save(self, payload: Dict[str, Any], result: Dict[str, Any], payload_hash: str) -> str:
+        """Store a generated plan.
+
+        Sections already in the database are not written again.  The plan
+        is indexed for ``search`` in the same transaction.
+
+        Args:
+            payload: The payload the plan was generated from.
+            result: The ``{plan, narrative, ...}`` result of
+                ``plan_service.plan_from_payload``.
+            payload_hash: Content hash identifying the request, e.g. the
+                plan cache key.
+
+        Returns:
+            The new plan's id.
+        """
+        plan_id = uuid.uuid4().hex
+        sections: Dict[str, str] = {}
+
+        def address(value: Any) -> str:
+            # Sorted keys give equal values the same body, and so the same hash.
+            body = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            digest = section_hash(body)
+            sections[digest] = body
+            return digest
+
+        manifest: Dict[str, Any] = {"plan": {name: address(value) for name, value in result.get("plan", {}).items()}}
+        if "narrative" in result:
+            # Splitting on the paragraph separator and joining again is
+            # lossless, whatever the paragraphs contain.
+            manifest["narrative"] = [address(paragraph) for paragraph in result["narrative"].split("\n\n")]
+        # Lists and objects of the payload are stored as sections too; the
+        # stored payload keeps their keys, in order, with null values.
+        stored_payload = dict(payload)
+        payload_sections = {}
+        for key, value in payload.items():
+            if isinstance(value, (dict, list)) and value:
+                payload_sections[key] = address(value)
+                stored_payload[key] = None
+        if payload_sections:
+            manifest["payload"] = payload_sections
+        with self._lock:
+            new_sections = [(digest, body) for digest, body in sections.items() if digest not in self._known]
+        extra = {key: value for key, value in result.items() if key not in ("plan", "narrative")}
+        row = (
+            plan_id,
+            str(payload.get("company_name", "")),
+            time.time(),
+            payload_hash,
+            _dumps(stored_payload),
+            _dumps(manifest),
+            _dumps(extra) if extra else None,
+        )
+        connection = self._connection()
+        with connection:
+            if new_sections:
+                connection.executemany("INSERT OR IGNORE INTO sections VALUES (?, ?)", new_sections)
+            seq = connection.execute(
+                "INSERT INTO plans (id, company_name, created_at, payload_hash, payload, manifest, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                row,
+            ).lastrowid
+            if self.searchable:
+                connection.execute(
+                    "INSERT INTO plans_search (rowid, company_name, narrative, swot, moves) VALUES (?, ?, ?, ?, ?)",
+                    (seq, *search_text(payload, result)),
+                )
+        with self._lock:
+            self.saved += 1
+            self.sections_written += len(new_sections)
+            self.sections_reused += len(sections) - len(new_sections)
+            for digest in sections:
+                self._known[digest] = None
+                self._known.move_to_end(digest)
+            while len(self._known) > KNOWN_SECTIONS:
+                self._known.popitem(last=False)
+        return plan_id
+
+    def get(self, plan_id: str) -> Optional[Dict[str, Any]]:
+        """Return a stored plan, or ``None`` if there is none with this id.
+
+        Returns:
+            A dictionary with the plan's ``id``, ``company_name``,
+            ``created_at`` (seconds since the epoch), ``payload_hash`` and
+            ``payload``, and its ``result`` as it was saved.
+        """
+        connection = self._connection()
+        row = connection.execute("SELECT * FROM plans WHERE id = ?", (plan_id,)).fetchone()
+        with self._lock:
+            self.reads += 1
+        if row is None:
+            return None
+        manifest: Dict[str, Any] = json.loads(row["manifest"])
+        payload_sections: Dict[str, str] = manifest.get("payload", {})
+        hashes = list(set(manifest["plan"].values()).union(manifest.get("narrative", ()), payload_sections.values()))
+        values = {
+            section["hash"]: json.loads(section["body"])
+            for section in connection.execute(
+                f"SELECT hash, body FROM sections WHERE hash IN ({', '.join('?' * len(hashes))})", hashes
+            )
+        }
+        result: Dict[str, Any] = {"plan": {name: values[digest] for name, digest in manifest["plan"].items()}}
+        if "narrative" in manifest:
+            result["narrative"] = "\n\n".join(values[digest] for digest in manifest["narrative"])
+        if row["extra"] is not None:
+            result.update(json.loads(row["extra"]))
+        payload = json.loads(row["payload"])
+        for key, digest in payload_sections.items():
+            payload[key] = values[digest]
+        return {
+            "id": row["id"],
+            "company_name": row["company_name"],
+            "created_at": row["created_at"],
+            "payload_hash": row["payload_hash"],
+            "payload": payload,
+            "result": result,
+        }
+
+    def find(self, payload_hash: str) -> Optional[str]:
+        """Return the id of the newest plan stored for ``payload_hash``, if any."""
+        row = self._connection().execute(
+            "SELECT id FROM plans WHERE payload_hash = ? ORDER BY created_at DESC LIMIT 1", (payload_hash,)
+        ).fetchone()
+        return None if row is None else row["id"]
+
+    def list(self, company_name: Optional[str] = None, payload_hash: Optional[str] = None,
+             since: Optional[float] = None, until: Optional[float] = None,
+             before: Optional[str] = None, limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List stored plans, newest first.
+
+        Args:
+            company_name: Only plans for this company.
+            payload_hash: Only plans with this payload hash.
+            since: Only plans created at or after this time (seconds since
+                the epoch).
+            until: Only plans created before this time.
+            before: Cursor from a previous call; continues after its last
+                plan.
+            limit: Largest number of plans to return, at most
+                ``MAX_LIST_LIMIT``.
+
+        Returns:
+            A ``(plans, cursor)`` tuple.  Each plan is a summary with its
+            ``id``, ``company_name``, ``created_at`` and ``payload_hash``.
+            ``cursor`` is ``None`` once there are no more plans.
+
+        Raises:
+            ValueError: If ``limit`` is out of range or ``before`` is not a
+                known plan id.
+        """
+        if not 1 <= limit <= MAX_LIST_LIMIT:
+            raise ValueError(f"limit must be from 1 to {MAX_LIST_LIMIT}")
+        clauses: List[str] = []
+        params: List[Any] = []
+        for clause, value in (("company_name = ?", company_name), ("payload_hash = ?", payload_hash),
+                              ("created_at >= ?", since), ("created_at < ?", until)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        connection = self._connection()
+        if before is not None:
+            cursor_row = connection.execute("SELECT created_at FROM plans WHERE id = ?", (before,)).fetchone()
+            if cursor_row is None:
+                raise ValueError("before must be a cursor returned by a previous listing")
+            # Keyset pagination: continue strictly after the cursor's row.
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend((cursor_row["created_at"], before))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = connection.execute(
+            f"SELECT {_SUMMARY_COLUMNS} FROM plans {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+            (*params, limit + 1),
+        ).fetchall()
+        with self._lock:
+            self.reads += 1
+        plans = [dict(row) for row in rows[:limit]]
+        return plans, plans[-1]["id"] if len(rows) > limit else None
+
+    def search(self, query: str, fields: Optional[List[str]] = None, company_name: Optional[str] = None,
+               offset: int = 0, limit: int = 20) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Find stored plans whose text matches a full-text query, best first.
+
+        Matches are looked up in the full-text index and ranked by BM25, so
+        a search only reads the plans that match.
+
+        Args:
+            query: FTS5 query, e.g. ``"supply chain" OR europe``.  Words
+                match case-insensitively and by stem; quote phrases,
+                and end a word with ``*`` to match it as a prefix.
+            fields: Only match these of ``SEARCH_FIELDS``; all by default.
+            company_name: Only plans for this company.
+            offset: Number of matches to skip, e.g. the ``next_offset``
+                of the previous page.
+            limit: Largest number of plans to return, at most
+                ``MAX_SEARCH_LIMIT``.
+
+        Returns:
+            A ``(plans, next_offset)`` tuple.  Each plan is a summary as
+            returned by ``list`` with its ``score``, higher for better
+            matches.  ``next_offset`` is ``None`` once there are no more
+            matches.
+
+        Raises:
+            ValueError: If the query is malformed, a field is unknown or
+                ``offset`` or ``limit`` is out of range.
+            RuntimeError: If the store is not ``searchable``.
+        """
+        if not self.searchable:
+            raise RuntimeError("SQLite was built without FTS5; plan search is unavailable")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be from 1 to {MAX_SEARCH_LIMIT}")
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        if not query.strip():
+            raise ValueError("query must not be empty")
+        if fields:
+            unknown = sorted(set(fields).difference(SEARCH_FIELDS))
+            if unknown:
+                raise ValueError(f"Unknown search fields: {', '.join(unknown)}")
+            query = f"{{{' '.join(fields)}}} : ({query})"
+        clauses = ["plans_search MATCH ?"]
+        params: List[Any] = [query]
+        if company_name is not None:
+            clauses.append("p.company_name = ?")
+            params.append(company_name)
+        try:
+            rows = self._connection().execute(
+                f"SELECT p.id, p.company_name, p.created_at, p.payload_hash, -s.rank AS score "
+                f"FROM plans_search AS s JOIN plans AS p ON p.seq = s.rowid "
+                f"WHERE {' AND '.join(clauses)} ORDER BY s.rank LIMIT ? OFFSET ?",
+                (*params, limit + 1, offset),
+            ).fetchall()
+        except sqlite3.OperationalError as exc:
+            # FTS5 reports malformed queries as operational errors.
+            raise ValueError(f"Invalid search query: {exc}") from exc
+        with self._lock:
+            self.searches += 1
+        plans = [dict(row) for row in rows[:limit]]
+        return plans, offset + limit if len(rows) > limit else None
+
+    def close(self) -> None:
+        """Close every thread's connection.
+
+        Only call this once no thread uses the store any more.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the store counters."""
+        with self._lock:
+            return {
+                "path": self.path,
+                "connections": len(self._connections),
+                "saved": self.saved,
+                "reads": self.reads,
+                "sections_written": self.sections_written,
+                "sections_reused": self.sections_reused,
+                "searchable": self.searchable,
+                "searches": self.searches,
+            }
@@ -3,7 +3,8 @@ Strategic Planning Agent for Start‑ups
 ------------------------------------
 
 This module defines a ``StrategicPlanningAgent`` class that helps early‑stage
-companies build a structured three‑year strategic plan.  The agent collects
+companies build a structured multi‑year strategic plan (three years by
+default, or any other horizon such as five or ten years).  The agent collects
 basic information about the business, generates measurable goals using the
 SMART framework, assembles a SWOT analysis, proposes winning moves for
 revenue and profit, recommends key performance indicators (KPIs), outlines
@@ -79,12 +80,25 @@ business context.
 
 from __future__ import annotations
 
+import calendar
 import datetime
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+import types
+from array import array
+from bisect import bisect_right
+from dataclasses import InitVar, dataclass, field
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 
+from narrative_templates import DEFAULT_TEMPLATES, NarrativeTemplates
 
-def _year_list(start_year: int, years: int = 3) -> List[int]:
+
+#: Number of years a plan covers unless the agent is given a horizon.
+DEFAULT_HORIZON_YEARS = 3
+
+_NUMBER_WORDS = ("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten")
+
+
+def _year_list(start_year: int, years: int = DEFAULT_HORIZON_YEARS) -> List[int]:
     """Generate a consecutive list of years starting from ``start_year``.
 
     Args:
@@ -97,9 +111,367 @@ def _year_list(start_year: int, years: int = 3) -> List[int]:
     return [start_year + i for i in range(years)]
 
 
-@dataclass
+# Entry states in a ``TargetsTable`` mask.
+_ABSENT, _NONE, _FLOAT, _INT = 0, 1, 2, 3
+
+# Maps mask states to 1 for entries holding a value, 0 otherwise.
+_HAS_VALUE = bytes([0, 0, 1, 1]).ljust(256, b"\0")
+
+# Largest integer magnitude a float64 column holds exactly.
+_EXACT_INT = 2 ** 53
+
+
+class TargetsTable:
+    """Compact per‑year targets: a year index plus one column per metric.
+
+    Values live in a single ``array('d')`` laid out column by column, with
+    a byte mask recording which years have an entry for each metric and
+    whether it was an ``int``, so values round‑trip unchanged.  Tables
+    holding anything other than ``int`` and ``float`` values fall back to
+    a tuple.  Dicts are only
+    built at the edges, by ``column``, ``to_mappings`` and ``rows``.
+
+    Attributes:
+        years: Sorted years that appear in any column.
+        metrics: Metric names in column order.
+    """
+
+    __slots__ = ("years", "metrics", "_values", "_mask")
+
+    def __init__(self) -> None:
+        self.years: Sequence[Any] = ()
+        self.metrics: Tuple[str, ...] = ()
+        self._values: Sequence[Any] = ()
+        self._mask = b""
+
+    @classmethod
+    def from_mappings(cls, mappings: Mapping[str, Mapping[Any, Any]]) -> "TargetsTable":
+        """Build a table from ``metric → year → value`` mappings.
+
+        A year mapped to ``None`` is kept as an entry without a value.
+        """
+        table = cls()
+        years = sorted({year for values in mappings.values() for year in values})
+        if all(type(year) is int for year in years):
+            table.years = array("q", years)
+        else:
+            table.years = tuple(years)
+        table.metrics = tuple(mappings)
+        mask = bytearray()
+        values: List[Any] = []
+        for metric in table.metrics:
+            column = mappings[metric]
+            for year in years:
+                value = column.get(year)
+                if year not in column:
+                    mask.append(_ABSENT)
+                elif value is None:
+                    mask.append(_NONE)
+                else:
+                    mask.append(_INT if type(value) is int else _FLOAT)
+                values.append(value)
+        table._mask = bytes(mask)
+        numeric = all(
+            value is None or type(value) is float or (type(value) is int and -_EXACT_INT <= value <= _EXACT_INT)
+            for value in values
+        )
+        if numeric:
+            table._values = array("d", [0.0 if value is None else value for value in values])
+        else:
+            table._values = tuple(values)
+        return table
+
+    def _get(self, offset: int) -> Any:
+        """Return the entry at ``offset``, or ``None`` if it has no value."""
+        state = self._mask[offset]
+        if state == _INT:
+            return int(self._values[offset])
+        return None if state < _FLOAT else self._values[offset]
+
+    def column(self, metric: str) -> Dict[Any, Any]:
+        """Return one metric as a ``year → value`` dict; empty if unknown."""
+        if metric not in self.metrics:
+            return {}
+        index = self.metrics.index(metric)
+        base = index * len(self.years)
+        return {
+            year: self._get(base + i)
+            for i, year in enumerate(self.years)
+            if self._mask[base + i] != _ABSENT
+        }
+
+    def buffers(self) -> Optional[Tuple[array, bytes]]:
+        """Return the raw storage for bulk loaders such as NumPy.
+
+        Returns:
+            A ``(values, present)`` tuple of ``len(metrics) * len(years)``
+            entries laid out metric by metric: the ``array('d')`` of values
+            and a byte per entry that is 1 where the entry holds a value.
+            ``None`` if the table holds non‑numeric values.
+        """
+        if not isinstance(self._values, array):
+            return None
+        return self._values, self._mask.translate(_HAS_VALUE)
+
+    def to_mappings(self) -> Dict[str, Dict[Any, Any]]:
+        """Return the table as ``metric → year → value`` dicts."""
+        return {metric: self.column(metric) for metric in self.metrics}
+
+    def rows(self, index_metrics: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return one ``{"year": ..., metric: value}`` dict per year.
+
+        Args:
+            index_metrics: Metrics whose entries decide which years get a
+                row.  Every row holds every metric, with ``None`` where a
+                metric has no value for that year.
+        """
+        width = len(self.years)
+        index = [self.metrics.index(metric) * width for metric in index_metrics if metric in self.metrics]
+        rows = []
+        for i, year in enumerate(self.years):
+            if all(self._mask[base + i] == _ABSENT for base in index):
+                continue
+            row: Dict[str, Any] = {"year": year}
+            for column, metric in enumerate(self.metrics):
+                row[metric] = self._get(column * width + i)
+            rows.append(row)
+        return rows
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TargetsTable):
+            return NotImplemented
+        return self.to_mappings() == other.to_mappings()
+
+    def __repr__(self) -> str:
+        return f"TargetsTable({self.to_mappings()!r})"
+
+
+def interpolate(anchors: Mapping[float, float], points: Iterable[float]) -> List[float]:
+    """Linearly interpolate between anchor values.
+
+    Points outside the anchors take the value of the nearest anchor, as
+    with ``numpy.interp``.
+
+    Args:
+        anchors: Mapping of position (e.g. year) → known value.  Must not
+            be empty.
+        points: Positions to evaluate.
+
+    Returns:
+        The interpolated value at each point, in order.
+    """
+    xs = sorted(anchors)
+    ys = [anchors[x] for x in xs]
+    last = len(xs) - 1
+    values = []
+    for point in points:
+        i = bisect_right(xs, point)
+        if i == 0:
+            values.append(ys[0])
+        elif i > last:
+            values.append(ys[last])
+        else:
+            x0, x1 = xs[i - 1], xs[i]
+            values.append(ys[i - 1] + (ys[i] - ys[i - 1]) * (point - x0) / (x1 - x0))
+    return values
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """Return ``date`` moved by a whole number of calendar months.
+
+    The day of the month is kept, or clamped to the last day of a shorter
+    month (e.g. 31 January + 1 month is 28 or 29 February).
+    """
+    index = date.month - 1 + months
+    year, month = date.year + index // 12, index % 12 + 1
+    return date.replace(year=year, month=month, day=min(date.day, calendar.monthrange(year, month)[1]))
+
+
+@functools.lru_cache(maxsize=256)
+def milestone_schedule(
+    start: datetime.date, months_per_milestone: int = 6, horizon_years: int = DEFAULT_HORIZON_YEARS
+) -> Tuple[Tuple[datetime.date, str], ...]:
+    """Build the milestone schedule for a plan starting on ``start``.
+
+    Milestones fall every ``months_per_milestone`` calendar months from
+    ``start`` until the end of the horizon.  Each is labelled with the
+    plan year it falls in, counted from ``start``, so that a plan starting
+    with a fiscal year in April labels the following March as year 1.
+
+    Schedules are memoized and shared between callers, so they are
+    returned as immutable tuples.
+
+    Args:
+        start: First day of the plan.
+        months_per_milestone: Number of months between milestones.
+        horizon_years: Length of the plan in years.
+
+    Returns:
+        ``(date, label)`` tuples in date order.
+
+    Raises:
+        ValueError: If ``months_per_milestone`` is not positive.
+    """
+    if months_per_milestone < 1:
+        raise ValueError("months_per_milestone must be at least 1")
+    return tuple(
+        (add_months(start, months), f"Milestone {number} – Year {months // 12 + 1}")
+        for number, months in enumerate(range(0, 12 * horizon_years, months_per_milestone), start=1)
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+#: Sections produced by ``StrategicPlanningAgent.build_plan()``, in output order.
+PLAN_SECTIONS: Tuple[str, ...] = (
+    "executive_summary",
+    "company_profile",
+    "baseline_metrics",
+    "strategic_targets",
+    "projections",
+    "winning_moves",
+    "swot_analysis",
+    "milestones",
+    "recommended_kpis",
+    "service_recommendations",
+)
+
+
+#: Paragraphs of the narrative produced by
+#: ``StrategicPlanningAgent.generate_narrative()``, in order.
+NARRATIVE_PARAGRAPHS: Tuple[str, ...] = ("intro", "targets", "moves", "swot", "execution", "closing")
+
+
+#: ``TargetsTable`` metric behind each per‑metric targets attribute of the agent.
+_CORE_TARGETS: Dict[str, str] = {
+    "revenue_targets": "revenue",
+    "customer_targets": "customers",
+    "margin_targets": "gross_margin",
+}
+
+
+
+class _TargetsView:
+    """Read-only view of the agent's ``targets``: one core metric, or every other metric.
+
+    Reading it on an agent returns a read-only ``year → value`` (or
+    ``metric → year → value``) mapping copied from the table, so writing
+    to it raises ``TypeError`` instead of being silently lost; assigning
+    the attribute rebuilds the table.  On the class it reads as ``None``,
+    the default of the ``__init__`` keyword of the same name.
+    """
+
+    __slots__ = ("metric",)
+
+    def __init__(self, metric: Optional[str] = None) -> None:
+        self.metric = metric
+
+    def __get__(self, agent: Optional["StrategicPlanningAgent"], owner: Optional[type] = None) -> Any:
+        if agent is None:
+            return None
+        if self.metric is not None:
+            return types.MappingProxyType(agent.targets.column(self.metric))
+        return types.MappingProxyType({
+            metric: types.MappingProxyType(agent.targets.column(metric)) for metric in agent.targets.metrics
+            if metric not in _CORE_TARGETS.values()
+        })
+
+    def __set__(self, agent: "StrategicPlanningAgent", values: Mapping[Any, Any]) -> None:
+        if self.metric is not None:
+            agent._replace_targets({self.metric: values})
+        else:
+            agent._replace_targets({}, values)
+
+
+_TARGET_FIELDS: Tuple[str, ...] = ("targets", "horizon_years")
+
+#: Agent fields each plan section is built from.  Assigning one of these
+#: fields discards the cached sections that read it.
+_SECTION_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "executive_summary": ("company_name", "vision", "horizon_years"),
+    "company_profile": ("company_name", "mission", "vision", "core_values"),
+    "baseline_metrics": ("baseline_metrics",),
+    "strategic_targets": _TARGET_FIELDS,
+    "projections": _TARGET_FIELDS + ("periods_per_year",),
+    "winning_moves": ("revenue_moves", "profit_moves"),
+    "swot_analysis": ("swot",),
+    "milestones": ("start_year", "horizon_years", "fiscal_year_start_month"),
+    "recommended_kpis": (),
+    "service_recommendations": (),
+}
+
+#: Agent fields each narrative paragraph is rendered from.
+#: Every paragraph also depends on the agent's ``narrative_templates``.
+_PARAGRAPH_INPUTS: Dict[str, Tuple[str, ...]] = {
+    name: inputs + ("narrative_templates",)
+    for name, inputs in {
+        "intro": ("company_name", "mission", "vision", "core_values", "horizon_years"),
+        "targets": _TARGET_FIELDS,
+        "moves": ("revenue_moves", "profit_moves"),
+        "swot": ("swot",),
+        "execution": (),
+        "closing": ("company_name", "horizon_years"),
+    }.items()
+}
+
+_INPUT_FIELDS = frozenset(
+    name for inputs in (*_SECTION_INPUTS.values(), *_PARAGRAPH_INPUTS.values()) for name in inputs
+)
+
+
+def _fresh_containers(value: Any) -> Any:
+    """Return a copy of a cached plan section that callers may mutate.
+
+    The section's own list or dict is copied, along with the row dicts of
+    a list section; values shared with the agent's fields are not.
+    """
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def default_sections(periods_per_year: int = 1) -> List[str]:
+    """Return the plan sections built when no selection is made.
+
+    ``projections`` repeats ``strategic_targets`` at one period per year,
+    so it is only included by default at a finer granularity.
+
+    Args:
+        periods_per_year: The agent's ``periods_per_year``.
+    """
+    if periods_per_year > 1:
+        return list(PLAN_SECTIONS)
+    return [name for name in PLAN_SECTIONS if name != "projections"]
+
+
+def select_sections(sections: Optional[Iterable[str]] = None) -> List[str]:
+    """Validate a selection of plan sections.
+
+    Args:
+        sections: Section names to include, or ``None`` for every section.
+
+    Returns:
+        The selected section names in ``PLAN_SECTIONS`` order.
+
+    Raises:
+        ValueError: If any name is not in ``PLAN_SECTIONS``.
+    """
+    if sections is None:
+        return list(PLAN_SECTIONS)
+    requested = set(sections)
+    unknown = requested.difference(PLAN_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown plan section(s): {', '.join(sorted(unknown))}")
+    return [name for name in PLAN_SECTIONS if name in requested]
+
+
+@dataclass(slots=True)
 class StrategicPlanningAgent:
-    """Agent that builds a three‑year strategic plan for start‑ups.
+    """Agent that builds a multi‑year strategic plan for start‑ups.
 
     Attributes:
         company_name: Name of the business.
@@ -109,6 +481,33 @@ class StrategicPlanningAgent:
         baseline_metrics: Baseline metrics such as current revenue, customers,
             gross margin and any other relevant metrics.  These help establish
             realistic targets.
+        revenue_targets: Mapping of year → revenue goal; a read-only view
+            of ``targets``, as are ``customer_targets``, ``margin_targets``
+            and ``other_targets`` (metric → year → value).  Assign the
+            attribute, or call ``set_targets``, to change them.  Passed to
+            the constructor, they seed ``targets`` as ``set_targets`` does.
+        horizon_years: Number of years the plan covers.  Years inside the
+            horizon without a target are interpolated from the years that
+            have one.
+        periods_per_year: Granularity of the ``projections`` section, e.g.
+            12 for monthly projections.  At 1 the section is only built
+            when requested.
+        fiscal_year_start_month: Month (1–12) in which each plan year
+            starts; milestones are scheduled from the first day of that
+            month in ``start_year``.
+        narrative_templates: Templates ``generate_narrative()`` renders
+            its paragraphs from; see ``narrative_templates``.
+        targets: Per‑year targets as a ``TargetsTable``.
+
+    The agent uses ``__slots__`` and stores its targets as typed columns
+    to keep large in‑memory portfolios of agents small.
+
+    Built plan sections and narrative paragraphs are cached on the agent.
+    Assigning a field, directly or through a setter such as
+    ``set_targets``, ``identify_winning_moves`` or ``create_swot``, marks
+    only the sections and paragraphs that read it as dirty; everything else
+    is reused by the next ``build_plan()`` or ``generate_narrative()``.
+    Call ``mark_dirty`` after mutating a field's value in place.
     """
 
     company_name: str
@@ -117,15 +516,90 @@ class StrategicPlanningAgent:
     core_values: List[str]
     baseline_metrics: Dict[str, Any]
 
-    revenue_targets: Dict[int, float] = field(default_factory=dict)
-    customer_targets: Dict[int, int] = field(default_factory=dict)
-    margin_targets: Dict[int, float] = field(default_factory=dict)
-    other_targets: Dict[str, Dict[int, float]] = field(default_factory=dict)
+    revenue_targets: InitVar[Optional[Dict[int, float]]] = _TargetsView("revenue")
+    customer_targets: InitVar[Optional[Dict[int, int]]] = _TargetsView("customers")
+    margin_targets: InitVar[Optional[Dict[int, float]]] = _TargetsView("gross_margin")
+    other_targets: InitVar[Optional[Dict[str, Dict[int, float]]]] = _TargetsView()
     revenue_moves: List[str] = field(default_factory=list)
     profit_moves: List[str] = field(default_factory=list)
     swot: Optional[Dict[str, List[str]]] = None
 
     start_year: int = field(default_factory=lambda: datetime.datetime.now().year)
+    horizon_years: int = DEFAULT_HORIZON_YEARS
+    periods_per_year: int = 1
+    fiscal_year_start_month: int = 1
+    narrative_templates: NarrativeTemplates = field(default=DEFAULT_TEMPLATES, repr=False, compare=False)
+    targets: TargetsTable = field(default_factory=TargetsTable)
+
+    # Built sections and paragraphs whose inputs have not changed since,
+    # created on first use.
+    _sections: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _paragraphs: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _INPUT_FIELDS:
+            self.mark_dirty(name)
+
+    def mark_dirty(self, *fields: str) -> None:
+        """Discard cached sections and paragraphs built from ``fields``.
+
+        Assigning a field does this automatically; call it yourself after
+        mutating a field's value in place, e.g. appending to
+        ``revenue_moves``.
+
+        Args:
+            fields: Names of the changed agent fields.  With no names every
+                cached section and paragraph is discarded.
+        """
+        changed = set(fields)
+        for cache_name, inputs in (("_sections", _SECTION_INPUTS), ("_paragraphs", _PARAGRAPH_INPUTS)):
+            # The caches do not exist until something is built, nor while
+            # ``__init__`` is still assigning the fields.
+            cache = getattr(self, cache_name, None)
+            if not cache:
+                continue
+            if not changed:
+                cache.clear()
+                continue
+            for name, names in inputs.items():
+                if changed.intersection(names):
+                    cache.pop(name, None)
+
+    def __post_init__(
+        self,
+        revenue_targets: Optional[Dict[int, float]],
+        customer_targets: Optional[Dict[int, int]],
+        margin_targets: Optional[Dict[int, float]],
+        other_targets: Optional[Dict[str, Dict[int, float]]],
+    ) -> None:
+        core = {
+            metric: values
+            for metric, values in zip(_CORE_TARGETS.values(), (revenue_targets, customer_targets, margin_targets))
+            if values is not None
+        }
+        if core or other_targets is not None:
+            self._replace_targets(core, other_targets)
+
+    def _replace_targets(
+        self, core: Dict[str, Mapping[int, Any]], others: Optional[Dict[str, Mapping[int, Any]]] = None
+    ) -> None:
+        """Rebuild ``targets`` with new columns.
+
+        Args:
+            core: New values for any of the revenue, customer and margin
+                metrics; the others are kept.  These columns always come
+                first, so that every targets row carries them.
+            others: New values for every other metric, or ``None`` to keep
+                the current ones.
+        """
+        current = self.targets.to_mappings()
+        if others is None:
+            others = {metric: values for metric, values in current.items() if metric not in _CORE_TARGETS.values()}
+        self.targets = TargetsTable.from_mappings({
+            **{metric: core.get(metric, current.get(metric, {})) for metric in _CORE_TARGETS.values()},
+            **others,
+        })
 
     def set_targets(
         self,
@@ -134,10 +608,12 @@ class StrategicPlanningAgent:
         margin_targets: Dict[int, float],
         other_targets: Optional[Dict[str, Dict[int, float]]] = None,
     ) -> None:
-        """Define numeric targets for the three‑year plan.
+        """Define numeric targets for the plan.
 
         You should provide a revenue target, customer target and gross margin
-        target for each year in the planning horizon.  Additional targets
+        target for at least the first and last years of the planning
+        horizon; years in between without a target are interpolated.
+        Additional targets
         (e.g. net profit, EBITDA) can be supplied via ``other_targets``.
 
         Args:
@@ -146,11 +622,10 @@ class StrategicPlanningAgent:
             margin_targets: Mapping of year → gross margin (as a decimal, e.g. 0.35).
             other_targets: Optional mapping of metric name → year → value.
         """
-        self.revenue_targets = revenue_targets
-        self.customer_targets = customer_targets
-        self.margin_targets = margin_targets
-        if other_targets:
-            self.other_targets = other_targets
+        self._replace_targets(
+            {"revenue": revenue_targets, "customers": customer_targets, "gross_margin": margin_targets},
+            other_targets or None,
+        )
 
     def identify_winning_moves(self, revenue_moves: List[str], profit_moves: List[str]) -> None:
         """Record strategic initiatives (Winning Moves) to drive revenue and profit.
@@ -247,13 +722,14 @@ class StrategicPlanningAgent:
         }
 
     def generate_milestones(self, months_per_milestone: int = 6) -> List[Tuple[datetime.date, str]]:
-        """Generate high‑level milestones over the three‑year period.
+        """Generate high‑level milestones over the planning horizon.
 
         A timeline is important because it shows when tasks should be
         completed and in what order【920896470864837†L489-L497】.  This method
         automatically produces semiannual milestones (or another interval
         defined by ``months_per_milestone``) starting from the first month of
-        the plan.
+        the plan's first (fiscal) year.  Milestones fall on calendar month
+        boundaries; see ``milestone_schedule``.
 
         Args:
             months_per_milestone: Number of months between milestones.  The
@@ -263,15 +739,12 @@ class StrategicPlanningAgent:
             A list of tuples, each containing a date and a descriptive
             milestone label.
         """
-        milestones: List[Tuple[datetime.date, str]] = []
-        start_date = datetime.date(self.start_year, 1, 1)
-        total_months = 36  # three years
-        for i in range(0, total_months, months_per_milestone):
-            date = start_date + datetime.timedelta(days=30 * i)
-            year_offset = (date.year - start_date.year) + 1
-            milestone_name = f"Milestone {i // months_per_milestone + 1} – Year {year_offset}"
-            milestones.append((date, milestone_name))
-        return milestones
+        return list(self._milestone_schedule(months_per_milestone))
+
+    def _milestone_schedule(self, months_per_milestone: int = 6) -> Tuple[Tuple[datetime.date, str], ...]:
+        """Return the shared, memoized milestone schedule for this agent's plan."""
+        start = datetime.date(self.start_year, self.fiscal_year_start_month, 1)
+        return milestone_schedule(start, months_per_milestone, self.horizon_years)
 
     def recommend_services(self) -> Dict[str, Any]:
         """Suggest external service providers for core business functions.
@@ -404,105 +877,319 @@ class StrategicPlanningAgent:
             ]
         }
 
-    def build_plan(self) -> Dict[str, Any]:
+    def _horizon_label(self) -> str:
+        """Return the horizon as an adjective, e.g. ``"three‑year"``."""
+        years = self.horizon_years
+        word = _NUMBER_WORDS[years] if 0 <= years < len(_NUMBER_WORDS) else str(years)
+        return f"{word}‑year"
+
+    def horizon(self) -> List[int]:
+        """Return the years covered by the plan.
+
+        The horizon starts at the earliest target year, or at
+        ``start_year`` when no targets are set, and spans
+        ``horizon_years`` years.
+        """
+        years = [year for year in self.targets.years if isinstance(year, int)]
+        return _year_list(min(years) if years else self.start_year, self.horizon_years)
+
+    def _target_anchors(self) -> Dict[str, Dict[int, Any]]:
+        """Return each metric's numeric targets, keyed by year."""
+        return {
+            metric: {year: value for year, value in self.targets.column(metric).items() if _is_number(value)}
+            for metric in self.targets.metrics
+        }
+
+    def _targets_summary(self) -> List[Dict[str, Any]]:
+        """Build the per‑year targets summary used by the plan and narrative.
+
+        Every year in the horizon gets a row.  Targets missing from a row
+        are interpolated from the metric's other years, rounded to whole
+        numbers for metrics whose targets are all integers.
+        """
+        targets_summary = self.targets.rows(_CORE_TARGETS.values())
+        anchors = self._target_anchors()
+        if any(anchors.values()):
+            known = {row["year"] for row in targets_summary}
+            missing = [{"year": year} for year in self.horizon() if year not in known]
+            if missing:
+                targets_summary = sorted(targets_summary + missing, key=lambda row: row["year"])
+        metrics = [*_CORE_TARGETS.values(), *(m for m in self.targets.metrics if m not in _CORE_TARGETS.values())]
+        for metric in metrics:
+            metric_anchors = anchors.get(metric)
+            gaps = [row for row in targets_summary if row.get(metric) is None]
+            if not gaps or not metric_anchors:
+                # A table assigned directly may lack some of the core metrics.
+                for row in gaps:
+                    row[metric] = None
+                continue
+            integral = all(type(value) is int for value in metric_anchors.values())
+            for row, value in zip(gaps, interpolate(metric_anchors, [row["year"] for row in gaps])):
+                row[metric] = round(value) if integral else value
+        return targets_summary
+
+    def project_targets(self, periods_per_year: int = 12) -> List[Dict[str, Any]]:
+        """Project the targets across the horizon at a finer granularity.
+
+        Each metric is linearly interpolated between its target years, and
+        held at the nearest target outside them.  Period ``p`` of a year
+        sits ``(p - 1) / periods_per_year`` of the way to the next year, so
+        the first period of each target year carries that year's target.
+
+        Args:
+            periods_per_year: Number of periods per year, e.g. 12 for
+                monthly or 4 for quarterly projections.
+
+        Returns:
+            One ``{"year": ..., "period": ..., metric: value}`` dict per
+            period, or an empty list when no targets are set.
+        """
+        anchors = {metric: values for metric, values in self._target_anchors().items() if values}
+        if not anchors:
+            return []
+        periods = [(year, period) for year in self.horizon() for period in range(1, periods_per_year + 1)]
+        points = [year + (period - 1) / periods_per_year for year, period in periods]
+        projections = [{"year": year, "period": period} for year, period in periods]
+        for metric, metric_anchors in anchors.items():
+            integral = all(type(value) is int for value in metric_anchors.values())
+            for row, value in zip(projections, interpolate(metric_anchors, points)):
+                row[metric] = round(value) if integral else value
+        return projections
+
+    def build_plan(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """Assemble the strategic plan into a structured dictionary.
 
+        Args:
+            sections: Optional names of the plan sections to include (see
+                ``PLAN_SECTIONS``).  Sections that are not requested are
+                neither computed nor included.  By default every section is
+                built, except ``projections`` when ``periods_per_year`` is
+                1; see ``default_sections``.
+
         Returns:
             A nested dictionary representing the plan.  The structure
             includes an executive summary, company profile, mission/vision
             statements, core values, strategic targets, winning moves, SWOT
             analysis, milestones, recommended KPIs and services.  This plan
             can be further formatted into a report or presentation as needed.
+
+        Raises:
+            ValueError: If ``sections`` names an unknown section.
+        """
+        return dict(self.iter_plan_sections(sections))
+
+    def iter_plan_sections(self, sections: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, Any]]:
+        """Yield the plan one section at a time.
+
+        Each section is built only when the iterator reaches it, so callers
+        can stream the plan as it is produced.  Sections whose inputs have
+        not changed since they were last built are reused, and yielded as
+        fresh containers, so mutating a returned section leaves the agent's
+        cache intact.
+
+        Args:
+            sections: Optional names of the plan sections to include; see
+                ``build_plan``.
+
+        Yields:
+            ``(name, value)`` pairs in ``PLAN_SECTIONS`` order.
+
+        Raises:
+            ValueError: If ``sections`` names an unknown section.
         """
-        years = sorted(set(
-            list(self.revenue_targets.keys()) +
-            list(self.customer_targets.keys()) +
-            list(self.margin_targets.keys())
-        ))
-        # Build annual targets summary
-        targets_summary = []
-        for year in years:
-            targets_summary.append({
-                "year": year,
-                "revenue": self.revenue_targets.get(year),
-                "customers": self.customer_targets.get(year),
-                "gross_margin": self.margin_targets.get(year),
-                **{metric: values.get(year) for metric, values in self.other_targets.items()}
-            })
-        # Compose plan
+        names = default_sections(self.periods_per_year) if sections is None else select_sections(sections)
+        for name in names:
+            yield name, _fresh_containers(self._section(name))
+
+    def _section(self, name: str) -> Any:
+        """Return the named plan section, building it only if it is dirty.
+
+        Cached sections are returned as they are; copy them before handing
+        them to callers outside the agent.
+        """
+        build = getattr(self, f"_section_{name}")
+        if not _SECTION_INPUTS[name]:
+            # Static catalogs are cheap to rebuild; caching a copy on every
+            # agent would dominate its memory footprint.
+            return build()
+        if self._sections is None:
+            self._sections = {}
+        try:
+            return self._sections[name]
+        except KeyError:
+            value = self._sections[name] = build()
+            return value
+
+    # Plan section builders, one per entry in ``PLAN_SECTIONS``.
+
+    def _section_executive_summary(self) -> str:
+        return f"{self.company_name} aims to realise its vision of {self.vision} by executing a {self._horizon_label()} plan built around SMART goals, clear milestones and disciplined measurement."
+
+    def _section_company_profile(self) -> Dict[str, Any]:
         return {
-            "executive_summary": f"{self.company_name} aims to realise its vision of {self.vision} by executing a three‑year plan built around SMART goals, clear milestones and disciplined measurement.",
-            "company_profile": {
-                "name": self.company_name,
-                "mission": self.mission,
-                "vision": self.vision,
-                "core_values": self.core_values,
-            },
-            "baseline_metrics": self.baseline_metrics,
-            "strategic_targets": targets_summary,
-            "winning_moves": {
-                "revenue_moves": self.revenue_moves,
-                "profit_moves": self.profit_moves,
-            },
-            "swot_analysis": self.swot,
-            "milestones": [
-                {"date": date.isoformat(), "description": name}
-                for date, name in self.generate_milestones()
-            ],
-            "recommended_kpis": self.suggest_kpis(),
-            "service_recommendations": self.recommend_services(),
+            "name": self.company_name,
+            "mission": self.mission,
+            "vision": self.vision,
+            "core_values": self.core_values,
+        }
+
+    def _section_baseline_metrics(self) -> Dict[str, Any]:
+        return self.baseline_metrics
+
+    def _section_strategic_targets(self) -> List[Dict[str, Any]]:
+        return self._targets_summary()
+
+    def _section_projections(self) -> List[Dict[str, Any]]:
+        return self.project_targets(self.periods_per_year)
+
+    def _section_winning_moves(self) -> Dict[str, List[str]]:
+        return {
+            "revenue_moves": self.revenue_moves,
+            "profit_moves": self.profit_moves,
         }
 
+    def _section_swot_analysis(self) -> Optional[Dict[str, List[str]]]:
+        return self.swot
+
+    def _section_milestones(self) -> List[Dict[str, str]]:
+        return [
+            {"date": date.isoformat(), "description": name}
+            for date, name in self._milestone_schedule()
+        ]
+
+    def _section_recommended_kpis(self) -> Dict[str, List[str]]:
+        return self.suggest_kpis()
+
+    def _section_service_recommendations(self) -> Dict[str, Any]:
+        return self.recommend_services()
+
     def generate_narrative(self) -> str:
         """Generate a strategic narrative summarizing the plan.
 
         The narrative tells the story of where the company is today, where it
-        wants to be in three years and how it will get there.  It weaves
+        wants to be by the end of the planning horizon and how it will get
+        there.  It weaves
         together the mission and vision, highlights key targets and winning
         moves, reflects on the SWOT analysis, and underscores the importance
-        of data‑driven execution.
+        of data‑driven execution.  The paragraphs are rendered from the
+        agent's ``narrative_templates``; targets without a value render as
+        that set's ``missing`` text.
 
         Returns:
             A multi‑paragraph narrative.
         """
-        plan = self.build_plan()
-        # Compose narrative sections
-        intro = (
-            f"{self.company_name} exists to {self.mission}.  Our vision is to {self.vision}. "
-            "To achieve this ambition, we have created a three‑year strategic plan grounded in our core values: "
-            + ", ".join(self.core_values) + "."
-        )
-        targets_lines = []
-        for t in plan["strategic_targets"]:
-            lines = [
-                f"In {t['year']}, we aim to generate ${t['revenue']:,.0f} in revenue and serve {t['customers']} customers, achieving a gross margin of {t['gross_margin']*100:.0f}%"
-            ]
-            for metric, value in t.items():
-                if metric not in {"year", "revenue", "customers", "gross_margin"}:
-                    lines.append(f"with {metric.replace('_', ' ')} of ${value:,.0f}")
-            targets_lines.append(" ".join(lines) + ".")
-        targets_paragraph = " ".join(targets_lines)
-        moves_paragraph = (
-            "To realise these goals, we will pursue a focused set of Winning Moves. "
-            "On the revenue side we will: " + "; ".join(self.revenue_moves) + ". "
-            "On the profitability side we will: " + "; ".join(self.profit_moves) + "."
-        )
-        swot_paragraph = (
-            "Our SWOT analysis reveals that our strengths—" + ", ".join(self.swot.get("strengths", [])) + 
-            "—position us well to capitalise on opportunities such as " + ", ".join(self.swot.get("opportunities", [])) + 
-            ".  However, we must mitigate weaknesses like " + ", ".join(self.swot.get("weaknesses", [])) + 
-            " and guard against threats such as " + ", ".join(self.swot.get("threats", [])) + "."
-        )
-        execution_paragraph = (
-            "We will execute against clear milestones every six months and monitor key performance indicators across finance, customers, marketing, operations and HR. "
-            "Our plan leverages best‑in‑class service providers for legal, accounting, payroll, marketing and AI‑enabled HR to build a strong operational foundation."
-        )
-        closing = (
-            "By aligning our team around this roadmap and measuring our progress relentlessly, "
-            f"{self.company_name} will be well positioned to achieve its three‑year objectives and move closer to its long‑term vision."
-        )
-        return "\n\n".join([intro, targets_paragraph, moves_paragraph, swot_paragraph, execution_paragraph, closing])
+        return self._render_narrative(self._section("strategic_targets"))
+
+    def build_plan_and_narrative(self, sections: Optional[Iterable[str]] = None) -> Tuple[Dict[str, Any], str]:
+        """Build the plan and its narrative in a single pass.
+
+        Equivalent to calling ``build_plan()`` followed by
+        ``generate_narrative()``, except that every plan section is
+        assembled once and the narrative is rendered from the plan that
+        was just built.
 
+        Args:
+            sections: Optional plan sections to include; see ``build_plan``.
+                The narrative is always rendered in full.
+
+        Returns:
+            A ``(plan, narrative)`` tuple.
+        """
+        plan = self.build_plan(sections)
+        # The cached section, built at most once whether or not the plan
+        # includes it.
+        return plan, self._render_narrative(self._section("strategic_targets"))
+
+    def iter_narrative_paragraphs(
+        self, targets_summary: Optional[List[Dict[str, Any]]] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield the narrative one paragraph at a time.
+
+        Each paragraph is rendered only when the iterator reaches it, so
+        callers can stream the narrative as it is produced.  Paragraphs
+        whose inputs have not changed since they were last rendered are
+        reused.  Paragraphs missing from ``narrative_templates`` are
+        skipped.
+
+        Args:
+            targets_summary: An already built ``strategic_targets`` section.
+                If omitted the agent's cached section is used, building it
+                if needed.
+
+        Yields:
+            ``(name, text)`` pairs in ``NARRATIVE_PARAGRAPHS`` order.
+        """
+        if targets_summary is None:
+            targets_summary = self._section("strategic_targets")
+        # Only a targets summary from the agent's own cache is known to match
+        # its current targets; a targets paragraph rendered from any other
+        # summary is not cached.
+        if self._paragraphs is None:
+            self._paragraphs = {}
+        own_summary = self._sections is not None and targets_summary is self._sections.get("strategic_targets")
+        renderers = self.narrative_templates.renderers
+        context = None
+        for name in NARRATIVE_PARAGRAPHS:
+            render = renderers.get(name)
+            if render is None:
+                continue
+            cacheable = own_summary or name != "targets"
+            text = self._paragraphs.get(name) if cacheable else None
+            if text is None:
+                if context is None:
+                    context = self.narrative_context(targets_summary)
+                text = render(context)
+                if cacheable:
+                    self._paragraphs[name] = text
+            yield name, text
+
+    def narrative_context(self, targets_summary: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Return the fields the narrative templates are rendered from.
+
+        Args:
+            targets_summary: An already built ``strategic_targets`` section;
+                see ``iter_narrative_paragraphs``.
+
+        Returns:
+            A mapping of template field name → value.
+        """
+        if targets_summary is None:
+            targets_summary = self._section("strategic_targets")
+        # ``swot`` stays ``None`` until ``create_swot`` is called.
+        swot = self.swot or {}
+        return {
+            "company_name": self.company_name,
+            "mission": self.mission,
+            "vision": self.vision,
+            "core_values": self.core_values,
+            "horizon_label": self._horizon_label(),
+            "targets": targets_summary,
+            "revenue_moves": self.revenue_moves,
+            "profit_moves": self.profit_moves,
+            "strengths": swot.get("strengths", []),
+            "weaknesses": swot.get("weaknesses", []),
+            "opportunities": swot.get("opportunities", []),
+            "threats": swot.get("threats", []),
+        }
+
+    def _render_narrative(self, targets_summary: List[Dict[str, Any]]) -> str:
+        """Render the narrative text from an already built targets summary."""
+        return "\n\n".join(text for _, text in self.iter_narrative_paragraphs(targets_summary))
+
+
+def render_narratives(agents: Iterable[StrategicPlanningAgent]) -> Iterator[str]:
+    """Render the narratives of many agents.
+
+    Each agent's template set renders its whole narrative with a single
+    compiled function.  Unlike ``generate_narrative()`` the paragraphs
+    are not cached on the agents, which keeps large batches from growing
+    every agent's memory.
+
+    Yields:
+        Each agent's narrative, in order.
+    """
+    for agent in agents:
+        yield agent.narrative_templates.narrative_renderer(NARRATIVE_PARAGRAPHS)(agent.narrative_context())
 
 if __name__ == "__main__":
     # Example execution for demonstration
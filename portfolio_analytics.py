@@ -0,0 +1,292 @@
+"""
+Vectorized target analytics across a portfolio of companies.
+
+Looping over thousands of ``StrategicPlanningAgent`` instances in Python
+to compare their targets is slow.  ``PortfolioTargets`` loads the targets
+and baseline metrics of many agents into NumPy arrays once, with one row
+per company and one column per year, and then computes growth rates,
+margin dollars, baseline multiples and fine-grained projections for the
+whole portfolio in single vectorized passes.
+
+Missing targets and baseline metrics are ``NaN``, and any figure derived
+from a missing or non-positive input is ``NaN`` as well.
+
+NumPy is required for this module but not for the planning API itself.
+
+Example usage::
+
+    from portfolio_analytics import PortfolioTargets
+    portfolio = PortfolioTargets.from_agents(agents)
+    revenue_cagr = portfolio.cagr("revenue")
+    margin_dollars = portfolio.margin_dollars()
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("portfolio_analytics requires NumPy; install it with `pip install numpy`.") from e
+
+from planning_agent import StrategicPlanningAgent, TargetsTable
+
+
+#: Baseline metric that each target metric is measured against.
+BASELINE_KEYS: Dict[str, str] = {
+    "revenue": "annual_revenue",
+    "customers": "customers",
+    "gross_margin": "gross_margin",
+}
+
+
+def _float_column(values: List[Any]) -> "np.ndarray":
+    """Convert values to a float array, with ``NaN`` for anything non-numeric."""
+    try:
+        # NumPy converts ``None`` to ``NaN`` for float arrays.
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.array([
+            value if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+            for value in values
+        ], dtype=float)
+
+
+@dataclass
+class PortfolioTargets:
+    """Targets and baseline metrics of many companies as NumPy arrays.
+
+    Attributes:
+        company_names: Company name for each row.
+        years: Target years, ascending, one per column.
+        targets: Mapping of metric name → ``(companies, years)`` array.
+        baseline: Mapping of baseline metric name → ``(companies,)`` array.
+    """
+
+    company_names: List[str]
+    years: "np.ndarray"
+    targets: Dict[str, "np.ndarray"] = field(default_factory=dict)
+    baseline: Dict[str, "np.ndarray"] = field(default_factory=dict)
+
+    @classmethod
+    def from_agents(
+        cls, agents: Iterable[StrategicPlanningAgent], baseline_keys: Optional[Sequence[str]] = None
+    ) -> "PortfolioTargets":
+        """Load the targets and baseline metrics of ``agents``.
+
+        Agents whose targets share the same years and metrics are copied
+        into the arrays together, straight from their ``TargetsTable``
+        buffers.
+
+        Args:
+            agents: The agents to load, one row each.
+            baseline_keys: Baseline metrics to load.  By default every key
+                found in any agent's ``baseline_metrics`` is loaded.
+
+        Returns:
+            A ``PortfolioTargets`` covering every year and metric that
+            appears in any agent's targets.
+        """
+        names: List[str] = []
+        baselines: List[Dict[str, Any]] = []
+        # (years, metrics) layout → (rows, values, present) of the agents using it.
+        layouts: Dict[Tuple[Tuple[Any, ...], Tuple[str, ...]], Tuple[List[int], List[Any], List[bytes]]] = \
+            defaultdict(lambda: ([], [], []))
+        # Tables holding non-numeric values, loaded entry by entry.
+        irregular: List[Tuple[int, TargetsTable]] = []
+        for row, agent in enumerate(agents):
+            names.append(agent.company_name)
+            baselines.append(agent.baseline_metrics)
+            table = agent.targets
+            buffers = table.buffers()
+            if buffers is None:
+                irregular.append((row, table))
+                continue
+            rows, values, present = layouts[tuple(table.years), table.metrics]
+            rows.append(row)
+            values.append(buffers[0])
+            present.append(buffers[1])
+
+        all_years = sorted(
+            {year for years, _ in layouts for year in years}
+            | {year for _, table in irregular for year in table.years}
+        )
+        metrics: Dict[str, None] = {}
+        for _, layout_metrics in layouts:
+            metrics.update(dict.fromkeys(layout_metrics))
+        for _, table in irregular:
+            metrics.update(dict.fromkeys(table.metrics))
+
+        count = len(names)
+        year_index = {year: i for i, year in enumerate(all_years)}
+        targets = {metric: np.full((count, len(all_years)), np.nan) for metric in metrics}
+        for (years, layout_metrics), (rows, values, present) in layouts.items():
+            if not years:
+                continue
+            shape = (len(rows), len(layout_metrics), len(years))
+            block = np.frombuffer(b"".join(values), dtype=np.float64).reshape(shape).copy()
+            block[np.frombuffer(b"".join(present), dtype=np.uint8).reshape(shape) == 0] = np.nan
+            row_index = np.asarray(rows)[:, None]
+            column_index = np.array([year_index[year] for year in years])[None, :]
+            for i, metric in enumerate(layout_metrics):
+                targets[metric][row_index, column_index] = block[:, i, :]
+        for row, table in irregular:
+            for metric, column in table.to_mappings().items():
+                for year, value in column.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        targets[metric][row, year_index[year]] = value
+
+        if baseline_keys is None:
+            keys: Dict[str, None] = {}
+            for metrics_ in baselines:
+                keys.update(dict.fromkeys(metrics_))
+            baseline_keys = list(keys)
+        baseline = {
+            key: _float_column([metrics_.get(key) for metrics_ in baselines])
+            for key in baseline_keys
+        }
+        return cls(names, np.array(all_years), targets, baseline)
+
+    def _target(self, metric: str) -> "np.ndarray":
+        try:
+            return self.targets[metric]
+        except KeyError:
+            return np.full((len(self.company_names), len(self.years)), np.nan)
+
+    def _baseline(self, metric: str, baseline_key: Optional[str]) -> "np.ndarray":
+        key = baseline_key or BASELINE_KEYS.get(metric, metric)
+        try:
+            return self.baseline[key]
+        except KeyError:
+            return np.full(len(self.company_names), np.nan)
+
+    def yoy_growth(self, metric: str) -> "np.ndarray":
+        """Year-over-year growth of a target metric.
+
+        Returns:
+            A ``(companies, years - 1)`` array; column ``i`` is the growth
+            from ``years[i]`` to ``years[i + 1]`` as a decimal.
+        """
+        values = self._target(metric)
+        previous, current = values[:, :-1], values[:, 1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(previous > 0, current / previous - 1.0, np.nan)
+
+    def cagr(self, metric: str) -> "np.ndarray":
+        """Compound annual growth rate of a target metric.
+
+        The rate runs from each company's first to its last year with a
+        target, so gaps and differing horizons are allowed.
+
+        Returns:
+            A ``(companies,)`` array of decimal growth rates; ``NaN`` where
+            fewer than two years have targets.
+        """
+        values = self._target(metric)
+        count = len(self.company_names)
+        if not values.shape[1]:
+            return np.full(count, np.nan)
+        known = ~np.isnan(values)
+        first = np.argmax(known, axis=1)
+        last = values.shape[1] - 1 - np.argmax(known[:, ::-1], axis=1)
+        rows = np.arange(count)
+        start, end = values[rows, first], values[rows, last]
+        periods = (self.years[last] - self.years[first]).astype(float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = np.power(end / start, 1.0 / periods) - 1.0
+        return np.where((periods > 0) & (start > 0) & (end >= 0), growth, np.nan)
+
+    def margin_dollars(self) -> "np.ndarray":
+        """Gross margin in currency implied by the revenue and margin targets.
+
+        Returns:
+            A ``(companies, years)`` array of ``revenue * gross_margin``.
+        """
+        return self._target("revenue") * self._target("gross_margin")
+
+    def baseline_multiples(self, metric: str, baseline_key: Optional[str] = None) -> "np.ndarray":
+        """Each year's target as a multiple of the company's baseline.
+
+        Args:
+            metric: Target metric, e.g. ``"revenue"``.
+            baseline_key: Baseline metric to divide by.  Defaults to the
+                entry in ``BASELINE_KEYS``, or ``metric`` itself.
+
+        Returns:
+            A ``(companies, years)`` array; ``NaN`` where the baseline is
+            missing or not positive.
+        """
+        baseline = self._baseline(metric, baseline_key)[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(baseline > 0, self._target(metric) / baseline, np.nan)
+
+    def project(self, metric: str, periods_per_year: int = 12) -> "np.ndarray":
+        """Project a target metric across the portfolio's years at a finer granularity.
+
+        Works like ``StrategicPlanningAgent.project_targets`` for every
+        company at once: values are linearly interpolated between each
+        company's target years and held at the nearest target outside them.
+
+        Args:
+            metric: Target metric, e.g. ``"revenue"``.
+            periods_per_year: Number of periods per year, e.g. 12 for
+                monthly projections.
+
+        Returns:
+            A ``(companies, span * periods_per_year)`` array, where ``span``
+            covers every year from the first to the last of ``years``.
+            Column ``i`` is period ``i % periods_per_year + 1`` of year
+            ``years[0] + i // periods_per_year``.  Rows without any target
+            are ``NaN``.
+        """
+        values = self._target(metric)
+        count, width = values.shape
+        if not width:
+            return np.full((count, 0), np.nan)
+        years = self.years.astype(float)
+        span = int(self.years[-1] - self.years[0]) + 1
+        points = years[0] + np.arange(span * periods_per_year) / periods_per_year
+
+        # For every year column, the nearest column at or before it (and
+        # after it) that holds a target; -1 (or ``width``) where none does.
+        known = ~np.isnan(values)
+        columns = np.arange(width)
+        previous = np.maximum.accumulate(np.where(known, columns, -1), axis=1)
+        following = np.minimum.accumulate(np.where(known, columns, width)[:, ::-1], axis=1)[:, ::-1]
+        following = np.concatenate([following, np.full((count, 1), width)], axis=1)
+
+        # Year column at or before each point, then the anchors around it.
+        base = np.searchsorted(years, points, side="right") - 1
+        low = previous[:, base]
+        high = following[:, base + 1]
+        low = np.where(low < 0, high, low)
+        high = np.where(high >= width, low, high)
+        valid = low < width
+        low, high = np.where(valid, low, 0), np.where(valid, high, 0)
+
+        rows = np.arange(count)[:, None]
+        low_value, high_value = values[rows, low], values[rows, high]
+        low_year, high_year = years[low], years[high]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.where(high_year > low_year, (points - low_year) / (high_year - low_year), 0.0)
+        fraction = np.clip(fraction, 0.0, 1.0)
+        return np.where(valid, low_value + (high_value - low_value) * fraction, np.nan)
+
+    def summary(self) -> Dict[str, "np.ndarray"]:
+        """Compute every analytic for the core revenue, customer and margin targets.
+
+        Returns:
+            A mapping with ``<metric>_cagr``, ``<metric>_yoy_growth`` and
+            ``<metric>_baseline_multiple`` arrays for each metric in
+            ``BASELINE_KEYS``, plus ``margin_dollars``.
+        """
+        result: Dict[str, "np.ndarray"] = {}
+        for metric in BASELINE_KEYS:
+            result[f"{metric}_cagr"] = self.cagr(metric)
+            result[f"{metric}_yoy_growth"] = self.yoy_growth(metric)
+            result[f"{metric}_baseline_multiple"] = self.baseline_multiples(metric)
+        result["margin_dollars"] = self.margin_dollars()
+        return result
@@ -0,0 +1,183 @@
+"""
+Monte Carlo simulation of winning-move revenue against the plan's targets.
+
+A winning move's ``projected_revenue`` is an estimate, not a promise.
+``simulate_revenue`` treats each projection as a triangular distribution
+between a low, base and high case and draws the combined revenue of all
+moves many times over.  Each move is assumed to ramp up linearly over the
+planning horizon, reaching its full annual revenue in the final year, on
+top of the company's baseline revenue.  The result reports the 10th, 50th
+and 90th percentile of each year's revenue alongside that year's target,
+and the share of draws that meet the target.
+
+Every year's revenue is the baseline plus a fixed fraction of the same
+total draw, so one vectorized pass over the draws gives the percentiles
+for every year.  Pass a ``seed`` for reproducible results.
+
+NumPy is required for this module but not for the planning API itself.
+
+Example usage::
+
+    from revenue_simulation import MoveProjection, simulate_revenue
+    moves = [MoveProjection("Launch subscription", low=100_000, base=250_000, high=400_000)]
+    result = simulate_revenue(moves, years=[2025, 2026, 2027],
+                              targets=[1_200_000, 1_400_000, 1_600_000],
+                              baseline_revenue=1_000_000, seed=7)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("revenue_simulation requires NumPy; install it with `pip install numpy`.") from e
+
+
+#: Number of draws used when none is given.
+DEFAULT_DRAWS = 100_000
+
+#: Percentiles reported for each year.
+PERCENTILES = (10, 50, 90)
+
+
+def _number(value: Any, name: str) -> float:
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError(f"{name} must be a number")
+    return float(value)
+
+
+@dataclass(frozen=True)
+class MoveProjection:
+    """Annual revenue projection of one winning move.
+
+    Attributes:
+        description: The move's description.
+        low: Pessimistic annual revenue once the move is fully realised.
+        base: Most likely annual revenue.
+        high: Optimistic annual revenue.
+    """
+
+    description: str
+    low: float
+    base: float
+    high: float
+
+    def __post_init__(self) -> None:
+        if not self.low <= self.base <= self.high:
+            raise ValueError(f"Projection for {self.description!r} must satisfy low <= base <= high")
+
+    @classmethod
+    def from_payload(cls, move: Mapping[str, Any]) -> Optional["MoveProjection"]:
+        """Read a projection from a winning move in the API payload format.
+
+        ``projected_revenue`` may be a number (a certain outcome), an
+        object with ``low``, ``base`` and ``high`` cases, or an object with
+        a ``base`` and a ``confidence`` between 0 and 1.  A confidence of
+        ``c`` spreads the outcome evenly from ``base * c`` to
+        ``base * (2 - c)``.
+
+        Returns:
+            The projection, or ``None`` if the move has no
+            ``projected_revenue``.
+
+        Raises:
+            ValueError: If the projection is malformed.
+        """
+        description = str(move.get("description", ""))
+        projection = move.get("projected_revenue")
+        if projection is None:
+            return None
+        if not isinstance(projection, Mapping):
+            base = _number(projection, "projected_revenue")
+            return cls(description, base, base, base)
+        base = _number(projection.get("base"), "projected_revenue.base")
+        if "confidence" in projection:
+            confidence = _number(projection["confidence"], "projected_revenue.confidence")
+            if not 0.0 <= confidence <= 1.0:
+                raise ValueError("projected_revenue.confidence must be between 0 and 1")
+            spread = abs(base) * (1.0 - confidence)
+            return cls(description, base - spread, base, base + spread)
+        low = _number(projection.get("low", base), "projected_revenue.low")
+        high = _number(projection.get("high", base), "projected_revenue.high")
+        return cls(description, low, base, high)
+
+
+def draw_move_revenue(moves: Sequence[MoveProjection], draws: int = DEFAULT_DRAWS,
+                      rng: Optional["np.random.Generator"] = None) -> "np.ndarray":
+    """Draw the combined full-run-rate revenue of ``moves``.
+
+    Moves are drawn one at a time and added to a running total, so memory
+    stays at two ``(draws,)`` arrays however many moves there are.
+
+    Args:
+        moves: The projections to combine.
+        draws: Number of draws.
+        rng: Random generator to draw from; a fresh unseeded one by default.
+
+    Returns:
+        A ``(draws,)`` array holding the sum of one draw per move.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    # Certain projections are added as constants; ``triangular`` rejects
+    # distributions without a spread.
+    total = np.full(draws, sum(move.base for move in moves if move.low == move.high), dtype=float)
+    for move in moves:
+        if move.low < move.high:
+            total += rng.triangular(move.low, move.base, move.high, size=draws)
+    return total
+
+
+def simulate_revenue(moves: Sequence[MoveProjection], years: Sequence[Any],
+                     targets: Sequence[Optional[float]], baseline_revenue: float = 0.0,
+                     draws: int = DEFAULT_DRAWS, seed: Optional[int] = None) -> Dict[str, Any]:
+    """Simulate each year's revenue from the winning moves.
+
+    Year ``i`` of ``n`` (counting from 1) realises ``i / n`` of every
+    move's annual revenue, on top of ``baseline_revenue``.
+
+    Args:
+        moves: Projections of the winning moves.
+        years: The plan's years, in order.
+        targets: Revenue target for each year, or ``None`` where a year has
+            no target.
+        baseline_revenue: Current annual revenue.
+        draws: Number of Monte Carlo draws.
+        seed: Seed for the random generator.  The same seed and inputs
+            always give the same result.
+
+    Returns:
+        A dictionary with the ``draws`` and ``seed`` used and one entry
+        per year under ``years``: its ``target``, the ``p10``, ``p50`` and
+        ``p90`` simulated revenue, and ``probability_of_target``, the share
+        of draws reaching the target (``None`` without a target).
+
+    Raises:
+        ValueError: If ``draws`` is not positive or ``targets`` does not
+            match ``years``.
+    """
+    if draws < 1:
+        raise ValueError("draws must be at least 1")
+    if len(targets) != len(years):
+        raise ValueError("targets must hold one entry per year")
+    total = draw_move_revenue(moves, draws, np.random.default_rng(seed))
+    quantiles = np.percentile(total, PERCENTILES)
+    ordered = np.sort(total)
+    result_years = []
+    for index, (year, target) in enumerate(zip(years, targets), start=1):
+        ramp = index / len(years)
+        revenue = baseline_revenue + ramp * quantiles
+        entry: Dict[str, Any] = {"year": year, "target": target}
+        entry.update({f"p{p}": float(value) for p, value in zip(PERCENTILES, revenue)})
+        if target is None:
+            entry["probability_of_target"] = None
+        else:
+            # revenue >= target  <=>  total >= (target - baseline) / ramp
+            needed = (target - baseline_revenue) / ramp
+            reached = draws - np.searchsorted(ordered, needed, side="left")
+            entry["probability_of_target"] = float(reached / draws)
+        result_years.append(entry)
+    return {"draws": draws, "seed": seed, "years": result_years}
@@ -0,0 +1,228 @@
+"""
+Scenario sweeps over a grid of plan targets.
+
+A sweep takes a base ``/generate_plan`` payload and a range of values for
+one or more target assumptions, such as annual revenue growth from 10 % to
+80 % and a gross margin from 0.2 to 0.5.  Every combination of values is
+turned into its own payload and evaluated, and the results come back as
+a compact table with one row per scenario.
+
+``SweepRunner`` evaluates large grids on a pool of worker processes.  The
+base payload and the evaluation function are handed to each worker once,
+when it starts, so that each task only carries the values of its
+scenarios.  Small grids are evaluated in the calling process, where
+starting a pool would cost more than it saves.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from planning_agent import DEFAULT_HORIZON_YEARS
+
+#: Target assumptions a sweep can vary, mapped to the ``targets`` field
+#: they set and the baseline metric their annual growth rate applies to.
+#: Axes without a baseline metric set the same level for every year.
+SWEEP_AXES: Dict[str, Tuple[str, str]] = {
+    "revenue_growth": ("revenue", "annual_revenue"),
+    "customer_growth": ("customers", "customers"),
+    "margin": ("margin", ""),
+}
+
+# Per-worker sweep state, set by ``_init_worker``.
+_worker_base: Optional[Dict[str, Any]] = None
+_worker_axes: Tuple[str, ...] = ()
+_worker_evaluate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+
+
+def _axis_values(name: str, spec: Any) -> List[float]:
+    """Expand one axis specification into its list of values."""
+    if isinstance(spec, list):
+        values = spec
+    elif isinstance(spec, Mapping):
+        try:
+            start, stop, step = (float(spec[key]) for key in ("start", "stop", "step"))
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{name} must have numeric start, stop and step") from None
+        if step <= 0 or stop < start:
+            raise ValueError(f"{name} must have stop >= start and a positive step")
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        # Rounding keeps values such as 0.1 + 2 * 0.1 readable.
+        values = [round(start + i * step, 10) for i in range(count)]
+    else:
+        raise ValueError(f"{name} must be a list of values or an object with start, stop and step")
+    if not values or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        raise ValueError(f"{name} must hold at least one number")
+    return [float(v) for v in values]
+
+
+def parse_ranges(ranges: Any) -> List[Tuple[str, List[float]]]:
+    """Validate the ``ranges`` of a sweep request.
+
+    Args:
+        ranges: Mapping of axis name (see ``SWEEP_AXES``) → either a list
+            of values or ``{"start": ..., "stop": ..., "step": ...}``,
+            where ``stop`` is included.
+
+    Returns:
+        ``(axis, values)`` pairs in the order given.
+
+    Raises:
+        ValueError: If an axis is unknown or its values are malformed.
+    """
+    if not isinstance(ranges, Mapping) or not ranges:
+        raise ValueError("ranges must be a non-empty object")
+    unknown = set(ranges).difference(SWEEP_AXES)
+    if unknown:
+        raise ValueError(f"Unknown sweep axis(es): {', '.join(sorted(unknown))}")
+    return [(name, _axis_values(name, spec)) for name, spec in ranges.items()]
+
+
+def check_baselines(base: Mapping[str, Any], axes: Sequence[str]) -> None:
+    """Check that ``base`` has a positive baseline for every growth axis.
+
+    Raises:
+        ValueError: If a growth axis has no positive baseline to grow from.
+    """
+    baseline = base.get("baseline_metrics") or {}
+    for axis in axes:
+        baseline_key = SWEEP_AXES[axis][1]
+        if not baseline_key:
+            continue
+        start = baseline.get(baseline_key) if isinstance(baseline, Mapping) else None
+        if not isinstance(start, (int, float)) or isinstance(start, bool) or start <= 0:
+            raise ValueError(f"{axis} needs a positive baseline_metrics.{baseline_key}")
+
+
+def scenario_payload(base: Mapping[str, Any], axes: Sequence[str], values: Sequence[float]) -> Dict[str, Any]:
+    """Build the payload for one scenario of a sweep.
+
+    Growth axes set year ``i``'s target to the baseline metric grown by
+    the rate for ``i`` years; the margin axis sets every year's margin.
+    Targets not covered by an axis are taken from ``base``.
+
+    Raises:
+        ValueError: If a growth axis has no positive baseline to grow from.
+    """
+    check_baselines(base, axes)
+    payload = copy.deepcopy(dict(base))
+    horizon = payload.get("horizon_years", DEFAULT_HORIZON_YEARS)
+    baseline = payload.get("baseline_metrics", {})
+    targets = payload.setdefault("targets", {})
+    for axis, value in zip(axes, values):
+        field, baseline_key = SWEEP_AXES[axis]
+        start = baseline.get(baseline_key) if baseline_key else None
+        for year in range(1, horizon + 1):
+            year_targets = targets.setdefault(f"year{year}", {})
+            year_targets[field] = round(start * (1.0 + value) ** year) if baseline_key else value
+    return payload
+
+
+def _init_worker(base: Dict[str, Any], axes: Tuple[str, ...],
+                 evaluate: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+    global _worker_base, _worker_axes, _worker_evaluate
+    _worker_base, _worker_axes, _worker_evaluate = base, axes, evaluate
+
+
+def _evaluate_cells(base: Mapping[str, Any], axes: Sequence[str],
+                    evaluate: Callable[[Dict[str, Any]], Dict[str, Any]],
+                    cells: Sequence[Tuple[float, ...]]) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of scenarios; failures are reported per scenario."""
+    results = []
+    for values in cells:
+        try:
+            results.append(evaluate(scenario_payload(base, axes, values)))
+        except Exception as exc:
+            results.append({"error": str(exc)})
+    return results
+
+
+def _evaluate_worker_cells(cells: Sequence[Tuple[float, ...]]) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of scenarios against the worker's sweep state."""
+    return _evaluate_cells(_worker_base, _worker_axes, _worker_evaluate, cells)
+
+
+class SweepRunner:
+    """Evaluates scenario grids, on worker processes for large grids.
+
+    Attributes:
+        max_workers: Number of worker processes per sweep.  A value of 0
+            evaluates every sweep in the calling process.
+        max_cells: Largest grid a sweep may evaluate.
+        inline_cells: Grids with at most this many scenarios are evaluated
+            in the calling process.
+    """
+
+    def __init__(self, max_workers: int = 4, max_cells: int = 1000, inline_cells: int = 64,
+                 start_method: Optional[str] = None) -> None:
+        self.max_workers = max_workers
+        self.max_cells = max_cells
+        self.inline_cells = inline_cells
+        if start_method is None:
+            # ``forkserver`` avoids forking a multi-threaded server process.
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in methods else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        self._preloaded = False
+
+    def run(self, base: Dict[str, Any], ranges: Sequence[Tuple[str, List[float]]],
+            evaluate: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """Evaluate every scenario of a grid.
+
+        Args:
+            base: The base payload.
+            ranges: ``(axis, values)`` pairs, as returned by ``parse_ranges``.
+            evaluate: Module-level function turning a scenario payload into
+                a flat mapping of result columns.  It must be importable by
+                the worker processes.
+
+        Returns:
+            ``{"axes": [...], "columns": [...], "rows": [[...], ...]}`` with
+            one row per scenario, in grid order (the last axis varies
+            fastest).  Each row holds the axis values followed by the
+            result columns; a scenario that failed has its message in the
+            ``error`` column.
+
+        Raises:
+            ValueError: If the grid holds more than ``max_cells`` scenarios,
+                or ``base`` lacks the baseline metric of a growth axis.
+        """
+        axes = tuple(name for name, _ in ranges)
+        # A missing baseline would fail every scenario; report it once.
+        check_baselines(base, axes)
+        cells: List[Tuple[float, ...]] = [()]
+        for _, values in ranges:
+            cells = [cell + (value,) for cell in cells for value in values]
+        if len(cells) > self.max_cells:
+            raise ValueError(f"Sweep has {len(cells)} scenarios; the limit is {self.max_cells}")
+
+        if self.max_workers <= 0 or len(cells) <= self.inline_cells:
+            results = _evaluate_cells(base, axes, evaluate, cells)
+        else:
+            # A few chunks per worker keeps the workers evenly loaded while
+            # sending each scenario's values in a single round trip.
+            size = max(1, math.ceil(len(cells) / (self.max_workers * 4)))
+            chunks = [cells[i:i + size] for i in range(0, len(cells), size)]
+            if self._context.get_start_method() == "forkserver" and not self._preloaded:
+                # Import the evaluation function's module once in the fork
+                # server, so that later workers start without importing it.
+                if evaluate.__module__ != "__main__":
+                    self._context.set_forkserver_preload([evaluate.__module__])
+                self._preloaded = True
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._context,
+                                     initializer=_init_worker, initargs=(base, axes, evaluate)) as pool:
+                results = [result for chunk in pool.map(_evaluate_worker_cells, chunks) for result in chunk]
+
+        columns: Dict[str, None] = {}
+        for result in results:
+            columns.update(dict.fromkeys(result))
+        names = list(columns)
+        return {
+            "axes": list(axes),
+            "columns": list(axes) + names,
+            "rows": [list(cell) + [result.get(name) for name in names] for cell, result in zip(cells, results)],
+        }
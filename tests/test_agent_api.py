@@ -0,0 +1,301 @@
+"""Tests for the Flask planning API in ``agent_api``."""
+
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import agent_api
+from agent_api import create_app
+
+REQUESTS = 2000
+THREADS = 32
+
+
+def company_payload(index):
+    """Return a payload whose every field identifies company ``index``."""
+    payload = {
+        "company_name": f"Company {index}",
+        "mission": f"mission {index}",
+        "vision": f"vision {index}",
+        "core_values": [f"value {index}"],
+        "targets": {"year1": {"revenue": 1000 + index, "customers": index, "margin": 0.3}},
+    }
+    # Every other request leaves out the SWOT and winning moves, which
+    # must not be inherited from another request.
+    if index % 2:
+        payload["swot"] = {key: [f"{key} {index}"] for key in ("strengths", "weaknesses", "opportunities", "threats")}
+        payload["winning_moves"] = [{"description": f"move {index}"}]
+    return payload
+
+
+def test_concurrent_requests_do_not_share_company_data():
+    """Concurrent requests each get a plan built only from their own payload."""
+    app = create_app({
+        "TESTING": True,
+        "PLAN_CACHE_SIZE": 0,
+        "PLAN_MAX_CONCURRENCY": 0,
+    })
+
+    def generate(index):
+        response = app.test_client().post("/generate_plan", json=company_payload(index))
+        assert response.status_code == 200, response.get_json()
+        return index, response.get_json()
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(generate, range(REQUESTS)))
+
+    mismatches = []
+    for index, body in results:
+        plan = body["plan"]
+        expected_moves = [f"move {index}"] if index % 2 else []
+        expected_swot = (
+            {key: [f"{key} {index}"] for key in ("strengths", "weaknesses", "opportunities", "threats")}
+            if index % 2 else None
+        )
+        if (
+            plan["company_profile"]["name"] != f"Company {index}"
+            or plan["company_profile"]["mission"] != f"mission {index}"
+            or plan["strategic_targets"][0]["revenue"] != 1000 + index
+            or plan["winning_moves"]["revenue_moves"] != expected_moves
+            or plan["swot_analysis"] != expected_swot
+            or f"Company {index} exists to mission {index}." not in body["narrative"]
+        ):
+            mismatches.append(index)
+    assert mismatches == []
+
+
+def blocking_plans(monkeypatch):
+    """Make plan generation wait until the returned event is set.
+
+    Returns ``(started, release)``: ``started`` is set once a request is
+    generating its plan, ``release`` lets every such request finish.
+    """
+    started, release = threading.Event(), threading.Event()
+    generate = agent_api.plan_from_payload
+
+    def blocked(*args, **kwargs):
+        started.set()
+        release.wait(10)
+        return generate(*args, **kwargs)
+
+    monkeypatch.setattr(agent_api, "plan_from_payload", blocked)
+    return started, release
+
+
+def admission_gauges(client):
+    stats = client.get("/stats").get_json()["admission"]
+    return stats["in_flight"], stats["queue_depth"]
+
+
+def test_admission_rejects_immediately_when_the_queue_is_full(monkeypatch):
+    """With every slot busy and no queue, requests fail fast with 503."""
+    started, release = blocking_plans(monkeypatch)
+    app = create_app({"TESTING": True, "PLAN_CACHE_SIZE": 0, "PLAN_MAX_CONCURRENCY": 1,
+                      "PLAN_QUEUE_SIZE": 0, "PLAN_QUEUE_TIMEOUT": 10, "PLAN_RETRY_AFTER": 3})
+    client = app.test_client()
+    with ThreadPoolExecutor(1) as pool:
+        busy = pool.submit(client.post, "/generate_plan", json=company_payload(0))
+        assert started.wait(10)
+        assert admission_gauges(client) == (1, 0)
+        response = client.post("/generate_plan", json=company_payload(1))
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        release.set()
+        assert busy.result().status_code == 200
+    assert admission_gauges(client) == (0, 0)
+    assert app.extensions["plan_admission"].stats()["rejected"] == 1
+
+
+def test_admission_rejects_requests_that_wait_too_long(monkeypatch):
+    """A queued request gives up with 503 once its queue timeout passes."""
+    started, release = blocking_plans(monkeypatch)
+    app = create_app({"TESTING": True, "PLAN_CACHE_SIZE": 0, "PLAN_MAX_CONCURRENCY": 1,
+                      "PLAN_QUEUE_SIZE": 1, "PLAN_QUEUE_TIMEOUT": 0.05})
+    client = app.test_client()
+    with ThreadPoolExecutor(1) as pool:
+        busy = pool.submit(client.post, "/generate_plan", json=company_payload(0))
+        assert started.wait(10)
+        response = client.post("/generate_plan", json=company_payload(1))
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+        release.set()
+        assert busy.result().status_code == 200
+    assert admission_gauges(client) == (0, 0)
+    assert app.extensions["plan_admission"].stats()["timed_out"] == 1
+
+
+def test_admission_slots_are_released_after_errors(monkeypatch):
+    """The gauges return to zero whether plan generation succeeds or fails."""
+    client = create_app({"TESTING": True, "PLAN_CACHE_SIZE": 0, "PLAN_MAX_CONCURRENCY": 1,
+                         "PLAN_QUEUE_SIZE": 0}).test_client()
+    assert client.post("/generate_plan", json=company_payload(0)).status_code == 200
+    assert admission_gauges(client) == (0, 0)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(agent_api, "plan_from_payload", fail)
+    response = client.post("/generate_plan", json=company_payload(1))
+    assert response.status_code == 500
+    assert admission_gauges(client) == (0, 0)
+    monkeypatch.undo()
+    assert client.post("/generate_plan", json=company_payload(2)).status_code == 200
+
+
+def test_invalid_plan_jobs_are_rejected_before_queueing():
+    """``POST /plans/jobs`` answers 400 for payloads a job would fail on."""
+    client = create_app({"TESTING": True}).test_client()
+    payload = company_payload(1)
+    for query, body in (
+        ("?catalogs=bogus", payload),
+        ("?sections=bogus", payload),
+        ("", {**payload, "horizon_years": 99}),
+        ("", {**payload, "simulation": "yes"}),
+        ("", {**payload, "simulation": {"draws": 0}}),
+        ("", [payload]),
+    ):
+        response = client.post(f"/plans/jobs{query}", json=body)
+        assert response.status_code == 400, (query, body)
+        assert "error" in response.get_json()
+
+    response = client.post("/plans/jobs", json=payload)
+    assert response.status_code == 202
+
+
+def test_plan_jobs_report_consistent_snapshots():
+    """The 202 body names the job; polling returns its snapshot until it is done."""
+    app = create_app({"TESTING": True})
+    client = app.test_client()
+    response = client.post("/plans/jobs", json=company_payload(3))
+    assert response.status_code == 202
+    job_id = response.get_json()["job_id"]
+    assert response.get_json() == {"job_id": job_id, "status": "queued"}
+    assert response.headers["Location"] == f"/plans/jobs/{job_id}"
+
+    app.extensions["plan_jobs"].shutdown()
+    body = client.get(f"/plans/jobs/{job_id}").get_json()
+    assert body["status"] == "succeeded"
+    assert body["started_at"] is not None and body["finished_at"] is not None
+    assert body["result"]["plan"]["company_profile"]["name"] == "Company 3"
+    assert client.get("/plans/jobs/unknown").status_code == 404
+
+
+def test_plan_cache_headers():
+    """``X-Plan-Cache`` reports misses, hits, bypasses and expired entries."""
+    app = create_app({"TESTING": True, "PLAN_CACHE_SIZE": 2, "PLAN_CACHE_TTL": 60.0})
+    cache = app.extensions["plan_cache"]
+    now = [1000.0]
+    cache._clock = lambda: now[0]
+    client = app.test_client()
+
+    def status(index, **kwargs):
+        response = client.post("/generate_plan", json=company_payload(index), **kwargs)
+        assert response.status_code == 200
+        return response.headers["X-Plan-Cache"]
+
+    assert status(1) == "miss"
+    first = client.post("/generate_plan", json=company_payload(1))
+    assert first.headers["X-Plan-Cache"] == "hit"
+    assert first.data == client.post("/generate_plan", json=company_payload(1),
+                                     headers={"Cache-Control": "no-cache"}).data
+    assert status(1, headers={"Cache-Control": "no-cache"}) == "bypass"
+
+    # At capacity the least recently used payload is evicted.
+    assert status(2) == "miss"
+    assert status(3) == "miss"
+    assert status(1) == "miss"
+    assert status(3) == "hit"
+
+    now[0] += 60.0
+    assert status(3) == "miss"
+
+
+def test_plan_cache_size_zero_disables_caching():
+    client = create_app({"TESTING": True, "PLAN_CACHE_SIZE": 0}).test_client()
+    for _ in range(2):
+        response = client.post("/generate_plan", json=company_payload(1))
+        assert response.headers["X-Plan-Cache"] == "miss"
+    assert client.get("/stats").get_json()["plan_cache"]["size"] == 0
+
+
+def test_fast_json_provider_parses_like_the_stdlib():
+    """Wide integers and NaN/Infinity parse as with the default provider."""
+    app = create_app({"TESTING": True})
+    documents = [
+        '{"revenue": 100000000000000000000}',
+        '{"revenue": -9223372036854775809}',
+        '{"revenue": 18446744073709551615}',
+        '{"margin": NaN, "growth": Infinity, "loss": -Infinity}',
+        '{"name": "caf\\u00e9", "values": [1, 2.5, null, true]}',
+    ]
+    for text in documents:
+        for document in (text, text.encode("utf-8")):
+            assert repr(app.json.loads(document)) == repr(json.loads(text))
+    assert app.json.loads(b'{"revenue": 100000000000000000000}')["revenue"] == 10**20
+    with pytest.raises(ValueError):
+        app.json.loads(b'{"revenue": ')
+
+
+def sse_events(response):
+    """Return the ``(event, data)`` pairs of a Server-Sent Events body."""
+    events = []
+    for message in response.get_data(as_text=True).split("\n\n"):
+        if message:
+            event, data = message.split("\n")
+            events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def test_plan_stream_event_sequence():
+    """Sections, then paragraphs, then the simulation, then ``done``."""
+    client = create_app({"TESTING": True}).test_client()
+    payload = {**company_payload(1), "simulation": {"draws": 1000, "seed": 7}}
+    payload["winning_moves"] = [{"description": "move 1", "projected_revenue": {"low": 10, "base": 20, "high": 40}}]
+    response = client.post("/generate_plan/stream", json=payload)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = sse_events(response)
+    names = [event for event, _ in events]
+    assert names == sorted(names, key=["section", "paragraph", "simulation", "done"].index)
+    assert names.count("simulation") == 1 and names[-1] == "done"
+
+    expected = client.post("/generate_plan", json=payload).get_json()
+    streamed = dict(events)
+    assert streamed["simulation"] == expected["simulation"]
+    assert {data["name"]: data["value"] for event, data in events if event == "section"} == expected["plan"]
+    paragraphs = [data["text"] for event, data in events if event == "paragraph"]
+    assert "\n\n".join(paragraphs) == expected["narrative"]
+
+    for simulation in ("yes", {"draws": 0}):
+        response = client.post("/generate_plan/stream", json={**payload, "simulation": simulation})
+        assert response.status_code == 400
+
+
+def test_plan_store_failures_still_return_the_plan(tmp_path, monkeypatch):
+    """A plan that could not be stored is served without ``X-Plan-Id``."""
+    app = create_app({"TESTING": True, "PLAN_STORE_PATH": str(tmp_path / "plans.db")})
+    store = app.extensions["plan_store"]
+    client = app.test_client()
+
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(store, "save", fail)
+    response = client.post("/generate_plan", json=company_payload(5))
+    assert response.status_code == 200
+    assert response.get_json()["plan"]["company_profile"]["name"] == "Company 5"
+    assert "X-Plan-Id" not in response.headers
+
+    monkeypatch.setattr(store, "find", fail)
+    response = client.post("/generate_plan", json=company_payload(5))
+    assert response.status_code == 200
+    assert response.headers["X-Plan-Cache"] == "hit"
+    assert "X-Plan-Id" not in response.headers
+
+    monkeypatch.undo()
+    response = client.post("/generate_plan", json=company_payload(6))
+    assert client.get(f"/plans/{response.headers['X-Plan-Id']}").status_code == 200
+    store.close()
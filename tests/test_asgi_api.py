@@ -0,0 +1,47 @@
+"""Tests for the ASGI planning API in ``asgi_api``."""
+
+import asyncio
+import json
+
+from agent_api import create_app
+from asgi_api import create_asgi_app
+
+PAYLOAD = {
+    "company_name": "Café Müller",
+    "mission": "serve good coffee",
+    "vision": "a café on every corner",
+    "core_values": ["Qualität"],
+    "targets": {"year1": {"revenue": 100000, "customers": 50, "margin": 0.4}},
+    "winning_moves": [{"description": "Open in Zürich"}],
+}
+
+
+def asgi_post(app, path, body):
+    """Send one POST request to an ASGI app; return ``(status, body)``."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"], b"".join(message.get("body", b"") for message in messages[1:])
+
+
+def test_responses_match_flask_byte_for_byte():
+    """The ASGI app encodes plans exactly as the Flask app does, non-ASCII text included."""
+    body = json.dumps(PAYLOAD).encode("utf-8")
+    flask_response = create_app({"TESTING": True, "PLAN_CACHE_SIZE": 0}).test_client().post(
+        "/generate_plan", data=body, content_type="application/json"
+    )
+    status, asgi_body = asgi_post(create_asgi_app(), "/generate_plan", body)
+    assert (status, asgi_body) == (flask_response.status_code, flask_response.data)
@@ -0,0 +1,50 @@
+"""Tests for the ``plan_batch`` command-line planner."""
+
+import json
+import os
+
+import pytest
+
+import plan_batch
+
+GOOD = {"company_name": "Acme", "mission": "m", "vision": "v", "core_values": ["Integrity"]}
+BAD = {**GOOD, "horizon_years": 99}
+
+
+def test_plan_line_reports_whether_the_payload_was_planned():
+    ok, line = plan_batch.plan_line((0, GOOD))
+    assert ok and json.loads(line)["index"] == 0 and "plan" in json.loads(line)
+    ok, line = plan_batch.plan_line((1, BAD))
+    assert not ok and json.loads(line) == {"index": 1, "error": "horizon_years must be an integer from 1 to 10"}
+
+
+def test_main_counts_failures(tmp_path, capsys):
+    source = tmp_path / "portfolio.ndjson"
+    source.write_text("\n".join(json.dumps(payload) for payload in (GOOD, BAD, GOOD)) + "\nnot json\n")
+    output = tmp_path / "plans.ndjson"
+    outputs = []
+    for workers in ("1", "2"):
+        assert plan_batch.main([str(source), "-o", str(output), "-w", workers]) == 1
+        assert "planned 4 payload(s), 2 failed" in capsys.readouterr().err
+        outputs.append(output.read_text())
+    assert outputs[0] == outputs[1]
+    lines = [json.loads(line) for line in outputs[0].splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2, 3]
+    assert ["error" in line for line in lines] == [False, True, False, True]
+
+
+def test_main_reports_output_errors(tmp_path, capsys):
+    source = tmp_path / "portfolio.ndjson"
+    source.write_text(json.dumps(GOOD) + "\n")
+    missing = tmp_path / "missing" / "plans.ndjson"
+    assert plan_batch.main([str(source), "-o", str(missing), "-w", "1"]) == 2
+    assert f"cannot write {missing}" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="needs /dev/full")
+def test_main_reports_write_errors_as_write_errors(tmp_path, capsys):
+    source = tmp_path / "portfolio.ndjson"
+    source.write_text("".join(json.dumps(GOOD) + "\n" for _ in range(50)))
+    assert plan_batch.main([str(source), "-o", "/dev/full", "-w", "1"]) == 2
+    err = capsys.readouterr().err
+    assert "cannot write /dev/full" in err and "cannot read" not in err
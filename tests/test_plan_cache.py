@@ -0,0 +1,45 @@
+"""Tests for ``plan_cache.PlanCache``."""
+
+from plan_cache import PlanCache, payload_digest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_their_ttl():
+    clock = FakeClock()
+    cache = PlanCache(max_entries=4, ttl=10.0, clock=clock)
+    cache.put("a", 1)
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1 and cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted_at_capacity():
+    cache = PlanCache(max_entries=2, ttl=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used.
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["evictions"] == 1 and cache.stats()["size"] == 2
+
+
+def test_size_zero_disables_the_cache():
+    cache = PlanCache(max_entries=0)
+    assert not cache.enabled
+    cache.put("a", 1)
+    assert cache.get("a") is None and cache.stats()["size"] == 0
+
+
+def test_payload_digest_ignores_key_order():
+    assert payload_digest({"a": 1, "b": [1, 2]}) == payload_digest({"b": [1, 2], "a": 1})
+    assert payload_digest({"a": 1}) != payload_digest({"a": 2})
@@ -0,0 +1,88 @@
+"""Tests for ``plan_store.PlanStore``."""
+
+import json
+
+import pytest
+
+from plan_service import plan_from_payload
+from plan_store import PlanStore
+
+
+def company_payload(name, threat, move):
+    return {
+        "company_name": name,
+        "mission": "m",
+        "vision": "v",
+        "core_values": ["Integrity"],
+        "swot": {"strengths": ["Brand"], "weaknesses": ["Cash"], "opportunities": ["Exports"], "threats": [threat]},
+        "winning_moves": [{"description": move}],
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PlanStore(str(tmp_path / "plans.sqlite3"))
+    yield store
+    store.close()
+
+
+def save(store, payload):
+    return store.save(payload, plan_from_payload(payload), payload["company_name"])
+
+
+def test_saved_plans_round_trip(store):
+    payload = company_payload("Acme", "Tariffs", "Open in Europe")
+    plan_id = save(store, payload)
+    record = store.get(plan_id)
+    assert record["payload"] == payload
+    assert record["result"] == plan_from_payload(payload)
+    assert store.find("Acme") == plan_id
+    plans, cursor = store.list(company_name="Acme")
+    assert [plan["id"] for plan in plans] == [plan_id] and cursor is None
+
+
+def test_search_matches_swot_and_moves(store):
+    if not store.searchable:
+        pytest.skip("SQLite lacks FTS5")
+    acme = save(store, company_payload("Acme", "Supply chain disruption", "Open offices in Europe"))
+    beta = save(store, company_payload("Beta", "New competitors", "Expand to Europe"))
+    gamma = save(store, company_payload("Gamma", "Chain of supply", "Launch in Asia"))
+
+    plans, _ = store.search('"supply chain"', fields=["swot"])
+    assert [plan["id"] for plan in plans] == [acme]
+    plans, _ = store.search("europe", fields=["moves"])
+    assert {plan["id"] for plan in plans} == {acme, beta}
+    plans, _ = store.search('"supply chain" OR europe', company_name="Beta")
+    assert [plan["id"] for plan in plans] == [beta]
+
+    first, next_offset = store.search("europe OR asia", limit=2)
+    rest, last = store.search("europe OR asia", offset=next_offset, limit=2)
+    assert len(first) == 2 and len(rest) == 1 and last is None
+    assert {plan["id"] for plan in first + rest} == {acme, beta, gamma}
+
+    with pytest.raises(ValueError):
+        store.search('"unterminated')
+    with pytest.raises(ValueError):
+        store.search("europe", fields=["body"])
+
+
+
+def test_payload_lists_and_objects_are_stored_once(store):
+    first = company_payload("Acme", "Tariffs", "Open in Europe")
+    second = {**company_payload("Beta", "Tariffs", "Open in Europe"), "mission": "other"}
+    save(store, first)
+    written = store.stats()["sections_written"]
+    beta = save(store, second)
+    # Beta shares the SWOT, moves and core values, besides most plan sections.
+    assert store.stats()["sections_written"] - written < written
+
+    rows = store._connection().execute("SELECT payload, manifest FROM plans ORDER BY seq").fetchall()
+    for row in rows:
+        assert "Tariffs" not in row["payload"] and "Open in Europe" not in row["payload"]
+    first_sections, second_sections = (json.loads(row["manifest"])["payload"] for row in rows)
+    assert first_sections == second_sections
+    assert set(first_sections) == {"core_values", "swot", "winning_moves"}
+
+    record = store.get(beta)
+    assert record["payload"] == second
+    assert list(record["payload"]) == list(second)
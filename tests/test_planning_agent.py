@@ -0,0 +1,241 @@
+"""Tests for ``planning_agent.StrategicPlanningAgent``."""
+
+import datetime
+import pickle
+
+import pytest
+
+from narrative_templates import DEFAULT_TEMPLATES
+from planning_agent import NARRATIVE_PARAGRAPHS, PLAN_SECTIONS, StrategicPlanningAgent, add_months, milestone_schedule
+
+
+def make_agent():
+    agent = StrategicPlanningAgent(
+        company_name="Acme Widgets",
+        mission="make building widgets easy",
+        vision="world-class widgets",
+        core_values=["Integrity", "Innovation"],
+        baseline_metrics={"annual_revenue": 2_000_000, "customers": 200, "gross_margin": 0.3},
+        start_year=2025,
+    )
+    agent.set_targets(
+        revenue_targets={2025: 5_000_000, 2027: 10_000_000},
+        customer_targets={2025: 400, 2026: 600, 2027: 800},
+        margin_targets={2025: 0.35, 2026: 0.38, 2027: 0.4},
+        other_targets={"net_profit": {2025: 500_000, 2027: 1_500_000}},
+    )
+    agent.identify_winning_moves(["Launch a subscription"], ["Automate manufacturing"])
+    agent.create_swot(["Strong brand"], ["Small team"], ["Growing demand"], ["New competitors"])
+    return agent
+
+
+def test_mutating_a_built_plan_leaves_the_agent_intact():
+    agent = make_agent()
+    expected_plan, expected_narrative = make_agent().build_plan_and_narrative()
+
+    plan = agent.build_plan()
+    plan["strategic_targets"].append({"year": "junk"})
+    plan["strategic_targets"][0]["revenue"] = -1
+    plan["milestones"].clear()
+    plan["company_profile"]["name"] = "Someone Else"
+    plan["winning_moves"]["revenue_moves"] = []
+
+    assert agent.build_plan() == expected_plan
+    assert agent.generate_narrative() == expected_narrative
+
+
+def test_every_section_is_returned_in_fresh_containers():
+    agent = make_agent()
+    first, second = agent.build_plan(PLAN_SECTIONS), agent.build_plan(PLAN_SECTIONS)
+    for name in PLAN_SECTIONS:
+        if isinstance(first[name], (list, dict)):
+            assert first[name] is not second[name], name
+
+
+def count_builds(monkeypatch):
+    """Wrap every section builder and paragraph renderer to count calls."""
+    calls = {}
+
+    def counting(name, function):
+        def wrapper(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    for name in PLAN_SECTIONS:
+        builder = f"_section_{name}"
+        monkeypatch.setattr(StrategicPlanningAgent, builder, counting(name, getattr(StrategicPlanningAgent, builder)))
+    templates = DEFAULT_TEMPLATES.replace()
+    for name, render in templates.renderers.items():
+        templates.renderers[name] = counting(f"paragraph:{name}", render)
+    return calls, templates
+
+
+def test_untouched_sections_are_not_recomputed(monkeypatch):
+    calls, templates = count_builds(monkeypatch)
+    agent = make_agent()
+    agent.narrative_templates = templates
+    agent.build_plan_and_narrative()
+    first = dict(calls)
+    assert all(first.get(name) == 1 for name in PLAN_SECTIONS if name != "projections")
+    assert all(first.get(f"paragraph:{name}") == 1 for name in NARRATIVE_PARAGRAPHS)
+
+    calls.clear()
+    agent.build_plan_and_narrative()
+    # Only the static catalogs, which are not cached, are built again.
+    assert calls == {"recommended_kpis": 1, "service_recommendations": 1}
+
+    calls.clear()
+    agent.set_targets({2025: 6_000_000, 2027: 12_000_000}, {2025: 500, 2027: 900}, {2025: 0.36, 2027: 0.41})
+    plan, narrative = agent.build_plan_and_narrative()
+    assert calls == {
+        "strategic_targets": 1, "paragraph:targets": 1,
+        "recommended_kpis": 1, "service_recommendations": 1,
+    }
+
+    fresh = make_agent()
+    fresh.set_targets({2025: 6_000_000, 2027: 12_000_000}, {2025: 500, 2027: 900}, {2025: 0.36, 2027: 0.41})
+    assert (plan, narrative) == fresh.build_plan_and_narrative()
+
+
+def test_field_assignment_marks_only_its_readers_dirty(monkeypatch):
+    calls, templates = count_builds(monkeypatch)
+    agent = make_agent()
+    agent.narrative_templates = templates
+    agent.build_plan_and_narrative()
+
+    calls.clear()
+    agent.create_swot(["Patents"], ["Cash"], ["Exports"], ["Tariffs"])
+    agent.build_plan_and_narrative()
+    assert calls == {
+        "swot_analysis": 1, "paragraph:swot": 1,
+        "recommended_kpis": 1, "service_recommendations": 1,
+    }
+
+    calls.clear()
+    agent.company_name = "Acme Gadgets"
+    agent.build_plan_and_narrative()
+    assert set(calls) == {
+        "executive_summary", "company_profile", "paragraph:intro", "paragraph:closing",
+        "recommended_kpis", "service_recommendations",
+    }
+
+
+def test_mark_dirty_after_in_place_mutation():
+    agent = make_agent()
+    agent.generate_narrative()
+    agent.revenue_moves.append("Expand to Europe")
+    agent.mark_dirty("revenue_moves")
+    assert agent.build_plan(["winning_moves"])["winning_moves"]["revenue_moves"][-1] == "Expand to Europe"
+    assert "Expand to Europe" in agent.generate_narrative()
+
+
+def test_narrative_from_a_supplied_targets_summary_on_a_fresh_agent():
+    summary = make_agent().build_plan(["strategic_targets"])["strategic_targets"]
+    agent = make_agent()
+    paragraphs = dict(agent.iter_narrative_paragraphs(summary))
+    assert "\n\n".join(paragraphs.values()) == make_agent().generate_narrative()
+
+
+def test_targets_constructor_keywords_seed_the_targets_table():
+    agent = StrategicPlanningAgent(
+        "Acme Widgets", "make building widgets easy", "world-class widgets", ["Integrity", "Innovation"],
+        {"annual_revenue": 2_000_000, "customers": 200, "gross_margin": 0.3},
+        revenue_targets={2025: 5_000_000, 2027: 10_000_000},
+        customer_targets={2025: 400, 2026: 600, 2027: 800},
+        margin_targets={2025: 0.35, 2026: 0.38, 2027: 0.4},
+        other_targets={"net_profit": {2025: 500_000, 2027: 1_500_000}},
+        start_year=2025,
+    )
+    agent.identify_winning_moves(["Launch a subscription"], ["Automate manufacturing"])
+    agent.create_swot(["Strong brand"], ["Small team"], ["Growing demand"], ["New competitors"])
+    assert agent.targets == make_agent().targets
+    assert agent.revenue_targets == {2025: 5_000_000, 2027: 10_000_000}
+    assert agent.other_targets == {"net_profit": {2025: 500_000, 2027: 1_500_000}}
+    assert agent.build_plan_and_narrative() == make_agent().build_plan_and_narrative()
+
+    agent.margin_targets = {2025: 0.5}
+    assert agent.margin_targets == {2025: 0.5}
+    assert agent.customer_targets == {2025: 400, 2026: 600, 2027: 800}
+
+
+def test_target_views_reject_in_place_writes():
+    agent = make_agent()
+    with pytest.raises(TypeError):
+        agent.revenue_targets[2028] = 12_000_000
+    with pytest.raises(TypeError):
+        agent.other_targets["net_profit"][2025] = 0
+    with pytest.raises(TypeError):
+        agent.other_targets["ebitda"] = {2025: 1}
+    assert agent.targets == make_agent().targets
+
+    agent.revenue_targets = {**agent.revenue_targets, 2028: 12_000_000}
+    assert agent.revenue_targets[2028] == 12_000_000
+
+
+def test_projections_are_only_built_by_default_at_a_finer_granularity():
+    agent = make_agent()
+    assert "projections" not in agent.build_plan()
+    assert agent.build_plan(["projections"])["projections"][0] == {
+        "year": 2025, "period": 1, "revenue": 5_000_000, "customers": 400, "gross_margin": 0.35,
+        "net_profit": 500_000,
+    }
+    agent.periods_per_year = 4
+    assert len(agent.build_plan()["projections"]) == 12
+
+
+def test_agents_can_be_pickled():
+    agent = make_agent()
+    expected = agent.build_plan_and_narrative()
+    copy = pickle.loads(pickle.dumps(agent))
+    assert copy == agent
+    assert copy.narrative_templates is DEFAULT_TEMPLATES
+    assert copy.build_plan_and_narrative() == expected
+
+    agent.narrative_templates = DEFAULT_TEMPLATES.replace(swot=None, missing="n/a", filters={"money": str})
+    copy = pickle.loads(pickle.dumps(agent))
+    assert copy.narrative_templates.paragraphs == agent.narrative_templates.paragraphs
+    assert copy.generate_narrative() == agent.generate_narrative()
+
+
+def test_add_months_clamps_to_the_end_of_shorter_months():
+    assert add_months(datetime.date(2025, 1, 31), 1) == datetime.date(2025, 2, 28)
+    assert add_months(datetime.date(2024, 1, 31), 1) == datetime.date(2024, 2, 29)
+    assert add_months(datetime.date(2025, 3, 31), 1) == datetime.date(2025, 4, 30)
+    assert add_months(datetime.date(2025, 8, 31), 6) == datetime.date(2026, 2, 28)
+    assert add_months(datetime.date(2025, 11, 15), 14) == datetime.date(2027, 1, 15)
+    assert add_months(datetime.date(2025, 3, 31), -1) == datetime.date(2025, 2, 28)
+
+
+def test_milestones_follow_a_fiscal_year_starting_in_april():
+    agent = make_agent()
+    agent.fiscal_year_start_month = 4
+    milestones = agent.build_plan(["milestones"])["milestones"]
+    assert milestones == [
+        {"date": "2025-04-01", "description": "Milestone 1 – Year 1"},
+        {"date": "2025-10-01", "description": "Milestone 2 – Year 1"},
+        {"date": "2026-04-01", "description": "Milestone 3 – Year 2"},
+        {"date": "2026-10-01", "description": "Milestone 4 – Year 2"},
+        {"date": "2027-04-01", "description": "Milestone 5 – Year 3"},
+        {"date": "2027-10-01", "description": "Milestone 6 – Year 3"},
+    ]
+    assert [label for _, label in agent.generate_milestones(3)][:5] == [
+        "Milestone 1 – Year 1", "Milestone 2 – Year 1", "Milestone 3 – Year 1", "Milestone 4 – Year 1",
+        "Milestone 5 – Year 2",
+    ]
+
+
+def test_milestone_schedules_are_shared_between_agents():
+    milestone_schedule.cache_clear()
+    first, second = make_agent(), make_agent()
+    schedule = first._milestone_schedule()
+    assert second._milestone_schedule() is schedule
+    info = milestone_schedule.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    second.fiscal_year_start_month = 7
+    assert second._milestone_schedule() is not schedule
+    assert second._milestone_schedule()[0][0] == datetime.date(2025, 7, 1)
+    assert first.generate_milestones() == list(schedule)
+    with pytest.raises(ValueError):
+        milestone_schedule(datetime.date(2025, 1, 1), 0)
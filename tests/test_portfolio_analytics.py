@@ -0,0 +1,64 @@
+"""Tests for ``portfolio_analytics.PortfolioTargets``."""
+
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from planning_agent import StrategicPlanningAgent  # noqa: E402
+from portfolio_analytics import PortfolioTargets  # noqa: E402
+
+YEARS = list(range(2025, 2030))
+
+
+def make_agent(index, revenue_targets, customer_targets=None):
+    return StrategicPlanningAgent(
+        f"Company {index}", "mission", "vision", [], {"annual_revenue": 1_000_000},
+        revenue_targets=revenue_targets,
+        customer_targets=customer_targets,
+        horizon_years=len(YEARS),
+    )
+
+
+def test_project_matches_each_agents_projection():
+    """``project`` gives every company the values of its own ``project_targets``."""
+    rng = random.Random(15)
+    agents = []
+    for index in range(200):
+        years = sorted(rng.sample(YEARS, rng.randint(1, len(YEARS))))
+        revenue = {year: rng.uniform(1e5, 1e7) for year in years}
+        # Every agent has a customer target in each year, so its horizon
+        # covers the same years as the portfolio.
+        agents.append(make_agent(index, revenue, {year: float(index + year) for year in YEARS}))
+    agents.append(make_agent(len(agents), {}, {year: 1.0 for year in YEARS}))
+
+    for periods_per_year in (1, 4, 12):
+        projected = PortfolioTargets.from_agents(agents).project("revenue", periods_per_year)
+        assert projected.shape == (len(agents), len(YEARS) * periods_per_year)
+        for row, agent in zip(projected, agents):
+            expected = [period.get("revenue", math.nan) for period in agent.project_targets(periods_per_year)]
+            np.testing.assert_allclose(row, expected, rtol=1e-12)
+
+
+def test_growth_rates_skip_missing_years():
+    """``cagr`` spans each company's own first and last target; ``yoy_growth`` needs both years."""
+    portfolio = PortfolioTargets.from_agents([
+        make_agent(0, {2025: 100.0, 2026: 110.0, 2027: 121.0, 2028: 133.1}),
+        make_agent(1, {2025: 100.0, 2027: 144.0}),
+        make_agent(2, {2026: 50.0, 2028: 200.0}),
+        make_agent(3, {2026: 100.0}),
+        make_agent(4, {2025: 0.0, 2026: 100.0}),
+    ])
+    assert portfolio.years.tolist() == [2025, 2026, 2027, 2028]
+
+    np.testing.assert_allclose(portfolio.cagr("revenue"), [0.1, 0.2, 1.0, math.nan, math.nan])
+    np.testing.assert_allclose(portfolio.yoy_growth("revenue"), [
+        [0.1, 0.1, 0.1],
+        [math.nan, math.nan, math.nan],
+        [math.nan, math.nan, math.nan],
+        [math.nan, math.nan, math.nan],
+        [math.nan, math.nan, math.nan],
+    ])
+    assert np.isnan(portfolio.cagr("ebitda")).all()
@@ -0,0 +1,80 @@
+"""Tests for ``revenue_simulation`` and the simulation settings of ``plan_service``."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import plan_service  # noqa: E402
+from plan_service import MAX_SIMULATION_DRAWS, MAX_SIMULATION_SAMPLES, PayloadError, parse_simulation  # noqa: E402
+from revenue_simulation import MoveProjection, draw_move_revenue, simulate_revenue  # noqa: E402
+
+MOVES = [
+    MoveProjection("Launch subscription", 100_000, 250_000, 400_000),
+    MoveProjection("Expand to Europe", 0, 50_000, 300_000),
+    MoveProjection("Raise prices", 80_000, 80_000, 80_000),
+]
+YEARS = [2025, 2026, 2027]
+TARGETS = [1_100_000, None, 1_500_000]
+
+
+def simulate(**kwargs):
+    return simulate_revenue(MOVES, YEARS, TARGETS, baseline_revenue=1_000_000, **{"draws": 20_000, **kwargs})
+
+
+def test_seeded_simulations_are_reproducible():
+    assert simulate(seed=7) == simulate(seed=7)
+    assert simulate(seed=7) != simulate(seed=8)
+    assert simulate(seed=7)["seed"] == 7
+
+
+def test_percentiles_are_ordered():
+    years = simulate(seed=7)["years"]
+    for year in years:
+        assert year["p10"] < year["p50"] < year["p90"]
+    for previous, year in zip(years, years[1:]):
+        for p in ("p10", "p50", "p90"):
+            assert previous[p] < year[p]
+    assert years[1]["probability_of_target"] is None
+    assert 0.0 <= years[2]["probability_of_target"] <= years[0]["probability_of_target"] <= 1.0
+
+
+def test_draws_sum_one_draw_per_move():
+    total = draw_move_revenue(MOVES, 50_000, np.random.default_rng(3))
+    assert total.shape == (50_000,)
+    assert total.min() >= 180_000 and total.max() <= 780_000
+    assert total.mean() == pytest.approx(80_000 + 250_000 + 350_000 / 3, rel=0.01)
+    assert (draw_move_revenue(MOVES[2:], 10) == 80_000).all()
+
+
+def payload(simulation, moves=1):
+    return {
+        "simulation": simulation,
+        "winning_moves": [{"description": f"move {index}", "projected_revenue": {"low": 1, "base": 2, "high": 3}}
+                          for index in range(moves)],
+    }
+
+
+def test_parse_simulation_limits():
+    assert parse_simulation(payload({"draws": MAX_SIMULATION_DRAWS, "seed": 0}))[:2] == (MAX_SIMULATION_DRAWS, 0)
+    samples_moves = MAX_SIMULATION_SAMPLES // 1000
+    assert parse_simulation(payload({"draws": 1000}, moves=samples_moves))[0] == 1000
+    for simulation, moves in (
+        ("yes", 1),
+        ({"draws": 0}, 1),
+        ({"draws": MAX_SIMULATION_DRAWS + 1}, 1),
+        ({"draws": 1.5}, 1),
+        ({"draws": True}, 1),
+        ({"seed": -1}, 1),
+        ({"seed": "7"}, 1),
+        ({"draws": 1001}, samples_moves),
+    ):
+        with pytest.raises(PayloadError):
+            parse_simulation(payload(simulation, moves))
+    with pytest.raises(PayloadError):
+        parse_simulation({"simulation": {}, "winning_moves": [{"projected_revenue": {"low": 3, "base": 2}}]})
+
+
+def test_parse_simulation_without_numpy(monkeypatch):
+    monkeypatch.setattr(plan_service, "revenue_simulation", None)
+    with pytest.raises(PayloadError, match="NumPy"):
+        parse_simulation(payload({}))
@@ -0,0 +1,74 @@
+"""Tests for ``scenario_sweep`` and the ``/scenario_sweep`` endpoint."""
+
+import pytest
+
+from agent_api import create_app
+from plan_service import evaluate_scenario
+from planning_agent import DEFAULT_HORIZON_YEARS
+from scenario_sweep import SweepRunner, parse_ranges, scenario_payload
+
+BASE = {
+    "company_name": "Acme",
+    "mission": "make widgets",
+    "vision": "widgets everywhere",
+    "core_values": ["Integrity"],
+    "baseline_metrics": {"annual_revenue": 1_000_000, "customers": 100},
+}
+
+
+def test_parse_ranges_expands_each_axis():
+    ranges = parse_ranges({
+        "revenue_growth": {"start": 0.1, "stop": 0.5, "step": 0.2},
+        "margin": [0.2, 0.3],
+    })
+    assert ranges == [("revenue_growth", [0.1, 0.3, 0.5]), ("margin", [0.2, 0.3])]
+    for bad in ({}, {"ebitda": [1]}, {"margin": []}, {"margin": [True]},
+                {"margin": {"start": 0.5, "stop": 0.1, "step": 0.1}}, {"margin": {"start": 0.1}}):
+        with pytest.raises(ValueError):
+            parse_ranges(bad)
+
+
+def test_scenario_payload_sets_every_year_of_the_horizon():
+    payload = scenario_payload(BASE, ("revenue_growth", "margin"), (0.1, 0.4))
+    assert list(payload["targets"]) == [f"year{year}" for year in range(1, DEFAULT_HORIZON_YEARS + 1)]
+    assert payload["targets"]["year2"] == {"revenue": 1_210_000, "margin": 0.4}
+    assert "targets" not in BASE
+
+    longer = scenario_payload({**BASE, "horizon_years": 5}, ("customer_growth",), (1.0,))
+    assert longer["targets"]["year5"] == {"customers": 3200}
+
+
+def test_run_evaluates_the_grid_in_order():
+    ranges = parse_ranges({"revenue_growth": [0.1, 0.2], "margin": [0.2, 0.3, 0.4]})
+    result = SweepRunner(max_workers=0).run(BASE, ranges, evaluate_scenario)
+    assert result["axes"] == ["revenue_growth", "margin"]
+    assert result["columns"][:3] == ["revenue_growth", "margin", "final_revenue"]
+    assert [row[:2] for row in result["rows"]] == [[g, m] for g in (0.1, 0.2) for m in (0.2, 0.3, 0.4)]
+    assert result["rows"][0][2] == round(1_000_000 * 1.1 ** DEFAULT_HORIZON_YEARS)
+
+
+def test_run_rejects_grids_over_the_cell_limit():
+    ranges = parse_ranges({"revenue_growth": [0.1, 0.2, 0.3], "margin": [0.2, 0.3]})
+    with pytest.raises(ValueError, match="6 scenarios; the limit is 5"):
+        SweepRunner(max_workers=0, max_cells=5).run(BASE, ranges, evaluate_scenario)
+    assert len(SweepRunner(max_workers=0, max_cells=6).run(BASE, ranges, evaluate_scenario)["rows"]) == 6
+
+
+def test_run_rejects_a_missing_baseline_once():
+    ranges = parse_ranges({"customer_growth": [0.1, 0.2]})
+    base = {**BASE, "baseline_metrics": {"annual_revenue": 1_000_000}}
+    with pytest.raises(ValueError, match="baseline_metrics.customers"):
+        SweepRunner(max_workers=0).run(base, ranges, evaluate_scenario)
+
+    client = create_app({"TESTING": True, "SWEEP_WORKERS": 0}).test_client()
+    response = client.post("/scenario_sweep", json={"base": base, "ranges": {"customer_growth": [0.1, 0.2]}})
+    assert response.status_code == 400
+    assert "baseline_metrics.customers" in response.get_json()["error"]
+
+
+def test_worker_pool_matches_inline_evaluation():
+    ranges = parse_ranges({"revenue_growth": {"start": 0.0, "stop": 0.9, "step": 0.1}, "margin": [0.2, 0.3]})
+    inline = SweepRunner(max_workers=0).run(BASE, ranges, evaluate_scenario)
+    pooled = SweepRunner(max_workers=2, inline_cells=0).run(BASE, ranges, evaluate_scenario)
+    assert pooled == inline
+    assert len(pooled["rows"]) == 20